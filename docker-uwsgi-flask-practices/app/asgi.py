@@ -0,0 +1,16 @@
+"""
+ASGI entrypoint, served by uvicorn as an alternative to uWSGI:
+
+    uvicorn app.asgi:application --host 0.0.0.0 --port 8000
+
+Flask itself is a WSGI framework, so every request still runs in a worker
+thread; a2wsgi provides that thread pool (ASGI_THREADS), while uvicorn's event
+loop keeps idle keep-alive connections and slow clients off those threads.
+Async views (e.g. /slow-io) run their awaits concurrently within the request.
+"""
+from a2wsgi import WSGIMiddleware
+
+from app.main import app
+from app.settings import get_settings
+
+application = WSGIMiddleware(app, workers=get_settings().asgi_threads)
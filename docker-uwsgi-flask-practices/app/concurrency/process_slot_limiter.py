@@ -0,0 +1,128 @@
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+import fasteners
+
+
+class SlotUnavailableError(Exception):
+    """
+    Raised when no slot could be acquired within the requested timeout.
+    """
+
+
+class ProcessSlotLimiter:
+    """
+    Limit the number of concurrent jobs across every process on the machine.
+
+    Each slot is a lock file guarded by ``fasteners.InterProcessLock``, so the
+    limit holds for all uWSGI workers regardless of how they were forked, and a
+    slot is released by the OS if its worker dies. File locks are owned by the
+    process, so every slot also has a ``threading.Lock`` to keep threads of the
+    same worker from sharing it.
+    """
+
+    def __init__(self, slots: int, lock_dir: str, name: str = "process"):
+        """
+        :param slots: Maximum number of concurrent holders across all processes.
+        :param lock_dir: Directory for the slot lock files, shared by all workers.
+        :param name: Prefix of the lock files, so several limiters can share a directory.
+        """
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        os.makedirs(lock_dir, exist_ok=True)
+        self.slots = slots
+        self._paths = [
+            os.path.join(lock_dir, f"{name}-slot-{i}.lock") for i in range(slots)
+        ]
+        self._thread_locks = [threading.Lock() for _ in range(slots)]
+        self._held: List[Optional[fasteners.InterProcessLock]] = [None] * slots
+
+    def try_acquire(self) -> Optional[int]:
+        """
+        Take a free slot without waiting.
+
+        :return: The slot index, or None when every slot is taken.
+        """
+        # Start at a random slot so waiting processes do not all pile onto slot 0.
+        offset = random.randrange(self.slots)
+        for step in range(self.slots):
+            index = (offset + step) % self.slots
+            if not self._thread_locks[index].acquire(blocking=False):
+                continue
+            process_lock = fasteners.InterProcessLock(self._paths[index])
+            if process_lock.acquire(blocking=False):
+                self._held[index] = process_lock
+                return index
+            self._thread_locks[index].release()
+        return None
+
+    def acquire(
+        self, timeout: Optional[float] = None, poll_interval: float = 0.01
+    ) -> Optional[int]:
+        """
+        Wait for a free slot.
+
+        :param timeout: Seconds to wait; None waits forever, 0 does not wait.
+        :param poll_interval: Base delay between attempts, randomized to spread waiters.
+        :return: The slot index, or None on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            index = self.try_acquire()
+            if index is not None:
+                return index
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval * random.uniform(0.5, 1.5))
+
+    def release(self, index: int) -> None:
+        """
+        Release a slot returned by ``acquire`` or ``try_acquire``.
+        """
+        process_lock = self._held[index]
+        if process_lock is None:
+            raise RuntimeError(f"Slot {index} is not held by this process")
+        self._held[index] = None
+        process_lock.release()
+        self._thread_locks[index].release()
+
+    @contextmanager
+    def slot(self, timeout: Optional[float] = 0) -> Iterator[int]:
+        """
+        Hold a slot for the duration of the ``with`` block.
+
+        :raises SlotUnavailableError: If no slot frees up within ``timeout``.
+        """
+        index = self.acquire(timeout=timeout)
+        if index is None:
+            raise SlotUnavailableError(f"All {self.slots} slots are busy")
+        try:
+            yield index
+        finally:
+            self.release(index)
+
+    def in_use(self) -> int:
+        """
+        Count the slots currently held by any process.
+
+        The probe briefly takes each free slot, so the number is a live snapshot
+        rather than an exact value under heavy contention.
+        """
+        busy = 0
+        for index, path in enumerate(self._paths):
+            if not self._thread_locks[index].acquire(blocking=False):
+                busy += 1
+                continue
+            try:
+                probe = fasteners.InterProcessLock(path)
+                if probe.acquire(blocking=False):
+                    probe.release()
+                else:
+                    busy += 1
+            finally:
+                self._thread_locks[index].release()
+        return busy
@@ -1,15 +1,123 @@
-import os
-from flask import Flask, jsonify
+import asyncio
+import math
+import time
+
+from flask import Flask, jsonify, request
+
+from app.concurrency.process_slot_limiter import ProcessSlotLimiter, SlotUnavailableError
+from app.repositories.factory import create_io_repository
+from app.services.dummy_service import DummyService
+from app.settings import Settings, get_settings, inject_settings, install_reload_handler
 
 app = Flask(__name__)
 
+# Loaded once at import (in the uWSGI master, before fork); see app/settings.py.
+install_reload_handler()
+
+# Shared by every uWSGI worker: at most PROCESS_SLOTS /process jobs run at once.
+# The slot files are fixed at startup; a settings reload does not resize them.
+process_limiter = ProcessSlotLimiter(
+    slots=get_settings().process_slots,
+    lock_dir=get_settings().process_lock_dir,
+)
+
+# Scratch-file backend chosen by IO_BACKEND (disk, buffered, memory or tmpfs).
+dummy_service = DummyService(create_io_repository(get_settings()))
+
+# Upper bounds for the /slow-io routes: one request must not pin a worker
+# (or the event loop) for long, nor build an unbounded number of coroutines.
+MAX_IO_DELAY = 5.0
+MAX_IO_CALLS = 1000
+# Largest /cpu-bound n: about half a second of GIL-holding work, far below the
+# shortest profile harakiri (15 s).
+MAX_CPU_N = 10_000_000
+
+async def wait_for_io(delay: float) -> float:
+    """
+    Stand-in for a call to a slow downstream service (database, HTTP API, ...).
+    """
+    await asyncio.sleep(delay)
+    return delay
+
+def io_args_error(delay: float, calls: int) -> str | None:
+    """
+    Why `delay` / `calls` are rejected, or None when they are usable.
+    """
+    if not (math.isfinite(delay) and 0 <= delay <= MAX_IO_DELAY):
+        return f"delay must be between 0 and {MAX_IO_DELAY} seconds"
+    if not 1 <= calls <= MAX_IO_CALLS:
+        return f"calls must be between 1 and {MAX_IO_CALLS}"
+    return None
+
 @app.route("/api", methods=["GET"])
-def index():
-    return jsonify(message="Hello from Flask + uWSGI + Nginx!", key=os.getenv("API_KEY"))
+@inject_settings
+def index(settings: Settings):
+    return jsonify(message="Hello from Flask + uWSGI + Nginx!", key=settings.api_key)
 
 @app.route("/some-other-api", methods=["GET"])
-def some_other():
-    return jsonify(message="Hello from Flask + uWSGI + Nginx!(some-other-api)", key=os.getenv("API_KEY"))
+@inject_settings
+def some_other(settings: Settings):
+    return jsonify(message="Hello from Flask + uWSGI + Nginx!(some-other-api)", key=settings.api_key)
+
+@app.route("/process", methods=["GET", "POST"])
+@inject_settings
+def process(settings: Settings):
+    try:
+        with process_limiter.slot(timeout=0) as slot:
+            # Simulate long-running task
+            time.sleep(settings.process_duration)
+            return jsonify(status="success", message="Processing complete", slot=slot)
+    except SlotUnavailableError:
+        return jsonify(status="busy", message="All processing slots are in use"), 429
+
+@app.route("/process/slots", methods=["GET"])
+def process_slots():
+    in_use = process_limiter.in_use()
+    return jsonify(slots=process_limiter.slots, in_use=in_use, available=process_limiter.slots - in_use)
+
+@app.route("/multiply/<int:number>", methods=["GET"])
+def multiply(number: int):
+    return jsonify(result=dummy_service.multiply_by_2(number))
+
+@app.route("/cpu-bound", methods=["GET"])
+def cpu_bound():
+    """
+    Pure-Python busy work holding the GIL, for comparing worker profiles.
+    `n` must be within [0, MAX_CPU_N].
+    """
+    n = request.args.get("n", 100_000, type=int)
+    if not 0 <= n <= MAX_CPU_N:
+        return jsonify(status="invalid", message=f"n must be between 0 and {MAX_CPU_N}"), 400
+    return jsonify(n=n, result=sum(i * i for i in range(n)))
+
+@app.route("/slow-io", methods=["GET"])
+async def slow_io():
+    """
+    Wait on `calls` slow I/O operations concurrently: total time is about one `delay`.
+    """
+    delay = request.args.get("delay", 0.1, type=float)
+    calls = request.args.get("calls", 1, type=int)
+    error = io_args_error(delay, calls)
+    if error:
+        return jsonify(status="invalid", message=error), 400
+    started = time.perf_counter()
+    await asyncio.gather(*(wait_for_io(delay) for _ in range(calls)))
+    return jsonify(calls=calls, delay=delay, elapsed=time.perf_counter() - started)
+
+@app.route("/slow-io-sync", methods=["GET"])
+def slow_io_sync():
+    """
+    Same work as /slow-io with blocking waits, one after another.
+    """
+    delay = request.args.get("delay", 0.1, type=float)
+    calls = request.args.get("calls", 1, type=int)
+    error = io_args_error(delay, calls)
+    if error:
+        return jsonify(status="invalid", message=error), 400
+    started = time.perf_counter()
+    for _ in range(calls):
+        time.sleep(delay)
+    return jsonify(calls=calls, delay=delay, elapsed=time.perf_counter() - started)
 
 if __name__ == "__main__":
-    app.run()
\ No newline at end of file
+    app.run()
@@ -0,0 +1,364 @@
+import asyncio
+import atexit
+import io
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from app.repositories.io_repository import DEFAULT_CHUNK_SIZE, IORepository
+from app.repositories.io_repository_impl import IORepositoryImpl
+
+FSYNC_NEVER = "never"
+FSYNC_ON_FLUSH = "on_flush"
+FSYNC_ALWAYS = "always"
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_ON_FLUSH, FSYNC_ALWAYS)
+
+_WRITE = "write"
+_DELETE = "delete"
+
+# (operation, data) queued for one path; data is None for deletes.
+_Op = Tuple[str, Optional[str]]
+
+
+class BufferFullError(Exception):
+    """
+    Raised when a non-blocking submit finds the write buffer full.
+    """
+
+
+class BufferedIORepositoryImpl(IORepository):
+    """
+    IORepository that hands writes and deletes to a background writer thread.
+
+    ``write`` and ``delete`` only record the operation and return; the writer
+    thread applies pending operations in batches. Only the latest operation per
+    path is kept, so a write followed by a delete of the same file (as
+    ``DummyService.multiply_by_2`` does) usually never touches the disk.
+    ``read`` sees pending operations first, so callers read their own writes.
+    Operations on different paths may reach the disk in any order.
+
+    The buffer holds at most ``max_pending`` paths and ``max_pending_bytes`` of
+    data; callers block (backpressure) while it is full. Errors raised by the
+    writer thread are re-raised by the next call.
+
+    The writer thread is started lazily and restarted after ``fork()``, so an
+    instance created in the uWSGI master works in every worker.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 1024,
+        max_pending_bytes: int = 16 * 1024 * 1024,
+        fsync: str = FSYNC_NEVER,
+    ):
+        """
+        :param max_pending: Maximum number of paths with a pending operation.
+        :param max_pending_bytes: Maximum total size of pending write data.
+        :param fsync: ``never``; ``on_flush`` to fsync files written since the last
+            ``flush()``/``close()``; or ``always`` to fsync every write.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.max_pending = max_pending
+        self.max_pending_bytes = max_pending_bytes
+        self.fsync = fsync
+        self._pid: Optional[int] = None
+        self._closed = False
+        # Reads of paths with nothing pending go straight to the disk.
+        self._disk = IORepositoryImpl()
+        atexit.register(self.close)
+
+    def _start(self) -> None:
+        # Called with no lock held; threads and locks do not survive fork(),
+        # so everything is (re)created per process.
+        self._cond = threading.Condition()
+        self._pending: Dict[str, _Op] = {}
+        self._pending_bytes = 0
+        self._inflight: Dict[str, _Op] = {}
+        self._unsynced: set = set()
+        self._error: Optional[BaseException] = None
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="io-writer", daemon=True)
+        self._pid = os.getpid()
+        self._thread.start()
+
+    def _ensure_started(self) -> None:
+        if self._pid != os.getpid():
+            self._start()
+
+    def _raise_error(self) -> None:
+        # Caller holds self._cond.
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _submit(self, file_path: str, op: _Op, block: bool = True, timeout: Optional[float] = None) -> None:
+        if self._closed:
+            raise RuntimeError("repository is closed")
+        self._ensure_started()
+        size = _size(op)
+        with self._cond:
+            self._raise_error()
+
+            def has_room() -> bool:
+                # An empty buffer always takes one operation, however large.
+                if not self._pending:
+                    return True
+                previous = self._pending.get(file_path)
+                paths = len(self._pending) + (previous is None)
+                pending_bytes = self._pending_bytes - _size(previous) + size
+                return paths <= self.max_pending and pending_bytes <= self.max_pending_bytes
+
+            if not has_room():
+                if not block:
+                    raise BufferFullError(f"write buffer is full ({len(self._pending)} pending)")
+                if not self._cond.wait_for(has_room, timeout):
+                    raise BufferFullError(f"write buffer stayed full for {timeout}s")
+
+            previous = self._pending.get(file_path)
+            self._pending_bytes += size - _size(previous)
+            self._pending[file_path] = op
+            self._cond.notify_all()
+
+    def _lookup(self, file_path: str) -> Optional[_Op]:
+        # Caller holds self._cond. Pending operations are newer than in-flight ones.
+        return self._pending.get(file_path) or self._inflight.get(file_path)
+
+    def read(self, file_path: str) -> str:
+        """
+        Read data from a file, including writes that are not on disk yet.
+
+        :param file_path: Path to the file to read.
+        :return: Contents of the file as a string.
+        """
+        data = self._pending_data(file_path)
+        if data is not None:
+            return data
+        return self._disk.read(file_path)
+
+    def read_chunks(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a file as bytes, including a write that is not on disk yet.
+
+        :param file_path: Path to the file to read.
+        :param chunk_size: Maximum size of each chunk in bytes.
+        :return: Iterator over the chunks, in order.
+        """
+        data = self._pending_data(file_path)
+        if data is None:
+            yield from self._disk.read_chunks(file_path, chunk_size)
+            return
+        encoded = data.encode()
+        for start in range(0, len(encoded), chunk_size):
+            yield encoded[start:start + chunk_size]
+
+    @contextmanager
+    def read_mmap(self, file_path: str) -> Iterator[memoryview]:
+        """
+        Map a file into memory, or view the pending write's bytes if there is one.
+
+        :param file_path: Path to the file to read.
+        :return: Context manager yielding a read-only memoryview of the contents.
+        """
+        data = self._pending_data(file_path)
+        if data is None:
+            with self._disk.read_mmap(file_path) as view:
+                yield view
+            return
+        view = memoryview(data.encode()).toreadonly()
+        try:
+            yield view
+        finally:
+            view.release()
+
+    def iter_lines(self, file_path: str) -> Iterator[str]:
+        """
+        Iterate over the lines of a text file, including a write that is not on disk yet.
+
+        :param file_path: Path to the file to read.
+        :return: Iterator over the lines.
+        """
+        data = self._pending_data(file_path)
+        if data is None:
+            yield from self._disk.iter_lines(file_path)
+            return
+        # newline=None translates line endings like reading the file would.
+        yield from io.StringIO(data, newline=None)
+
+    def _pending_data(self, file_path: str) -> Optional[str]:
+        """
+        Data of the pending write to ``file_path``, or None when it has to be read from disk.
+        """
+        self._ensure_started()
+        with self._cond:
+            self._raise_error()
+            op = self._lookup(file_path)
+        if op is None:
+            return None
+        if op[0] == _DELETE:
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+        return op[1]
+
+    def write(self, file_path: str, data: str) -> None:
+        """
+        Queue a write; it reaches the disk when the writer thread applies it.
+
+        :param file_path: Path to the file to write.
+        :param data: Data to write to the file.
+        """
+        self._submit(file_path, (_WRITE, data))
+
+    def delete(self, file_path: str) -> None:
+        """
+        Queue a delete of a file that exists on disk or has a pending write.
+
+        :param file_path: Path to the file to delete.
+        """
+        self._ensure_started()
+        with self._cond:
+            op = self._lookup(file_path)
+        exists = op[0] == _WRITE if op is not None else os.path.exists(file_path)
+        if not exists:
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+        self._submit(file_path, (_DELETE, None))
+
+    async def aread(self, file_path: str) -> str:
+        """
+        Async ``read``: pending data is returned directly, disk reads run in a thread.
+
+        :param file_path: Path to the file to read.
+        :return: Contents of the file as a string.
+        """
+        self._ensure_started()
+        with self._cond:
+            op = self._lookup(file_path)
+        if op is not None:
+            return self.read(file_path)
+        return await asyncio.to_thread(self.read, file_path)
+
+    async def awrite(self, file_path: str, data: str) -> None:
+        """
+        Async ``write``: returns at once unless the buffer is full.
+
+        :param file_path: Path to the file to write.
+        :param data: Data to write to the file.
+        """
+        try:
+            self._submit(file_path, (_WRITE, data), block=False)
+        except BufferFullError:
+            await asyncio.to_thread(self._submit, file_path, (_WRITE, data))
+
+    @property
+    def pending(self) -> int:
+        """Number of paths with an operation not yet applied."""
+        if self._pid != os.getpid():
+            return 0
+        with self._cond:
+            return len(self._pending) + len(self._inflight)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until every queued operation is on disk (and fsynced for ``on_flush``).
+
+        :param timeout: Seconds to wait before raising TimeoutError.
+        """
+        if self._pid != os.getpid():
+            return
+        with self._cond:
+            self._cond.notify_all()
+            done = self._cond.wait_for(lambda: not self._pending and not self._inflight, timeout)
+            self._raise_error()
+            if not done:
+                raise TimeoutError(f"{len(self._pending) + len(self._inflight)} operations still pending")
+            unsynced, self._unsynced = self._unsynced, set()
+        for file_path in unsynced:
+            _fsync_path(file_path)
+
+    async def aflush(self, timeout: Optional[float] = None) -> None:
+        await asyncio.to_thread(self.flush, timeout)
+
+    def close(self) -> None:
+        """
+        Flush and stop the writer thread. Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        if self._pid != os.getpid():
+            return
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._stopping = True
+                self._cond.notify_all()
+            self._thread.join()
+
+    def __enter__(self) -> "BufferedIORepositoryImpl":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._stopping)
+                if not self._pending:
+                    return
+                self._inflight, self._pending = self._pending, {}
+                self._pending_bytes = 0
+                # The buffer is free again; wake blocked writers.
+                self._cond.notify_all()
+                batch = self._inflight
+
+            written = set()
+            error = None
+            for file_path, (operation, data) in batch.items():
+                try:
+                    if operation == _WRITE:
+                        self._write_file(file_path, data)
+                        written.add(file_path)
+                    else:
+                        written.discard(file_path)
+                        try:
+                            os.remove(file_path)
+                        except FileNotFoundError:
+                            # The write it cancelled out never reached the disk.
+                            pass
+                except OSError as e:
+                    error = error or e
+
+            with self._cond:
+                self._inflight = {}
+                if self.fsync == FSYNC_ON_FLUSH:
+                    self._unsynced |= written
+                if error is not None and self._error is None:
+                    self._error = error
+                self._cond.notify_all()
+
+    def _write_file(self, file_path: str, data: str) -> None:
+        with open(file_path, 'w') as file:
+            file.write(data)
+            if self.fsync == FSYNC_ALWAYS:
+                file.flush()
+                os.fsync(file.fileno())
+
+
+def _size(op: Optional[_Op]) -> int:
+    return len(op[1] or "") if op else 0
+
+
+def _fsync_path(file_path: str) -> None:
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except FileNotFoundError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
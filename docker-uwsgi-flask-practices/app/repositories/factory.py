@@ -0,0 +1,34 @@
+from app.repositories.buffered_io_repository_impl import BufferedIORepositoryImpl
+from app.repositories.in_memory_io_repository_impl import InMemoryIORepositoryImpl
+from app.repositories.io_repository import IORepository
+from app.repositories.io_repository_impl import IORepositoryImpl
+from app.repositories.tmpfs_io_repository_impl import TmpfsIORepositoryImpl
+from app.settings import Settings
+
+IO_BACKENDS = ("disk", "buffered", "memory", "tmpfs")
+
+
+def create_io_repository(settings: Settings) -> IORepository:
+    """
+    Build the IORepository selected by ``settings.io_backend`` (IO_BACKEND).
+
+    :param settings: Settings snapshot to read the backend and its limits from.
+    :return: A new repository instance.
+    """
+    backend = settings.io_backend
+    if backend == "disk":
+        return IORepositoryImpl(atomic=settings.io_atomic, lock_dir=settings.io_lock_dir)
+    if backend == "buffered":
+        return BufferedIORepositoryImpl()
+    if backend == "memory":
+        return InMemoryIORepositoryImpl(
+            max_files=settings.io_memory_max_files,
+            max_bytes=settings.io_memory_max_bytes,
+        )
+    if backend == "tmpfs":
+        return TmpfsIORepositoryImpl(
+            root=settings.io_tmpfs_dir,
+            atomic=settings.io_atomic,
+            lock_dir=settings.io_lock_dir,
+        )
+    raise ValueError(f"IO_BACKEND must be one of {IO_BACKENDS}, not {backend!r}")
@@ -0,0 +1,135 @@
+import io
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+
+from app.repositories.io_repository import DEFAULT_CHUNK_SIZE, IORepository
+
+
+class InMemoryIORepositoryImpl(IORepository):
+    """
+    IORepository that keeps files as bytes in a dict and never touches the disk.
+
+    Meant for transient scratch files (written, maybe read, then deleted). The
+    store is bounded by ``max_files`` and ``max_bytes``; when a write would exceed
+    either, the least recently used files are evicted and later reads of them
+    raise FileNotFoundError, as if they had been deleted.
+
+    Contents live in the process that wrote them: each uWSGI worker has its own
+    store, so do not use this for files another worker has to see.
+    """
+
+    def __init__(self, max_files: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        :param max_files: Maximum number of files kept.
+        :param max_bytes: Maximum total size of the stored contents.
+        """
+        if max_files < 1 or max_bytes < 1:
+            raise ValueError("max_files and max_bytes must be at least 1")
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._files: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _get(self, file_path: str) -> bytes:
+        with self._lock:
+            try:
+                data = self._files[file_path]
+            except KeyError:
+                raise FileNotFoundError(f"The file {file_path} does not exist.") from None
+            self._files.move_to_end(file_path)
+            return data
+
+    def read(self, file_path: str) -> str:
+        """
+        Read data from a file.
+
+        :param file_path: Path to the file to read.
+        :return: Contents of the file as a string.
+        """
+        return self._get(file_path).decode()
+
+    def read_chunks(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a file as bytes.
+
+        :param file_path: Path to the file to read.
+        :param chunk_size: Maximum size of each chunk in bytes.
+        :return: Iterator over the chunks, in order.
+        """
+        data = self._get(file_path)
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+
+    @contextmanager
+    def read_mmap(self, file_path: str) -> Iterator[memoryview]:
+        """
+        Expose the stored bytes without copying.
+
+        :param file_path: Path to the file to read.
+        :return: Context manager yielding a read-only memoryview of the contents.
+        """
+        view = memoryview(self._get(file_path))
+        try:
+            yield view
+        finally:
+            view.release()
+
+    def iter_lines(self, file_path: str) -> Iterator[str]:
+        """
+        Iterate over the lines of a text file, keeping their line endings.
+
+        :param file_path: Path to the file to read.
+        :return: Iterator over the lines.
+        """
+        # newline=None translates line endings like reading a real file would.
+        yield from io.StringIO(self.read(file_path), newline=None)
+
+    def write(self, file_path: str, data: str) -> None:
+        """
+        Write data to a file, evicting least recently used files to make room.
+
+        :param file_path: Path to the file to write.
+        :param data: Data to write to the file.
+        """
+        encoded = data.encode()
+        if len(encoded) > self.max_bytes:
+            raise ValueError(f"{file_path}: {len(encoded)} bytes exceeds max_bytes={self.max_bytes}")
+        with self._lock:
+            previous = self._files.pop(file_path, None)
+            if previous is not None:
+                self._size -= len(previous)
+            while self._files and (
+                len(self._files) >= self.max_files or self._size + len(encoded) > self.max_bytes
+            ):
+                _, evicted = self._files.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+            self._files[file_path] = encoded
+            self._size += len(encoded)
+
+    def delete(self, file_path: str) -> None:
+        """
+        Delete a file.
+
+        :param file_path: Path to the file to delete.
+        """
+        with self._lock:
+            try:
+                data = self._files.pop(file_path)
+            except KeyError:
+                raise FileNotFoundError(f"The file {file_path} does not exist.") from None
+            self._size -= len(data)
+
+    @property
+    def size(self) -> int:
+        """Total size of the stored contents in bytes."""
+        with self._lock:
+            return self._size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._files)
@@ -1,4 +1,10 @@
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from typing import Iterator
+
+# Default size of the pieces returned by read_chunks.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
 
 class IORepository(ABC):
     """
@@ -15,6 +21,43 @@ class IORepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def read_chunks(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a file as bytes without loading all of it.
+
+        :param file_path: Path to the file to read.
+        :param chunk_size: Maximum size of each chunk in bytes.
+        :return: Iterator over the chunks, in order.
+        """
+        pass
+
+    @abstractmethod
+    def read_mmap(self, file_path: str) -> AbstractContextManager[memoryview]:
+        """
+        Map a file into memory and expose it without copying.
+
+        The view is released when the ``with`` block exits; copy what is needed
+        afterwards::
+
+            with repo.read_mmap("big.bin") as view:
+                header = bytes(view[:16])
+
+        :param file_path: Path to the file to read.
+        :return: Context manager yielding a read-only memoryview of the contents.
+        """
+        pass
+
+    @abstractmethod
+    def iter_lines(self, file_path: str) -> Iterator[str]:
+        """
+        Iterate over the lines of a text file, keeping their line endings.
+
+        :param file_path: Path to the file to read.
+        :return: Iterator over the lines.
+        """
+        pass
+
     @abstractmethod
     def write(self, file_path: str, data: str) -> None:
         """
@@ -32,4 +75,30 @@ class IORepository(ABC):
 
         :param file_path: Path to the file to delete.
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def aread(self, file_path: str) -> str:
+        """
+        Async ``read``; runs the blocking call in a worker thread unless overridden.
+
+        :param file_path: Path to the file to read.
+        :return: Contents of the file as a string.
+        """
+        return await asyncio.to_thread(self.read, file_path)
+
+    async def awrite(self, file_path: str, data: str) -> None:
+        """
+        Async ``write``; runs the blocking call in a worker thread unless overridden.
+
+        :param file_path: Path to the file to write.
+        :param data: Data to write to the file.
+        """
+        await asyncio.to_thread(self.write, file_path, data)
+
+    async def adelete(self, file_path: str) -> None:
+        """
+        Async ``delete``; runs the blocking call in a worker thread unless overridden.
+
+        :param file_path: Path to the file to delete.
+        """
+        await asyncio.to_thread(self.delete, file_path)
@@ -1,11 +1,82 @@
-from app.repositories.io_repository import IORepository
+import hashlib
+import mmap
+import os
+import threading
+import uuid
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator, Optional
+
+import fasteners
+
+from app.repositories.io_repository import DEFAULT_CHUNK_SIZE, IORepository
+
+# Number of locks (thread locks and lock files) the per-path locks are striped
+# over, so lock_dir never holds more than this many files.
+PATH_LOCK_STRIPES = 64
 
 class IORepositoryImpl(IORepository):
     """
     Implementation of the IORepository interface.
     This class provides concrete implementations for reading and writing files.
+
+    With ``atomic=True`` it is safe to share files between processes (uWSGI
+    workers): a write goes to a uniquely named temporary file next to the target
+    and is renamed over it with ``os.replace``, so readers see either the old or
+    the new contents and concurrent writers never collide; deleting a file that
+    is already gone is not an error. With ``lock_dir`` as well, writes and
+    deletes of the same path are serialized across processes by a
+    ``fasteners.InterProcessLock``, which ``lock()`` also exposes for
+    read-modify-write sequences. Paths are hashed onto ``PATH_LOCK_STRIPES``
+    lock files, so unrelated paths occasionally share a lock.
     """
 
+    def __init__(self, atomic: bool = False, lock_dir: Optional[str] = None):
+        """
+        :param atomic: Write through a temporary file and rename; make delete idempotent.
+        :param lock_dir: Directory for per-path lock files, shared by all processes.
+            Only used in atomic mode; None disables locking.
+        """
+        self.atomic = atomic
+        self.lock_dir = lock_dir if atomic else None
+        if self.lock_dir:
+            os.makedirs(self.lock_dir, exist_ok=True)
+        # File locks are owned by the process, so threads of one process also
+        # need a thread lock; paths share a fixed set of them.
+        self._thread_locks = [threading.Lock() for _ in range(PATH_LOCK_STRIPES)]
+        # Stripes the current thread holds, so write/delete inside lock() do not
+        # take them again (re-locking the file would release it on exit).
+        self._held = threading.local()
+
+    def lock(self, file_path: str) -> ContextManager[None]:
+        """
+        Hold the inter-process lock of ``file_path`` (a no-op without ``lock_dir``).
+
+        Reentrant within a thread, so ``write`` / ``delete`` of the path can be
+        called inside it. Locking a second path inside it can deadlock against
+        a thread that locks the two in the opposite order.
+
+        :param file_path: Path of the file to lock.
+        """
+        if not self.lock_dir:
+            return nullcontext()
+        return self._path_lock(file_path)
+
+    @contextmanager
+    def _path_lock(self, file_path: str) -> Iterator[None]:
+        key = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+        stripe = int(key[:8], 16) % PATH_LOCK_STRIPES
+        held = self._held.__dict__.setdefault("stripes", set())
+        if stripe in held:
+            yield
+            return
+        with self._thread_locks[stripe]:
+            with fasteners.InterProcessLock(os.path.join(self.lock_dir, f"stripe-{stripe}.lock")):
+                held.add(stripe)
+                try:
+                    yield
+                finally:
+                    held.discard(stripe)
+
     def read(self, file_path: str) -> str:
         """
         Read data from a file.
@@ -16,6 +87,54 @@ class IORepositoryImpl(IORepository):
         with open(file_path, 'r') as file:
             return file.read()
 
+    def read_chunks(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a file as bytes without loading all of it.
+
+        :param file_path: Path to the file to read.
+        :param chunk_size: Maximum size of each chunk in bytes.
+        :return: Iterator over the chunks, in order.
+        """
+        with open(file_path, 'rb') as file:
+            while chunk := file.read(chunk_size):
+                yield chunk
+
+    @contextmanager
+    def read_mmap(self, file_path: str) -> Iterator[memoryview]:
+        """
+        Map a file into memory and expose it without copying.
+
+        :param file_path: Path to the file to read.
+        :return: Context manager yielding a read-only memoryview of the contents.
+        """
+        with open(file_path, 'rb') as file:
+            # mmap cannot map an empty file.
+            if os.fstat(file.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+                try:
+                    mapped.close()
+                except BufferError:
+                    # The caller kept a slice of the view; the map is unmapped
+                    # once that slice is garbage collected.
+                    pass
+
+    def iter_lines(self, file_path: str) -> Iterator[str]:
+        """
+        Iterate over the lines of a text file, keeping their line endings.
+
+        :param file_path: Path to the file to read.
+        :return: Iterator over the lines.
+        """
+        with open(file_path, 'r') as file:
+            yield from file
+
     def write(self, file_path: str, data: str) -> None:
         """
         Write data to a file.
@@ -23,16 +142,39 @@ class IORepositoryImpl(IORepository):
         :param file_path: Path to the file to write.
         :param data: Data to write to the file.
         """
-        with open(file_path, 'w') as file:
-            file.write(data)
+        if not self.atomic:
+            with open(file_path, 'w') as file:
+                file.write(data)
+            return
+
+        directory, name = os.path.split(os.path.abspath(file_path))
+        # Same directory, so the rename stays on one filesystem and is atomic.
+        temp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+        with self.lock(file_path):
+            try:
+                with open(temp_path, 'x') as file:
+                    file.write(data)
+                os.replace(temp_path, file_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
 
     def delete(self, file_path: str) -> None:
         """
-        Delete a file.
+        Delete a file. In atomic mode a file that is already gone is ignored.
 
         :param file_path: Path to the file to delete.
         """
-        import os
+        if self.atomic:
+            with self.lock(file_path):
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    # Another worker deleted it first; the outcome is the same.
+                    pass
+            return
+
         if os.path.exists(file_path):
             os.remove(file_path)
         else:
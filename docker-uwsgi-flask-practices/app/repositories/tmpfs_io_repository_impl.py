@@ -0,0 +1,61 @@
+import os
+from contextlib import AbstractContextManager
+from typing import ContextManager, Iterator, Optional
+
+from app.repositories.io_repository import DEFAULT_CHUNK_SIZE
+from app.repositories.io_repository_impl import IORepositoryImpl
+
+DEFAULT_TMPFS_DIR = "/dev/shm/app-scratch"
+
+
+class TmpfsIORepositoryImpl(IORepositoryImpl):
+    """
+    IORepositoryImpl whose paths live under a directory on tmpfs (RAM-backed).
+
+    File operations still go through the kernel, but never reach a disk, and,
+    unlike InMemoryIORepositoryImpl, every process on the machine (all uWSGI
+    workers) sees the same files. Paths are resolved relative to ``root`` and may
+    not point outside it. In Docker, /dev/shm is 64 MB unless ``shm_size`` is set.
+    """
+
+    def __init__(self, root: str = DEFAULT_TMPFS_DIR, atomic: bool = False, lock_dir: Optional[str] = None):
+        """
+        :param root: Directory that holds the files, normally on tmpfs.
+        :param atomic: See IORepositoryImpl.
+        :param lock_dir: See IORepositoryImpl.
+        """
+        super().__init__(atomic=atomic, lock_dir=lock_dir)
+        os.makedirs(root, exist_ok=True)
+        self.root = os.path.realpath(root)
+
+    def resolve(self, file_path: str) -> str:
+        """
+        :param file_path: Path relative to ``root``.
+        :return: Absolute path of the file under ``root``.
+        """
+        # String-only normalisation; realpath() would cost an lstat per component.
+        path = os.path.normpath(os.path.join(self.root, file_path))
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f"{file_path} is outside {self.root}")
+        return path
+
+    def read(self, file_path: str) -> str:
+        return super().read(self.resolve(file_path))
+
+    def read_chunks(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        return super().read_chunks(self.resolve(file_path), chunk_size)
+
+    def read_mmap(self, file_path: str) -> AbstractContextManager[memoryview]:
+        return super().read_mmap(self.resolve(file_path))
+
+    def iter_lines(self, file_path: str) -> Iterator[str]:
+        return super().iter_lines(self.resolve(file_path))
+
+    def write(self, file_path: str, data: str) -> None:
+        super().write(self.resolve(file_path), data)
+
+    def delete(self, file_path: str) -> None:
+        super().delete(self.resolve(file_path))
+
+    def lock(self, file_path: str) -> ContextManager[None]:
+        return super().lock(self.resolve(file_path))
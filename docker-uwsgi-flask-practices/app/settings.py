@@ -0,0 +1,131 @@
+import functools
+import os
+import signal
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional
+
+# uWSGI signal number (0-255) used to reload the settings in every worker.
+UWSGI_RELOAD_SIGNAL = 17
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Immutable snapshot of the configuration, read once instead of on every request.
+
+    Reloading builds a new snapshot and swaps the reference, so a request always
+    sees one consistent set of values. Nothing here is tied to a process (no open
+    files, locks or threads), so a snapshot taken in the uWSGI master is safe to
+    use in every forked worker.
+    """
+
+    api_key: Optional[str] = None
+    process_slots: int = 2
+    process_lock_dir: str = "/tmp/process-slots"
+    process_duration: float = 5.0
+    asgi_threads: int = 64
+    io_backend: str = "disk"
+    io_memory_max_files: int = 1024
+    io_memory_max_bytes: int = 64 * 1024 * 1024
+    io_tmpfs_dir: str = "/dev/shm/app-scratch"
+    io_atomic: bool = False
+    io_lock_dir: Optional[str] = None
+
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, str]) -> "Settings":
+        """
+        :param values: Environment-style mapping, e.g. ``os.environ``.
+        """
+        return cls(
+            api_key=values.get("API_KEY"),
+            process_slots=int(values.get("PROCESS_SLOTS", cls.process_slots)),
+            process_lock_dir=values.get("PROCESS_LOCK_DIR", cls.process_lock_dir),
+            process_duration=float(values.get("PROCESS_DURATION", cls.process_duration)),
+            asgi_threads=int(values.get("ASGI_THREADS", cls.asgi_threads)),
+            io_backend=values.get("IO_BACKEND", cls.io_backend),
+            io_memory_max_files=int(values.get("IO_MEMORY_MAX_FILES", cls.io_memory_max_files)),
+            io_memory_max_bytes=int(values.get("IO_MEMORY_MAX_BYTES", cls.io_memory_max_bytes)),
+            io_tmpfs_dir=values.get("IO_TMPFS_DIR", cls.io_tmpfs_dir),
+            io_atomic=values.get("IO_ATOMIC", "0").lower() in ("1", "true", "yes"),
+            io_lock_dir=values.get("IO_LOCK_DIR") or None,
+        )
+
+
+def read_env_file(path: str) -> Dict[str, str]:
+    """
+    Parse ``KEY=VALUE`` lines, skipping blanks and ``#`` comments.
+    """
+    values = {}
+    with open(path) as env_file:
+        for line in env_file:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            values[key.strip()] = value.strip().strip("\"'")
+    return values
+
+
+def load_settings(environ: Optional[Mapping[str, str]] = None) -> Settings:
+    """
+    Build a snapshot from the process environment, overlaid with SETTINGS_ENV_FILE.
+
+    The file wins over the environment because it is the only source that can
+    change after the process started, which is what a reload is for.
+
+    :param environ: Mapping to read instead of ``os.environ``.
+    """
+    values = dict(os.environ if environ is None else environ)
+    env_file = values.get("SETTINGS_ENV_FILE")
+    if env_file and os.path.exists(env_file):
+        values.update(read_env_file(env_file))
+    return Settings.from_mapping(values)
+
+
+_settings = load_settings()
+
+
+def get_settings() -> Settings:
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """
+    Re-read the configuration and make it the current snapshot.
+    """
+    global _settings
+    _settings = load_settings()
+    return _settings
+
+
+def inject_settings(view: Callable) -> Callable:
+    """
+    Pass the current snapshot to ``view`` as the ``settings`` keyword argument.
+    """
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        return view(*args, settings=_settings, **kwargs)
+
+    return wrapper
+
+
+def install_reload_handler(signum: int = signal.SIGUSR1) -> None:
+    """
+    Reload the settings on a signal.
+
+    Under uWSGI the handler is registered as uWSGI signal UWSGI_RELOAD_SIGNAL for
+    all workers and raised whenever SETTINGS_ENV_FILE changes, so editing the file
+    refreshes every worker. Elsewhere (flask run, uvicorn) ``signum`` triggers a
+    reload of the receiving process. Must be called from the main thread.
+    """
+    try:
+        import uwsgi
+    except ImportError:
+        signal.signal(signum, lambda *_: reload_settings())
+        return
+
+    uwsgi.register_signal(UWSGI_RELOAD_SIGNAL, "workers", lambda _: reload_settings())
+    env_file = os.getenv("SETTINGS_ENV_FILE")
+    if env_file:
+        uwsgi.add_file_monitor(UWSGI_RELOAD_SIGNAL, env_file)
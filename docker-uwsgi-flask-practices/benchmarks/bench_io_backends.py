@@ -0,0 +1,69 @@
+"""
+Scratch-file workloads on every IO_BACKEND.
+
+    python benchmarks/bench_io_backends.py [--iterations 20000] [--size 1024]
+
+"write+delete" is DummyService.multiply_by_2; "write+read+delete" also reads
+the file back. Buffered timings include the final flush(); each cell is the
+best of --repeat runs.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.repositories.factory import IO_BACKENDS, create_io_repository  # noqa: E402
+from app.settings import Settings  # noqa: E402
+
+
+def write_delete(repo, path, data, iterations):
+    for _ in range(iterations):
+        repo.write(path, data)
+        repo.delete(path)
+
+
+def write_read_delete(repo, path, data, iterations):
+    for _ in range(iterations):
+        repo.write(path, data)
+        repo.read(path)
+        repo.delete(path)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--size", type=int, default=1024, help="bytes per scratch file")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per cell; the best is reported")
+    args = parser.parse_args()
+
+    data = "x" * args.size
+    workloads = {"write+delete": write_delete, "write+read+delete": write_read_delete}
+    print(f"{args.iterations} iterations, {args.size} byte files; us per iteration")
+    print(f"{'backend':<10}" + "".join(f"{name:>20}" for name in workloads))
+    for backend in IO_BACKENDS:
+        work_dir = tempfile.mkdtemp(prefix="bench-io-")
+        settings = Settings(io_backend=backend, io_tmpfs_dir=tempfile.mkdtemp(prefix="bench-io-", dir="/dev/shm"))
+        # Relative for tmpfs (resolved under its root), absolute elsewhere.
+        path = "scratch.txt" if backend == "tmpfs" else os.path.join(work_dir, "scratch.txt")
+        row = f"{backend:<10}"
+        for workload in workloads.values():
+            best = float("inf")
+            for _ in range(args.repeat):
+                repo = create_io_repository(settings)
+                started = time.perf_counter()
+                workload(repo, path, data, args.iterations)
+                if hasattr(repo, "close"):
+                    repo.close()
+                best = min(best, time.perf_counter() - started)
+            row += f"{best / args.iterations * 1e6:>17.2f} us"
+        print(row)
+        shutil.rmtree(work_dir)
+        shutil.rmtree(settings.io_tmpfs_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+DummyService.multiply_by_2 from several processes sharing one dummy.txt.
+
+    python benchmarks/bench_io_contention.py [--processes 1 4 8] [--seconds 3]
+
+Compares the default IORepositoryImpl (which fails when another process deletes
+the file first) with atomic mode, with and without per-path locks.
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.repositories.io_repository_impl import IORepositoryImpl  # noqa: E402
+from app.services.dummy_service import DummyService  # noqa: E402
+
+MODES = {
+    "default": {},
+    "atomic": {"atomic": True},
+    "atomic+locks": {"atomic": True, "lock_dir": "locks"},
+}
+
+
+def worker(work_dir, options, stop_at, calls, errors):
+    os.chdir(work_dir)
+    service = DummyService(IORepositoryImpl(**options))
+    ok = failed = 0
+    while time.time() < stop_at:
+        try:
+            service.multiply_by_2(1)
+            ok += 1
+        except OSError:
+            failed += 1
+    with calls.get_lock():
+        calls.value += ok
+    with errors.get_lock():
+        errors.value += failed
+
+
+def run(options, processes, seconds):
+    ctx = multiprocessing.get_context("fork")
+    work_dir = tempfile.mkdtemp(prefix="bench-contention-")
+    calls, errors = ctx.Value("l", 0), ctx.Value("l", 0)
+    stop_at = time.time() + seconds
+    workers = [ctx.Process(target=worker, args=(work_dir, options, stop_at, calls, errors)) for _ in range(processes)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+    shutil.rmtree(work_dir)
+    return calls.value / seconds, errors.value
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':<14} {'procs':>5} {'calls/s':>10} {'errors':>8}")
+    for name, options in MODES.items():
+        for processes in args.processes:
+            rate, errors = run(options, processes, args.seconds)
+            print(f"{name:<14} {processes:>5} {rate:>10.0f} {errors:>8}")
+
+
+if __name__ == "__main__":
+    main()
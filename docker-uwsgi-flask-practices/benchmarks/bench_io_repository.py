@@ -0,0 +1,76 @@
+"""
+IORepositoryImpl versus BufferedIORepositoryImpl on the request path.
+
+    python benchmarks/bench_io_repository.py [--iterations 20000]
+
+"write+delete" is what DummyService.multiply_by_2 does per call; "distinct
+writes" writes a different file each time. Buffered timings include the final
+flush(), so all work reaches the disk.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.repositories.buffered_io_repository_impl import BufferedIORepositoryImpl  # noqa: E402
+from app.repositories.io_repository_impl import IORepositoryImpl  # noqa: E402
+
+
+def write_delete(repo, directory, iterations):
+    path = os.path.join(directory, "dummy.txt")
+    for _ in range(iterations):
+        repo.write(path, "Dummy data written to file.")
+        repo.delete(path)
+
+
+def distinct_writes(repo, directory, iterations):
+    for i in range(iterations):
+        repo.write(os.path.join(directory, f"file-{i % 1000}.txt"), f"payload {i}")
+
+
+def measure(make_repo, workload, iterations):
+    directory = tempfile.mkdtemp(prefix="bench-io-")
+    repo = make_repo()
+    try:
+        started = time.perf_counter()
+        workload(repo, directory, iterations)
+        request_path = time.perf_counter() - started
+        if hasattr(repo, "flush"):
+            repo.flush()
+        total = time.perf_counter() - started
+    finally:
+        if hasattr(repo, "close"):
+            repo.close()
+        shutil.rmtree(directory)
+    return request_path, total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    repos = {
+        "IORepositoryImpl": IORepositoryImpl,
+        "Buffered (fsync=never)": BufferedIORepositoryImpl,
+        "Buffered (fsync=on_flush)": lambda: BufferedIORepositoryImpl(fsync="on_flush"),
+    }
+    workloads = {"write+delete": write_delete, "distinct writes": distinct_writes}
+
+    print(f"{args.iterations} iterations; us per call on the request path / including flush")
+    for workload_name, workload in workloads.items():
+        print(workload_name)
+        for repo_name, make_repo in repos.items():
+            request_path, total = measure(make_repo, workload, args.iterations)
+            print(
+                f"  {repo_name:<28} {request_path / args.iterations * 1e6:8.2f} us"
+                f" {total / args.iterations * 1e6:8.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
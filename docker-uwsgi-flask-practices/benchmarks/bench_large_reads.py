@@ -0,0 +1,81 @@
+"""
+Time and peak memory of read() versus the streaming IORepository reads on a large file.
+
+    python benchmarks/bench_large_reads.py [--size-mb 512] [--path /tmp/large.txt]
+
+Each mode runs in a fresh interpreter so its peak RSS is measured on its own.
+Every mode hashes the whole file (and iter_lines counts lines), so the work is
+comparable.
+"""
+import argparse
+import hashlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.repositories.io_repository_impl import IORepositoryImpl  # noqa: E402
+
+MODES = ["read", "read_chunks", "read_mmap", "iter_lines"]
+LINE = "0123456789abcdef" * 4 + "\n"
+
+
+def make_file(path, size_mb):
+    if os.path.exists(path) and os.path.getsize(path) >= size_mb * 1024 * 1024:
+        return
+    block = LINE * (1024 * 1024 // len(LINE))
+    with open(path, "w") as file:
+        for _ in range(size_mb):
+            file.write(block)
+
+
+def run_mode(mode, path):
+    repo = IORepositoryImpl()
+    sha = hashlib.sha256()
+    started = time.perf_counter()
+    if mode == "read":
+        sha.update(repo.read(path).encode())
+    elif mode == "read_chunks":
+        for chunk in repo.read_chunks(path):
+            sha.update(chunk)
+    elif mode == "read_mmap":
+        with repo.read_mmap(path) as view:
+            sha.update(view)
+    else:
+        lines = sum(1 for _ in repo.iter_lines(path))
+        sha.update(str(lines).encode())
+    elapsed = time.perf_counter() - started
+    # ru_maxrss is in KiB on Linux.
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {"mode": mode, "seconds": elapsed, "peak_rss_mb": peak_mb}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--path", default="/tmp/io-repository-large.txt")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.path)))
+        return
+
+    make_file(args.path, args.size_mb)
+    print(f"{args.path}: {os.path.getsize(args.path) / 1024 / 1024:.0f} MB")
+    print(f"{'mode':<12} {'seconds':>8} {'peak RSS MB':>12}")
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, __file__, "--path", args.path, "--mode", mode],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output)
+        print(f"{mode:<12} {result['seconds']:>8.2f} {result['peak_rss_mb']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Load-test every uWSGI profile in the container, one after another.
+
+For each profile the stack is recreated with UWSGI_PROFILE set, then every
+endpoint is driven at each concurrency level with loadtest.run_level. Results
+are appended to a JSON lines file and summarized as a table at the end.
+
+    python benchmarks/bench_profiles.py --duration 20 --output profiles.jsonl
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from loadtest import run_level  # noqa: E402
+
+PROJECT_DIR = os.path.join(os.path.dirname(__file__), "..")
+PROFILES = ["default", "cpu-bound", "io-bound", "high-concurrency"]
+ENDPOINTS = {
+    "api": "/api",
+    "cpu": "/cpu-bound?n=200000",
+    "io": "/slow-io-sync?delay=0.05&calls=2",
+}
+
+
+def compose(*args, profile):
+    env = {**os.environ, "UWSGI_PROFILE": profile, "SERVER_MODE": "wsgi"}
+    subprocess.run(["docker-compose", *args], cwd=PROJECT_DIR, env=env, check=True)
+
+
+def wait_until_up(base_url, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/api", timeout=2):
+                return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError(f"{base_url} did not come up within {timeout}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost")
+    parser.add_argument("--profiles", nargs="+", default=PROFILES, choices=PROFILES)
+    parser.add_argument("--endpoints", nargs="+", default=list(ENDPOINTS), choices=list(ENDPOINTS))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--output", default="profiles.jsonl")
+    args = parser.parse_args()
+
+    results = []
+    try:
+        for profile in args.profiles:
+            compose("up", "-d", "--build", "--force-recreate", profile=profile)
+            wait_until_up(args.base_url)
+            for endpoint in args.endpoints:
+                for concurrency in args.concurrency:
+                    result = run_level(f"{args.base_url}{ENDPOINTS[endpoint]}", concurrency, args.duration)
+                    result.update(label=profile, endpoint=endpoint)
+                    results.append(result)
+                    with open(args.output, "a") as output:
+                        output.write(json.dumps(result) + "\n")
+                    print(
+                        f"{profile:<17} {endpoint:<4} c={concurrency:<4} {result['rps']:9.1f} req/s "
+                        f"p50={result['p50_ms']:.1f} p95={result['p95_ms']:.1f} p99={result['p99_ms']:.1f} ms "
+                        f"errors={result['errors']}"
+                    )
+    finally:
+        compose("down", profile=args.profiles[0])
+
+    print()
+    print(f"{'profile':<17} {'endpoint':<8} {'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for result in results:
+        print(
+            f"{result['label']:<17} {result['endpoint']:<8} {result['concurrency']:>5} {result['rps']:>9.1f} "
+            f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Per-request cost of reading configuration with os.getenv versus the settings snapshot.
+
+    python benchmarks/bench_settings.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("API_KEY", "bench_api_key")
+os.environ.setdefault("PROCESS_LOCK_DIR", "/tmp/process-slots-bench")
+
+from flask import jsonify  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.settings import get_settings, inject_settings  # noqa: E402
+
+NUMBER = 200_000
+REQUESTS = 5_000
+
+
+def per_call(stmt, globals_, number):
+    return min(timeit.repeat(stmt, globals=globals_, number=number, repeat=5)) / number * 1e9
+
+
+@app.route("/bench-getenv")
+def bench_getenv():
+    return jsonify(
+        key=os.getenv("API_KEY"),
+        slots=int(os.getenv("PROCESS_SLOTS", "2")),
+        duration=float(os.getenv("PROCESS_DURATION", "5")),
+    )
+
+
+@app.route("/bench-snapshot")
+@inject_settings
+def bench_snapshot(settings):
+    return jsonify(key=settings.api_key, slots=settings.process_slots, duration=settings.process_duration)
+
+
+def main():
+    lookups = {
+        "os.getenv + parse (3 values)": (
+            'os.getenv("API_KEY"); int(os.getenv("PROCESS_SLOTS", "2")); '
+            'float(os.getenv("PROCESS_DURATION", "5"))'
+        ),
+        "snapshot attributes (3 values)": "s = get_settings(); s.api_key; s.process_slots; s.process_duration",
+    }
+    print("lookup only:")
+    for name, stmt in lookups.items():
+        print(f"  {name:<32} {per_call(stmt, {'os': os, 'get_settings': get_settings}, NUMBER):8.0f} ns")
+
+    client = app.test_client()
+    print(f"through the test client ({REQUESTS} requests):")
+    for path in ("/bench-getenv", "/bench-snapshot"):
+        stmt = f"client.get({path!r})"
+        print(f"  {path:<32} {per_call(stmt, {'client': client}, REQUESTS) / 1000:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
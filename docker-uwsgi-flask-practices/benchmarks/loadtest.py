@@ -0,0 +1,110 @@
+"""
+Minimal closed-loop HTTP load tester (stdlib only).
+
+Each of `concurrency` threads keeps one keep-alive connection and sends
+requests back to back for `duration` seconds. Prints requests per second and
+latency percentiles per concurrency level, and optionally appends them as JSON
+lines to a results file.
+
+    python benchmarks/loadtest.py http://localhost/api --concurrency 1 8 32 --duration 10
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _worker(url, stop_at, latencies, errors, lock):
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    connection = connection_class(parts.netloc, timeout=60)
+
+    local_latencies = []
+    local_errors = 0
+    while time.perf_counter() < stop_at:
+        started = time.perf_counter()
+        try:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                local_errors += 1
+            else:
+                local_latencies.append(time.perf_counter() - started)
+        except (OSError, http.client.HTTPException):
+            local_errors += 1
+            connection.close()
+            connection = connection_class(parts.netloc, timeout=60)
+    connection.close()
+
+    with lock:
+        latencies.extend(local_latencies)
+        errors.append(local_errors)
+
+
+def run_level(url, concurrency, duration):
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=_worker, args=(url, stop_at, latencies, errors, lock))
+        for _ in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("url")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--label", default="", help="Stored with each result, e.g. a profile name.")
+    parser.add_argument("--output", help="Append results as JSON lines to this file.")
+    args = parser.parse_args()
+
+    print(f"{args.url} {args.label}".rstrip())
+    print(f"{'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for concurrency in args.concurrency:
+        result = run_level(args.url, concurrency, args.duration)
+        result["label"] = args.label
+        print(
+            f"{concurrency:>5} {result['rps']:>9.1f} {result['p50_ms']:>8.1f} "
+            f"{result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['errors']:>7}"
+        )
+        if args.output:
+            with open(args.output, "a") as output:
+                output.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
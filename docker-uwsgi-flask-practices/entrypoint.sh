@@ -1,6 +1,25 @@
 #!/bin/bash
-# Start uWSGI in background
-uwsgi --ini uwsgi.ini &
+# SERVER_MODE=wsgi (default): uWSGI behind Nginx's uwsgi_pass.
+# SERVER_MODE=asgi: uvicorn behind Nginx's proxy_pass.
+# UWSGI_PROFILE=default|cpu-bound|io-bound|high-concurrency picks the uWSGI
+# section in app/uwsgi.ini and the matching Nginx buffers in nginx-profiles/.
+PROFILE="${UWSGI_PROFILE:-default}"
+if [ ! -f "/etc/nginx/profiles/${PROFILE}.conf" ]; then
+    echo "Unknown UWSGI_PROFILE: ${PROFILE}" >&2
+    exit 1
+fi
+cp "/etc/nginx/profiles/${PROFILE}.conf" /etc/nginx/profile.conf
+
+if [ "${SERVER_MODE:-wsgi}" = "asgi" ]; then
+    cp /etc/nginx/nginx-asgi.conf /etc/nginx/nginx.conf
+    # Start uvicorn in background
+    uvicorn app.asgi:application --uds /tmp/uvicorn.sock --workers "${ASGI_WORKERS:-4}" --proxy-headers &
+else
+    SECTION="${PROFILE}"
+    [ "${PROFILE}" = "default" ] && SECTION="uwsgi"
+    # Start uWSGI in background
+    uwsgi --ini "app/uwsgi.ini:${SECTION}" &
+fi
 
 # Start Nginx in foreground
 nginx -g "daemon off;"
@@ -14,4 +14,4 @@ for file in ./envs/*.env; do
   fi
 done
 
-poetry run python app/main.py
\ No newline at end of file
+poetry run python -m app.main
\ No newline at end of file
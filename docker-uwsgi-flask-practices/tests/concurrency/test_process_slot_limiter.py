@@ -0,0 +1,129 @@
+import multiprocessing
+import time
+
+import pytest
+
+from app.concurrency.process_slot_limiter import ProcessSlotLimiter, SlotUnavailableError
+
+SLOTS = 2
+WORKERS = 4
+HOLD_SECONDS = 0.05
+RUN_SECONDS = 1.5
+
+
+def _worker(lock_dir, active, peak, completed, worker_id, stop_at):
+    """
+    Repeatedly take a slot, hold it for HOLD_SECONDS and record the peak number
+    of concurrent holders seen across all processes.
+    """
+    limiter = ProcessSlotLimiter(slots=SLOTS, lock_dir=lock_dir)
+    while time.time() < stop_at:
+        index = limiter.acquire(timeout=stop_at - time.time())
+        if index is None:
+            break
+        try:
+            with active.get_lock():
+                active.value += 1
+                peak.value = max(peak.value, active.value)
+            time.sleep(HOLD_SECONDS)
+            with active.get_lock():
+                active.value -= 1
+        finally:
+            limiter.release(index)
+        completed[worker_id] += 1
+        # Think time between jobs, like a worker serving its next request.
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    return ProcessSlotLimiter(slots=SLOTS, lock_dir=str(tmp_path))
+
+
+def test_try_acquire_until_exhausted(limiter):
+    """
+    Each slot can be taken once; further attempts fail until one is released.
+    """
+    first = limiter.try_acquire()
+    second = limiter.try_acquire()
+
+    assert {first, second} == {0, 1}
+    assert limiter.try_acquire() is None
+    assert limiter.in_use() == 2
+
+    limiter.release(first)
+
+    assert limiter.in_use() == 1
+    assert limiter.try_acquire() == first
+
+
+def test_slot_context_manager_raises_when_busy(limiter):
+    """
+    slot() raises SlotUnavailableError when nothing frees up within the timeout.
+    """
+    with limiter.slot():
+        with limiter.slot():
+            with pytest.raises(SlotUnavailableError):
+                with limiter.slot(timeout=0.05):
+                    pass
+    assert limiter.in_use() == 0
+
+
+def test_release_unheld_slot_raises(limiter):
+    with pytest.raises(RuntimeError):
+        limiter.release(0)
+
+
+def test_slots_are_shared_across_processes(tmp_path):
+    """
+    A slot held by another process counts as in use and cannot be taken.
+    """
+    ctx = multiprocessing.get_context("fork")
+    ready = ctx.Event()
+    done = ctx.Event()
+
+    def hold_slot():
+        other = ProcessSlotLimiter(slots=SLOTS, lock_dir=str(tmp_path))
+        other.try_acquire()
+        ready.set()
+        done.wait(5)
+
+    process = ctx.Process(target=hold_slot)
+    process.start()
+    try:
+        assert ready.wait(5)
+        limiter = ProcessSlotLimiter(slots=SLOTS, lock_dir=str(tmp_path))
+        assert limiter.in_use() == 1
+        assert limiter.try_acquire() is not None
+        assert limiter.try_acquire() is None
+    finally:
+        done.set()
+        process.join(5)
+
+
+def test_multi_process_limit_fairness_and_throughput(tmp_path):
+    """
+    Under contention from several processes the limit is never exceeded, every
+    process gets a fair share of the slots and the slots stay busy.
+    """
+    ctx = multiprocessing.get_context("fork")
+    active = ctx.Value("i", 0)
+    peak = ctx.Value("i", 0)
+    completed = ctx.Array("i", WORKERS)
+    stop_at = time.time() + RUN_SECONDS
+
+    processes = [
+        ctx.Process(target=_worker, args=(str(tmp_path), active, peak, completed, i, stop_at))
+        for i in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(RUN_SECONDS + 5)
+
+    counts = list(completed)
+    ideal = SLOTS * RUN_SECONDS / HOLD_SECONDS
+
+    assert peak.value == SLOTS
+    assert min(counts) >= 0.5 * (sum(counts) / WORKERS), counts
+    assert sum(counts) >= 0.6 * ideal, counts
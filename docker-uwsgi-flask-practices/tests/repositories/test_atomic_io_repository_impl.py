@@ -0,0 +1,197 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from app.repositories import io_repository_impl
+from app.repositories.factory import create_io_repository
+from app.repositories.io_repository_impl import PATH_LOCK_STRIPES, IORepositoryImpl
+from app.services.dummy_service import DummyService
+from app.settings import Settings
+
+WORKERS = 4
+ITERATIONS = 300
+PAYLOAD_SIZE = 256 * 1024
+
+
+def _multiply_worker(work_dir, lock_dir, errors, completed):
+    """
+    Run DummyService.multiply_by_2 in a loop, like a uWSGI worker serving requests.
+    """
+    os.chdir(work_dir)
+    service = DummyService(IORepositoryImpl(atomic=True, lock_dir=lock_dir))
+    for _ in range(ITERATIONS):
+        try:
+            service.multiply_by_2(1)
+            with completed.get_lock():
+                completed.value += 1
+        except Exception:
+            with errors.get_lock():
+                errors.value += 1
+
+
+def _overwrite_worker(path, letter, stop_at):
+    repo = IORepositoryImpl(atomic=True)
+    while time.time() < stop_at:
+        repo.write(path, letter * PAYLOAD_SIZE)
+
+
+def _read_worker(path, stop_at, torn, reads):
+    repo = IORepositoryImpl()
+    while time.time() < stop_at:
+        try:
+            data = repo.read(path)
+        except FileNotFoundError:
+            continue
+        with reads.get_lock():
+            reads.value += 1
+        if len(data) != PAYLOAD_SIZE or len(set(data)) != 1:
+            with torn.get_lock():
+                torn.value += 1
+
+
+def test_atomic_write_leaves_no_temp_files(tmp_path):
+    repo = IORepositoryImpl(atomic=True)
+    path = tmp_path / "a.txt"
+
+    repo.write(str(path), "first")
+    repo.write(str(path), "second")
+
+    assert path.read_text() == "second"
+    assert os.listdir(tmp_path) == ["a.txt"]
+
+
+def test_failed_atomic_write_keeps_old_contents(tmp_path, monkeypatch):
+    repo = IORepositoryImpl(atomic=True)
+    path = tmp_path / "a.txt"
+    repo.write(str(path), "old")
+
+    def failing_replace(src, dst):
+        raise OSError("rename failed")
+
+    monkeypatch.setattr(io_repository_impl.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        repo.write(str(path), "new")
+
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["a.txt"]
+
+
+def test_atomic_delete_is_idempotent(tmp_path):
+    path = str(tmp_path / "a.txt")
+    IORepositoryImpl(atomic=True).delete(path)
+
+    with pytest.raises(FileNotFoundError):
+        IORepositoryImpl().delete(path)
+
+
+def test_lock_serializes_read_modify_write(tmp_path):
+    repo = IORepositoryImpl(atomic=True, lock_dir=str(tmp_path / "locks"))
+    path = str(tmp_path / "counter.txt")
+    repo.write(path, "0")
+
+    def increment():
+        for _ in range(50):
+            with repo.lock(path):
+                value = int(repo.read(path))
+                repo.write(path, str(value + 1))
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert repo.read(path) == "200"
+
+
+def _locked_increment(path, lock_dir, iterations):
+    repo = IORepositoryImpl(atomic=True, lock_dir=lock_dir)
+    for _ in range(iterations):
+        with repo.lock(path):
+            repo.write(path, str(int(repo.read(path)) + 1))
+
+
+def test_read_modify_write_inside_lock_across_processes(tmp_path):
+    path = str(tmp_path / "counter.txt")
+    lock_dir = str(tmp_path / "locks")
+    IORepositoryImpl(atomic=True).write(path, "0")
+
+    ctx = multiprocessing.get_context("fork")
+    processes = [ctx.Process(target=_locked_increment, args=(path, lock_dir, 100)) for _ in range(WORKERS)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+
+    assert IORepositoryImpl().read(path) == str(WORKERS * 100)
+
+
+def test_delete_inside_lock(tmp_path):
+    repo = IORepositoryImpl(atomic=True, lock_dir=str(tmp_path / "locks"))
+    path = str(tmp_path / "a.txt")
+    repo.write(path, "data")
+
+    with repo.lock(path):
+        repo.delete(path)
+        repo.write(path, "again")
+
+    assert repo.read(path) == "again"
+
+
+def test_lock_files_are_bounded(tmp_path):
+    repo = IORepositoryImpl(atomic=True, lock_dir=str(tmp_path / "locks"))
+    for index in range(PATH_LOCK_STRIPES * 4):
+        repo.write(str(tmp_path / f"{index}.txt"), "data")
+
+    assert len(os.listdir(tmp_path / "locks")) <= PATH_LOCK_STRIPES
+
+
+def test_factory_passes_atomic_settings(tmp_path):
+    repo = create_io_repository(Settings(io_atomic=True, io_lock_dir=str(tmp_path / "locks")))
+    assert repo.atomic
+    assert repo.lock_dir == str(tmp_path / "locks")
+    assert not create_io_repository(Settings(io_lock_dir=str(tmp_path))).atomic
+
+
+def test_concurrent_multiply_across_processes(tmp_path):
+    """
+    WORKERS processes write and delete the same dummy.txt without any errors.
+    """
+    ctx = multiprocessing.get_context("fork")
+    errors = ctx.Value("i", 0)
+    completed = ctx.Value("i", 0)
+    processes = [
+        ctx.Process(target=_multiply_worker, args=(str(tmp_path), str(tmp_path / "locks"), errors, completed))
+        for _ in range(WORKERS)
+    ]
+
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+
+    assert errors.value == 0
+    assert completed.value == WORKERS * ITERATIONS
+    assert sorted(os.listdir(tmp_path)) == ["locks"]
+
+
+def test_readers_never_see_partial_writes(tmp_path):
+    ctx = multiprocessing.get_context("fork")
+    path = str(tmp_path / "shared.txt")
+    IORepositoryImpl(atomic=True).write(path, "a" * PAYLOAD_SIZE)
+
+    stop_at = time.time() + 1.0
+    torn = ctx.Value("i", 0)
+    reads = ctx.Value("i", 0)
+    processes = [ctx.Process(target=_overwrite_worker, args=(path, letter, stop_at)) for letter in "ab"]
+    processes += [ctx.Process(target=_read_worker, args=(path, stop_at, torn, reads)) for _ in range(2)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+
+    assert reads.value > 0
+    assert torn.value == 0
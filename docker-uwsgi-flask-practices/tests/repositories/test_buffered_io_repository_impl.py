@@ -0,0 +1,183 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from app.repositories import buffered_io_repository_impl as buffered
+from app.repositories.buffered_io_repository_impl import BufferedIORepositoryImpl
+from app.services.dummy_service import DummyService
+
+
+@pytest.fixture
+def repo():
+    repository = BufferedIORepositoryImpl()
+    yield repository
+    repository.close()
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail(f"condition not met within {timeout}s")
+        time.sleep(0.001)
+
+
+def _write_in_child(repository, path, result):
+    repository.write(path, "from child")
+    repository.flush()
+    result.value = 1
+
+
+def test_read_sees_pending_write_and_flush_persists(repo, tmp_path):
+    path = str(tmp_path / "a.txt")
+    repo.write(path, "hello")
+
+    assert repo.read(path) == "hello"
+    repo.flush()
+    assert repo.pending == 0
+    with open(path) as file:
+        assert file.read() == "hello"
+
+
+def test_write_then_delete_leaves_no_file(repo, tmp_path):
+    path = str(tmp_path / "dummy.txt")
+
+    for _ in range(100):
+        repo.write(path, "data")
+        repo.delete(path)
+    repo.flush()
+
+    assert not os.path.exists(path)
+    with pytest.raises(FileNotFoundError):
+        repo.read(path)
+
+
+def test_delete_existing_file(repo, tmp_path):
+    path = tmp_path / "existing.txt"
+    path.write_text("old")
+
+    repo.delete(str(path))
+    with pytest.raises(FileNotFoundError):
+        repo.read(str(path))
+    repo.flush()
+    assert not path.exists()
+
+
+def test_delete_missing_file_raises(repo, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        repo.delete(str(tmp_path / "missing.txt"))
+
+
+def test_writer_error_is_raised_by_flush(repo, tmp_path):
+    repo.write(str(tmp_path / "no-such-dir" / "a.txt"), "data")
+    with pytest.raises(FileNotFoundError):
+        repo.flush()
+
+
+def test_write_blocks_while_buffer_is_full(tmp_path, monkeypatch):
+    release = threading.Event()
+    original = BufferedIORepositoryImpl._write_file
+
+    def slow_write_file(self, file_path, data):
+        release.wait()
+        original(self, file_path, data)
+
+    monkeypatch.setattr(BufferedIORepositoryImpl, "_write_file", slow_write_file)
+    repo = BufferedIORepositoryImpl(max_pending=1)
+    try:
+        repo.write(str(tmp_path / "a.txt"), "a")  # taken by the writer thread
+        _wait_until(lambda: repo._inflight != {})
+        repo.write(str(tmp_path / "b.txt"), "b")  # fills the buffer
+
+        blocked = threading.Thread(target=repo.write, args=(str(tmp_path / "c.txt"), "c"))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join(timeout=5)
+        assert not blocked.is_alive()
+        repo.flush()
+        assert sorted(os.listdir(tmp_path)) == ["a.txt", "b.txt", "c.txt"]
+    finally:
+        release.set()
+        repo.close()
+
+
+@pytest.mark.parametrize(
+    "policy, during_writes, on_flush",
+    [("never", 0, 0), ("always", 3, 0), ("on_flush", 0, 3)],
+)
+def test_fsync_policy(tmp_path, monkeypatch, policy, during_writes, on_flush):
+    calls = []
+    monkeypatch.setattr(buffered.os, "fsync", lambda fd: calls.append(fd))
+    repo = BufferedIORepositoryImpl(fsync=policy)
+    try:
+        for name in ("a", "b", "c"):
+            repo.write(str(tmp_path / name), name)
+            # Wait for each write separately so none of them are coalesced.
+            _wait_until(lambda: repo.pending == 0)
+        assert len(calls) == during_writes
+        repo.flush()
+        assert len(calls) == during_writes + on_flush
+    finally:
+        repo.close()
+
+
+def test_invalid_fsync_policy():
+    with pytest.raises(ValueError):
+        BufferedIORepositoryImpl(fsync="sometimes")
+
+
+def test_async_variants(repo, tmp_path):
+    path = str(tmp_path / "async.txt")
+
+    async def scenario():
+        await repo.awrite(path, "async data")
+        assert await repo.aread(path) == "async data"
+        await repo.aflush()
+        await repo.adelete(path)
+        await repo.aflush()
+
+    asyncio.run(scenario())
+    assert not os.path.exists(path)
+
+
+def test_close_flushes_and_rejects_new_writes(tmp_path):
+    repo = BufferedIORepositoryImpl()
+    path = tmp_path / "closed.txt"
+    repo.write(str(path), "data")
+    repo.close()
+
+    assert path.read_text() == "data"
+    with pytest.raises(RuntimeError):
+        repo.write(str(path), "more")
+
+
+def test_works_after_fork(repo, tmp_path):
+    # Like a repository created in the uWSGI master and used by a worker.
+    repo.write(str(tmp_path / "parent.txt"), "from parent")
+    repo.flush()
+
+    result = multiprocessing.Value("i", 0)
+    child = multiprocessing.get_context("fork").Process(
+        target=_write_in_child, args=(repo, str(tmp_path / "child.txt"), result)
+    )
+    child.start()
+    child.join(timeout=10)
+
+    assert result.value == 1
+    assert (tmp_path / "child.txt").read_text() == "from child"
+
+
+def test_dummy_service_with_buffered_repository(repo, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = DummyService(repo)
+
+    assert service.multiply_by_2(21) == 42
+    repo.flush()
+    assert not (tmp_path / "dummy.txt").exists()
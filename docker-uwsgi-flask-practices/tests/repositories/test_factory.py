@@ -0,0 +1,34 @@
+import pytest
+
+from app.repositories import factory
+from app.repositories.buffered_io_repository_impl import BufferedIORepositoryImpl
+from app.repositories.in_memory_io_repository_impl import InMemoryIORepositoryImpl
+from app.repositories.io_repository_impl import IORepositoryImpl
+from app.repositories.tmpfs_io_repository_impl import TmpfsIORepositoryImpl
+from app.settings import Settings
+
+
+@pytest.mark.parametrize(
+    "backend, expected",
+    [
+        ("disk", IORepositoryImpl),
+        ("buffered", BufferedIORepositoryImpl),
+        ("memory", InMemoryIORepositoryImpl),
+        ("tmpfs", TmpfsIORepositoryImpl),
+    ],
+)
+def test_factory_selects_backend(tmp_path, backend, expected):
+    settings = Settings(io_backend=backend, io_tmpfs_dir=str(tmp_path / "shm"), io_memory_max_files=7)
+    repo = factory.create_io_repository(settings)
+    try:
+        assert type(repo) is expected
+        if backend == "memory":
+            assert repo.max_files == 7
+    finally:
+        if hasattr(repo, "close"):
+            repo.close()
+
+
+def test_factory_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        factory.create_io_repository(Settings(io_backend="s3"))
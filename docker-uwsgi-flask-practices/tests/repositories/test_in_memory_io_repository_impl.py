@@ -0,0 +1,76 @@
+import pytest
+
+from app.repositories.in_memory_io_repository_impl import InMemoryIORepositoryImpl
+from app.services.dummy_service import DummyService
+
+
+def test_write_read_delete():
+    repo = InMemoryIORepositoryImpl()
+    repo.write("a.txt", "héllo\r\nworld")
+
+    assert repo.read("a.txt") == "héllo\r\nworld"
+    assert b"".join(repo.read_chunks("a.txt", chunk_size=3)) == "héllo\r\nworld".encode()
+    assert list(repo.iter_lines("a.txt")) == ["héllo\n", "world"]
+    with repo.read_mmap("a.txt") as view:
+        assert view.readonly
+        assert bytes(view) == "héllo\r\nworld".encode()
+
+    repo.delete("a.txt")
+    assert len(repo) == 0
+    assert repo.size == 0
+    with pytest.raises(FileNotFoundError):
+        repo.read("a.txt")
+
+
+def test_delete_missing_raises():
+    with pytest.raises(FileNotFoundError):
+        InMemoryIORepositoryImpl().delete("missing.txt")
+
+
+def test_evicts_least_recently_used_by_count():
+    repo = InMemoryIORepositoryImpl(max_files=2)
+    repo.write("a", "1")
+    repo.write("b", "2")
+    repo.read("a")  # b is now the least recently used
+    repo.write("c", "3")
+
+    assert repo.read("a") == "1"
+    assert repo.read("c") == "3"
+    with pytest.raises(FileNotFoundError):
+        repo.read("b")
+    assert repo.evictions == 1
+
+
+def test_evicts_by_size():
+    repo = InMemoryIORepositoryImpl(max_bytes=10)
+    repo.write("a", "xxxx")
+    repo.write("b", "yyyy")
+    repo.write("c", "zzzz")
+
+    assert len(repo) == 2
+    assert repo.size == 8
+    with pytest.raises(FileNotFoundError):
+        repo.read("a")
+
+
+def test_overwrite_replaces_size():
+    repo = InMemoryIORepositoryImpl(max_bytes=10)
+    repo.write("a", "xxxxxxxx")
+    repo.write("a", "yy")
+
+    assert repo.size == 2
+    assert repo.evictions == 0
+
+
+def test_rejects_file_larger_than_store():
+    with pytest.raises(ValueError):
+        InMemoryIORepositoryImpl(max_bytes=4).write("a", "too large")
+
+
+def test_dummy_service_skips_disk(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repo = InMemoryIORepositoryImpl()
+
+    assert DummyService(repo).multiply_by_2(4) == 8
+    assert len(repo) == 0
+    assert list(tmp_path.iterdir()) == []
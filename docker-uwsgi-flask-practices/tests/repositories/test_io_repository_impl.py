@@ -0,0 +1,114 @@
+import hashlib
+import os
+
+import pytest
+
+from app.repositories.buffered_io_repository_impl import BufferedIORepositoryImpl
+from app.repositories.io_repository_impl import IORepositoryImpl
+
+LARGE_FILE_LINES = 200_000
+
+
+@pytest.fixture(scope="module")
+def large_file(tmp_path_factory):
+    """
+    ~8 MB text file with numbered lines, and its sha256.
+    """
+    path = tmp_path_factory.mktemp("large") / "large.txt"
+    with open(path, "w") as file:
+        for i in range(LARGE_FILE_LINES):
+            file.write(f"line {i:08d} " + "x" * 24 + "\n")
+    with open(path, "rb") as file:
+        digest = hashlib.sha256(file.read()).hexdigest()
+    return str(path), digest
+
+
+@pytest.fixture(params=["impl", "buffered"])
+def repo(request):
+    repository = IORepositoryImpl() if request.param == "impl" else BufferedIORepositoryImpl()
+    yield repository
+    if hasattr(repository, "close"):
+        repository.close()
+
+
+def test_read_chunks_streams_whole_file(repo, large_file):
+    path, digest = large_file
+    chunk_size = 64 * 1024
+
+    sha = hashlib.sha256()
+    sizes = []
+    for chunk in repo.read_chunks(path, chunk_size=chunk_size):
+        sha.update(chunk)
+        sizes.append(len(chunk))
+
+    assert sha.hexdigest() == digest
+    assert max(sizes) == chunk_size
+    assert sum(sizes) == os.path.getsize(path)
+
+
+def test_read_mmap_is_zero_copy_view(repo, large_file):
+    path, digest = large_file
+
+    with repo.read_mmap(path) as view:
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert len(view) == os.path.getsize(path)
+        assert bytes(view[:14]) == b"line 00000000 "
+        assert hashlib.sha256(view).hexdigest() == digest
+
+    with pytest.raises(ValueError):
+        view[0]
+
+
+def test_read_mmap_keeps_slices_valid(repo, large_file):
+    path, _ = large_file
+    with repo.read_mmap(path) as view:
+        header = view[:4]
+    assert bytes(header) == b"line"
+
+
+def test_iter_lines(repo, large_file):
+    path, _ = large_file
+
+    count = 0
+    for count, line in enumerate(repo.iter_lines(path), start=1):
+        pass
+
+    assert count == LARGE_FILE_LINES
+    assert line == f"line {LARGE_FILE_LINES - 1:08d} " + "x" * 24 + "\n"
+
+
+def test_empty_file(repo, tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+
+    assert list(repo.read_chunks(str(path))) == []
+    assert list(repo.iter_lines(str(path))) == []
+    with repo.read_mmap(str(path)) as view:
+        assert len(view) == 0
+
+
+def test_missing_file(repo, tmp_path):
+    path = str(tmp_path / "missing.txt")
+    with pytest.raises(FileNotFoundError):
+        list(repo.read_chunks(path))
+    with pytest.raises(FileNotFoundError):
+        list(repo.iter_lines(path))
+    with pytest.raises(FileNotFoundError):
+        with repo.read_mmap(path):
+            pass
+
+
+def test_buffered_streams_pending_write(tmp_path):
+    path = str(tmp_path / "pending.txt")
+    with BufferedIORepositoryImpl() as repo:
+        repo.write(path, "first\r\nsecond\n")
+
+        assert b"".join(repo.read_chunks(path, chunk_size=4)) == b"first\r\nsecond\n"
+        assert list(repo.iter_lines(path)) == ["first\n", "second\n"]
+        with repo.read_mmap(path) as view:
+            assert bytes(view) == b"first\r\nsecond\n"
+
+        repo.delete(path)
+        with pytest.raises(FileNotFoundError):
+            list(repo.read_chunks(path))
@@ -0,0 +1,25 @@
+import pytest
+
+from app.repositories.tmpfs_io_repository_impl import TmpfsIORepositoryImpl
+
+
+def test_paths_resolve_under_root(tmp_path):
+    repo = TmpfsIORepositoryImpl(root=str(tmp_path / "scratch"))
+    repo.write("dummy.txt", "data")
+
+    assert (tmp_path / "scratch" / "dummy.txt").read_text() == "data"
+    assert repo.read("dummy.txt") == "data"
+    assert list(repo.iter_lines("dummy.txt")) == ["data"]
+    with repo.read_mmap("dummy.txt") as view:
+        assert bytes(view) == b"data"
+
+    repo.delete("dummy.txt")
+    assert not (tmp_path / "scratch" / "dummy.txt").exists()
+
+
+def test_rejects_paths_outside_root(tmp_path):
+    repo = TmpfsIORepositoryImpl(root=str(tmp_path / "scratch"))
+    with pytest.raises(ValueError):
+        repo.write("../escape.txt", "data")
+    with pytest.raises(ValueError):
+        repo.read("/etc/passwd")
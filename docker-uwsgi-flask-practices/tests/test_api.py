@@ -11,3 +11,68 @@ def test_api_endpoint(client):
     response = client.get("/api")
     assert response.status_code == 200
     assert response.json == {"message": "Hello from Flask + uWSGI + Nginx!", "key": 'test_api_key'}
+
+
+def test_process_endpoint(client):
+    response = client.post("/process")
+    assert response.status_code == 200
+    assert response.json["status"] == "success"
+
+
+def test_process_endpoint_busy_when_all_slots_taken(client):
+    from app.main import process_limiter
+
+    held = [process_limiter.try_acquire() for _ in range(process_limiter.slots)]
+    try:
+        response = client.post("/process")
+        assert response.status_code == 429
+        assert response.json["status"] == "busy"
+
+        slots = client.get("/process/slots").json
+        assert slots == {"slots": process_limiter.slots, "in_use": process_limiter.slots, "available": 0}
+    finally:
+        for index in held:
+            process_limiter.release(index)
+
+    assert client.get("/process/slots").json["available"] == process_limiter.slots
+
+
+def test_slow_io_endpoint_runs_calls_concurrently(client):
+    response = client.get("/slow-io?delay=0.05&calls=4")
+    assert response.status_code == 200
+    assert response.json["calls"] == 4
+    assert response.json["elapsed"] < 0.05 * 4
+
+
+def test_slow_io_sync_endpoint(client):
+    response = client.get("/slow-io-sync?delay=0&calls=3")
+    assert response.status_code == 200
+    assert response.json["calls"] == 3
+    assert response.json["delay"] == 0
+
+
+@pytest.mark.parametrize("route", ["/slow-io", "/slow-io-sync"])
+@pytest.mark.parametrize("query", ["delay=-1", "delay=nan", "delay=inf", "delay=5.1", "calls=0", "calls=-5", "calls=1001"])
+def test_slow_io_endpoints_reject_out_of_range_arguments(client, route, query):
+    response = client.get(f"{route}?{query}")
+    assert response.status_code == 400
+    assert response.json["status"] == "invalid"
+
+
+def test_cpu_bound_endpoint(client):
+    response = client.get("/cpu-bound?n=10")
+    assert response.status_code == 200
+    assert response.json == {"n": 10, "result": 285}
+
+
+@pytest.mark.parametrize("n", [-1, 10_000_001])
+def test_cpu_bound_endpoint_rejects_out_of_range_n(client, n):
+    response = client.get(f"/cpu-bound?n={n}")
+    assert response.status_code == 400
+    assert response.json["status"] == "invalid"
+
+
+def test_multiply_endpoint(client):
+    response = client.get("/multiply/21")
+    assert response.status_code == 200
+    assert response.json == {"result": 42}
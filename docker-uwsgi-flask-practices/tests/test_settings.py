@@ -0,0 +1,57 @@
+import dataclasses
+import os
+import signal
+
+import pytest
+
+from app import settings as settings_module
+from app.main import app
+from app.settings import Settings, load_settings, read_env_file, reload_settings
+
+
+@pytest.fixture
+def restore_settings():
+    original = settings_module.get_settings()
+    yield
+    settings_module._settings = original
+
+
+def test_settings_from_mapping_parses_types():
+    settings = Settings.from_mapping(
+        {"API_KEY": "abc", "PROCESS_SLOTS": "3", "PROCESS_DURATION": "0.5"}
+    )
+    assert settings == Settings(api_key="abc", process_slots=3, process_duration=0.5)
+
+
+def test_settings_are_frozen():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        Settings().api_key = "changed"
+
+
+def test_env_file_overrides_environment(tmp_path):
+    env_file = tmp_path / "runtime.env"
+    env_file.write_text("# comment\n\nAPI_KEY='from_file'\nPROCESS_SLOTS=5\n")
+
+    assert read_env_file(str(env_file)) == {"API_KEY": "from_file", "PROCESS_SLOTS": "5"}
+    settings = load_settings({"API_KEY": "from_env", "SETTINGS_ENV_FILE": str(env_file)})
+    assert settings.api_key == "from_file"
+    assert settings.process_slots == 5
+
+
+def test_reload_updates_handlers(monkeypatch, restore_settings):
+    client = app.test_client()
+    assert client.get("/api").json["key"] == "test_api_key"
+
+    monkeypatch.setenv("API_KEY", "rotated_key")
+    # The snapshot is not re-read per request...
+    assert client.get("/api").json["key"] == "test_api_key"
+
+    reload_settings()
+    assert client.get("/api").json["key"] == "rotated_key"
+    assert client.get("/some-other-api").json["key"] == "rotated_key"
+
+
+def test_reload_signal(monkeypatch, restore_settings):
+    monkeypatch.setenv("API_KEY", "signalled_key")
+    os.kill(os.getpid(), signal.SIGUSR1)
+    assert settings_module.get_settings().api_key == "signalled_key"
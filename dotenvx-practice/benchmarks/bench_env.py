@@ -0,0 +1,37 @@
+"""
+Per-request cost of three decouple.config() calls versus the startup snapshot.
+
+    python benchmarks/bench_env.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from decouple import config  # noqa: E402
+
+from myproject.env import get_env  # noqa: E402
+
+NUMBER = 100_000
+
+CASES = {
+    "decouple.config x3": (
+        'config("ENV_KEY1", default="default_value1"); '
+        'config("ENV_KEY2", default="default_value2"); '
+        'config("ENV_KEY3", default="default_value3")'
+    ),
+    "get_env() x1": "env = get_env(); env.env_key1; env.env_key2; env.env_key3",
+}
+
+
+def main():
+    for name, stmt in CASES.items():
+        best = min(
+            timeit.repeat(stmt, globals={"config": config, "get_env": get_env}, number=NUMBER, repeat=5)
+        )
+        print(f"{name:<20} {best / NUMBER * 1e9:8.0f} ns per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Environment snapshot read once at startup instead of on every request.
+
+Views use ``get_env()``; ``reload_env()`` (or SIGUSR1 once
+``install_reload_handler()`` ran) builds a fresh snapshot and swaps it in.
+"""
+
+import os
+import signal
+import threading
+from dataclasses import dataclass
+
+from decouple import AutoConfig
+
+# Where decouple starts looking for settings.ini / .env (then the parent directories).
+ENV_SEARCH_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+@dataclass(frozen=True)
+class EnvSnapshot:
+    env_key1: str
+    env_key2: str
+    env_key3: str
+
+
+def load_env():
+    # A new AutoConfig every time: decouple.config reads the .env file once and
+    # caches it, so reusing it would snapshot the same stale values on reload.
+    config = AutoConfig(search_path=ENV_SEARCH_PATH)
+    return EnvSnapshot(
+        env_key1=config("ENV_KEY1", default="default_value1"),
+        env_key2=config("ENV_KEY2", default="default_value2"),
+        env_key3=config("ENV_KEY3", default="default_value3"),
+    )
+
+
+_env = load_env()
+
+
+def get_env():
+    return _env
+
+
+def reload_env():
+    global _env
+    _env = load_env()
+    return _env
+
+
+def install_reload_handler(signum=signal.SIGUSR1):
+    # signal.signal only works from the main thread (not e.g. runserver's autoreloader).
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signum, lambda *_: reload_env())
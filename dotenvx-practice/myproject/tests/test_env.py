@@ -0,0 +1,18 @@
+from myproject import env
+
+
+def test_reload_env_reads_the_edited_env_file(tmp_path, monkeypatch):
+    for key in ("ENV_KEY1", "ENV_KEY2", "ENV_KEY3"):
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setattr(env, "ENV_SEARCH_PATH", str(tmp_path))
+    env_file = tmp_path / ".env"
+
+    env_file.write_text("ENV_KEY1=before\n")
+    assert env.reload_env().env_key1 == "before"
+
+    env_file.write_text("ENV_KEY1=after\nENV_KEY2=added\n")
+    snapshot = env.reload_env()
+    assert snapshot.env_key1 == "after"
+    assert snapshot.env_key2 == "added"
+    assert snapshot.env_key3 == "default_value3"
+    assert env.get_env() is snapshot
@@ -11,6 +11,10 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
+from myproject.env import install_reload_handler
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'myproject.settings')
 
+install_reload_handler()
+
 application = get_wsgi_application()
@@ -0,0 +1,13 @@
+"""
+ASGI entrypoint: uvicorn asgi:application
+
+Flask is WSGI, so a2wsgi runs each request on one of ASGI_THREADS worker threads
+while uvicorn's event loop handles the connections.
+"""
+import os
+
+from a2wsgi import WSGIMiddleware
+
+from hello import app
+
+application = WSGIMiddleware(app, workers=int(os.environ.get('ASGI_THREADS', 64)))
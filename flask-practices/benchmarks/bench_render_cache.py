@@ -0,0 +1,62 @@
+"""
+Requests per second for the HTML and JSON hello routes, with and without the render cache.
+
+Runs against the Flask test client, so it measures app + template cost only:
+
+    python benchmarks/bench_render_cache.py [requests] [distinct_names]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from flask import render_template  # noqa: E402
+
+from hello import app  # noqa: E402
+from render_cache import cached_render_template  # noqa: E402
+
+
+def run(client, path_template, requests, names, rounds=3):
+    """Best requests/second over a few rounds, to smooth out machine noise."""
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for i in range(requests):
+            response = client.get(path_template.format(name=f'user{i % names}'))
+            assert response.status_code == 200
+        best = max(best, requests / (time.perf_counter() - start))
+    return best
+
+
+def run_render_only(render, requests, names):
+    """Renders per second inside a request context, without the HTTP round trip."""
+    with app.test_request_context():
+        start = time.perf_counter()
+        for i in range(requests):
+            render('hello.html', person=f'user{i % names}')
+        return requests / (time.perf_counter() - start)
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    names = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    client = app.test_client()
+
+    print(f'{requests} requests over {names} distinct names, best of 3 rounds')
+    for enabled in (False, True):
+        app.config['RENDER_CACHE_ENABLED'] = enabled
+        app.extensions['render_cache'].invalidate()
+        label = 'cache on ' if enabled else 'cache off'
+        html_rps = run(client, '/hello-html/{name}', requests, names)
+        json_rps = run(client, '/hello-json/{name}', requests, names)
+        print(f'  {label}: /hello-html {html_rps:8.0f} req/s   /hello-json {json_rps:8.0f} req/s')
+
+    app.config['RENDER_CACHE_ENABLED'] = True
+    plain = run_render_only(render_template, requests, names)
+    cached = run_render_only(cached_render_template, requests, names)
+    print(f'  render only: render_template {plain:8.0f}/s   cached_render_template {cached:8.0f}/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,26 @@
 from flask import Flask
 from flask import request
-from flask import render_template
+from flask import url_for
 
+import asyncio
+import math
+import os
 import threading
 import time
 
+from jobs import JobQueue, QueueFullError
+from render_cache import cached_render_template, init_render_cache
+
 app = Flask(__name__)
+app.config.from_mapping(
+    PROCESS_WORKERS=int(os.environ.get('PROCESS_WORKERS', 4)),
+    PROCESS_QUEUE_DEPTH=int(os.environ.get('PROCESS_QUEUE_DEPTH', 100)),
+    PROCESS_DURATION=float(os.environ.get('PROCESS_DURATION', 5)),
+    RENDER_CACHE_ENABLED=os.environ.get('RENDER_CACHE_ENABLED', '1') == '1',
+    RENDER_CACHE_SIZE=int(os.environ.get('RENDER_CACHE_SIZE', 1024)),
+    RENDER_CACHE_TTL=float(os.environ.get('RENDER_CACHE_TTL', 60)),
+)
+render_cache = init_render_cache(app)
 
 @app.route("/")
 def hello_world():
@@ -29,7 +44,7 @@ def bye():
 @app.route('/hello-html/')
 @app.route('/hello-html/<name>')
 def hello(name=None):
-    return render_template('hello.html', person=name)
+    return cached_render_template('hello.html', person=name)
 
 @app.route('/hello-json')
 @app.route('/hello-json/<name>')
@@ -44,16 +59,83 @@ def add_name():
     name = request.json.get('name')
     return {"name": name}, 201
 
-lock = threading.Lock()
+job_queue = JobQueue(
+    workers=app.config['PROCESS_WORKERS'],
+    max_depth=app.config['PROCESS_QUEUE_DEPTH'],
+)
+# On exit (Ctrl-C, reloader restart) drop the queued jobs instead of running
+# them all first. concurrent.futures joins its worker threads from a threading
+# exit hook, which runs before plain atexit handlers, so register there too;
+# later registrations run first.
+threading._register_atexit(lambda: job_queue.shutdown(wait=False, cancel_pending=True))
 
-@app.route('/process')
-def process():
-    if not lock.acquire(blocking=False):
-        return {'status': 'busy', 'message': 'Another request is currently being processed'}, 429
+def long_running_task():
+    # Simulate long-running task
+    time.sleep(app.config['PROCESS_DURATION'])
+    return {'message': 'Processing complete'}
 
+@app.route('/process', methods=["GET", "POST"])
+def process():
     try:
-        # Simulate long-running task
-        time.sleep(5)
-        return {'status': 'success', 'message': 'Processing complete'}
-    finally:
-        lock.release()
\ No newline at end of file
+        job = job_queue.submit(long_running_task)
+    except QueueFullError:
+        retry_after = int(app.config['PROCESS_DURATION']) or 1
+        return (
+            {'status': 'busy', 'message': 'Job queue is full, retry later'},
+            429,
+            {'Retry-After': str(retry_after)},
+        )
+
+    status_url = url_for('process_status', job_id=job.id)
+    return (
+        {'status': job.status, 'job_id': job.id, 'status_url': status_url},
+        202,
+        {'Location': status_url},
+    )
+
+@app.route('/process/<job_id>')
+def process_status(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return {'status': 'not_found', 'message': f'Unknown job {job_id}'}, 404
+    return job.to_dict()
+
+# Bounds for /slow-io and /slow-io-sync, so one request cannot hold a worker
+# (or the event loop) for long or build an unbounded number of coroutines.
+MAX_IO_DELAY = 5.0
+MAX_IO_CALLS = 1000
+
+async def wait_for_io(delay):
+    # Stand-in for a call to a slow downstream service
+    await asyncio.sleep(delay)
+    return delay
+
+def io_args_error(delay, calls):
+    if not (math.isfinite(delay) and 0 <= delay <= MAX_IO_DELAY):
+        return f'delay must be between 0 and {MAX_IO_DELAY} seconds'
+    if not 1 <= calls <= MAX_IO_CALLS:
+        return f'calls must be between 1 and {MAX_IO_CALLS}'
+    return None
+
+@app.route('/slow-io')
+async def slow_io():
+    delay = request.args.get('delay', 0.1, type=float)
+    calls = request.args.get('calls', 1, type=int)
+    error = io_args_error(delay, calls)
+    if error:
+        return {'status': 'invalid', 'message': error}, 400
+    started = time.perf_counter()
+    await asyncio.gather(*(wait_for_io(delay) for _ in range(calls)))
+    return {'calls': calls, 'delay': delay, 'elapsed': time.perf_counter() - started}
+
+@app.route('/slow-io-sync')
+def slow_io_sync():
+    delay = request.args.get('delay', 0.1, type=float)
+    calls = request.args.get('calls', 1, type=int)
+    error = io_args_error(delay, calls)
+    if error:
+        return {'status': 'invalid', 'message': error}, 400
+    started = time.perf_counter()
+    for _ in range(calls):
+        time.sleep(delay)
+    return {'calls': calls, 'delay': delay, 'elapsed': time.perf_counter() - started}
@@ -0,0 +1,104 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while every worker and queue slot is taken."""
+
+
+@dataclass
+class Job:
+    id: str
+    status: str = 'queued'
+    result: object = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def to_dict(self):
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class JobQueue:
+    """
+    Bounded in-process job queue backed by a thread pool.
+
+    At most `workers` jobs run at once and at most `max_depth` more wait in line;
+    submitting beyond that raises QueueFullError so callers can apply backpressure.
+    Finished jobs are kept for polling, up to `max_finished` of them.
+    """
+
+    def __init__(self, workers=4, max_depth=100, max_finished=1000):
+        self.workers = workers
+        self.max_depth = max_depth
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job')
+        self._jobs = OrderedDict()
+        self._futures = {}
+        self._finished = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def depth(self):
+        """Number of jobs queued or running."""
+        with self._lock:
+            return len(self._jobs)
+
+    def submit(self, func, *args, **kwargs):
+        with self._lock:
+            if len(self._jobs) >= self.workers + self.max_depth:
+                raise QueueFullError()
+            job = Job(id=uuid.uuid4().hex)
+            self._jobs[job.id] = job
+            self._futures[job.id] = self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id) or self._finished.get(job_id)
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        Stop accepting jobs. With `cancel_pending`, queued jobs that have not
+        started are dropped and marked 'cancelled'; running ones still finish.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_pending)
+        with self._lock:
+            for job_id, future in list(self._futures.items()):
+                if future.cancelled():
+                    job = self._jobs.pop(job_id)
+                    job.status = 'cancelled'
+                    job.finished_at = time.time()
+                    self._futures.pop(job_id)
+                    self._finished[job_id] = job
+
+    def _run(self, job, func, args, kwargs):
+        job.status = 'running'
+        job.started_at = time.time()
+        try:
+            job.result = func(*args, **kwargs)
+            job.status = 'succeeded'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed'
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._jobs.pop(job.id, None)
+                self._futures.pop(job.id, None)
+                self._finished[job.id] = job
+                while len(self._finished) > self.max_finished:
+                    self._finished.popitem(last=False)
@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, render_template
+
+
+class RenderCache:
+    """
+    Bounded LRU cache of rendered templates with a TTL.
+
+    Entries are keyed by template name and the context passed in, so only cache
+    templates whose output depends on that context alone (not on request, session
+    or g, which Flask injects behind the scenes).
+    """
+
+    def __init__(self, maxsize=1024, ttl=60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def get_or_render(self, template_name, context, render):
+        try:
+            key = (template_name, tuple(sorted(context.items())))
+            hash(key)
+        except TypeError:
+            # Unhashable context values cannot be used as a key; render uncached.
+            return render()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        output = render()
+        with self._lock:
+            self._entries[key] = (now + self.ttl, output)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return output
+
+    def invalidate(self, template_name=None):
+        """
+        Drop cached output for one template, or everything when no name is given.
+        """
+        with self._lock:
+            if template_name is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == template_name]:
+                del self._entries[key]
+
+    def track_template(self, template_name, template):
+        """
+        Invalidate ``template_name`` when ``template`` is not the object seen last time.
+        """
+        with self._lock:
+            changed = self._templates.get(template_name) not in (None, template)
+            self._templates[template_name] = template
+        if changed:
+            self.invalidate(template_name)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+def init_render_cache(app):
+    """
+    Attach a RenderCache to the app and compile every template up front.
+    """
+    app.config.setdefault('RENDER_CACHE_ENABLED', True)
+    app.config.setdefault('RENDER_CACHE_SIZE', 1024)
+    app.config.setdefault('RENDER_CACHE_TTL', 60.0)
+
+    cache = RenderCache(
+        maxsize=app.config['RENDER_CACHE_SIZE'],
+        ttl=app.config['RENDER_CACHE_TTL'],
+    )
+    app.extensions['render_cache'] = cache
+
+    # Loading a template compiles it and stores it in Jinja's own template cache,
+    # so the first request does not pay for parsing.
+    for template_name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(template_name)
+
+    return cache
+
+
+def cached_render_template(template_name, **context):
+    """
+    Drop-in replacement for render_template that serves repeated renders from the cache.
+    """
+    app = current_app
+    if not app.config.get('RENDER_CACHE_ENABLED'):
+        return render_template(template_name, **context)
+
+    cache = app.extensions['render_cache']
+    # With template auto-reload on (debug mode), Jinja hands out a new Template
+    # object once the file changed; drop output rendered from the old one.
+    if app.jinja_env.auto_reload:
+        cache.track_template(template_name, app.jinja_env.get_template(template_name))
+
+    return cache.get_or_render(
+        template_name,
+        context,
+        lambda: render_template(template_name, **context),
+    )
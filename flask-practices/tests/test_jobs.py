@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from hello import app
+from jobs import JobQueue
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setitem(app.config, 'PROCESS_DURATION', 0)
+    with app.test_client() as client:
+        yield client
+
+
+def _poll(client, url, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(url).json
+        if job['status'] in ('succeeded', 'failed'):
+            return job
+        if time.monotonic() > deadline:
+            pytest.fail(f'job still {job["status"]} after {timeout}s')
+        time.sleep(0.01)
+
+
+def test_process_returns_202_and_the_job_can_be_polled(client):
+    response = client.post('/process')
+
+    assert response.status_code == 202
+    assert response.headers['Location'] == response.json['status_url']
+    job = _poll(client, response.headers['Location'])
+    assert job['status'] == 'succeeded'
+    assert job['result'] == {'message': 'Processing complete'}
+    assert job['job_id'] == response.json['job_id']
+
+
+def test_unknown_job_is_404(client):
+    assert client.get('/process/nope').status_code == 404
+
+
+def test_shutdown_cancels_queued_jobs():
+    queue = JobQueue(workers=1, max_depth=10)
+    release = threading.Event()
+    ran = []
+    running = queue.submit(release.wait)
+    queued = [queue.submit(ran.append, i) for i in range(3)]
+    try:
+        queue.shutdown(wait=False, cancel_pending=True)
+    finally:
+        release.set()
+    queue.shutdown(wait=True)
+
+    assert queue.get(running.id).status == 'succeeded'
+    assert [queue.get(job.id).status for job in queued] == ['cancelled'] * 3
+    assert ran == []
+
+
+def test_exit_does_not_wait_for_queued_jobs():
+    # Five 1-second jobs on one worker: without the exit hook, exiting takes ~5s.
+    script = 'import hello\nfor _ in range(5): hello.job_queue.submit(hello.long_running_task)\n'
+    env = dict(os.environ, PROCESS_WORKERS='1', PROCESS_DURATION='1')
+    started = time.monotonic()
+    subprocess.run([sys.executable, '-c', script], cwd=ROOT, env=env, check=True, timeout=30)
+
+    assert time.monotonic() - started < 3
@@ -0,0 +1,169 @@
+"""
+Atlassian Document Format (ADF) builder with cached, pre-encoded fragments.
+
+Every node is a ``Fragment`` holding its JSON encoding. Paragraphs, list items
+and bullet lists are memoized, so repeated text ("Practical usage:", an area
+name, a shared bullet) is encoded once and its bytes are spliced into every
+document and request body that uses it.
+
+Keys are always sorted and separators are compact, so ``encode(fields)`` is
+byte-for-byte what ``json.dumps(fields, sort_keys=True, separators=(",", ":"),
+ensure_ascii=False)`` would produce for the equivalent plain dicts.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Sequence
+
+
+# Jira's bulk create endpoint accepts at most 50 issues per request.
+BULK_CREATE_LIMIT = 50
+
+FRAGMENT_CACHE_SIZE = 16384
+
+# Stand-in string for a Fragment during encoding. It starts with a NUL
+# character, which json.dumps always escapes, so ordinary text never matches it.
+_PLACEHOLDER = "\x00adf-fragment:"
+_PLACEHOLDER_JSON = "\\u0000adf-fragment:"
+
+
+@dataclass(frozen=True)
+class Fragment:
+    """An immutable, already-encoded piece of JSON."""
+
+    encoded: bytes
+
+    def to_dict(self) -> Any:
+        return json.loads(self.encoded)
+
+
+def encode(value: Any) -> bytes:
+    """
+    Encode ``value`` as compact JSON bytes, splicing in ``Fragment`` values as-is.
+    """
+    if isinstance(value, Fragment):
+        return value.encoded
+
+    fragments: list[Fragment] = []
+
+    def placeholder(obj: Any) -> str:
+        if not isinstance(obj, Fragment):
+            raise TypeError(
+                f"Object of type {type(obj).__name__} is not JSON serializable"
+            )
+        fragments.append(obj)
+        return f"{_PLACEHOLDER}{len(fragments) - 1}"
+
+    # One C-level dumps for the plain parts; fragments are swapped in afterwards.
+    encoded = json.dumps(
+        value,
+        default=placeholder,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+    for index, fragment in enumerate(fragments):
+        token = f'"{_PLACEHOLDER_JSON}{index}"'.encode("utf-8")
+        encoded = encoded.replace(token, fragment.encoded, 1)
+    return encoded
+
+
+def _encode_scalar(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def _node(node_type: str, content: Sequence[Fragment], suffix: bytes = b"") -> Fragment:
+    # Same bytes as encode({"content": [...], "type": node_type, ...}), joined directly.
+    return Fragment(
+        b'{"content":['
+        + b",".join(fragment.encoded for fragment in content)
+        + b'],"type":'
+        + _encode_scalar(node_type)
+        + suffix
+        + b"}"
+    )
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def text(value: str) -> Fragment:
+    return Fragment(encode({"text": value, "type": "text"}))
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def paragraph(value: str) -> Fragment:
+    return _node("paragraph", [text(value)])
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def list_item(value: str) -> Fragment:
+    return _node("listItem", [paragraph(value)])
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def bullet_list(items: tuple[str, ...]) -> Fragment:
+    return _node("bulletList", [list_item(item) for item in items])
+
+
+def doc(*content: Fragment) -> Fragment:
+    return _node("doc", content, suffix=b',"version":1')
+
+
+EPIC_DESCRIPTION = doc(
+    paragraph("Learning epic for core engineering fundamentals."),
+    paragraph("Areas:"),
+    bullet_list(
+        (
+            "Linear algebra basics",
+            "Algorithms and data structures basics",
+            "Statistics and probability basics",
+        )
+    ),
+    paragraph("Each child issue contains:"),
+    bullet_list(
+        (
+            "Practical usage",
+            "Subtopics to learn",
+            "Explicit goal criteria",
+        )
+    ),
+)
+
+
+def topic_description(topic: Dict[str, Any]) -> Fragment:
+    return doc(
+        paragraph(f"Area: {topic['area']}"),
+        paragraph("Practical usage:"),
+        bullet_list(tuple(topic["practical_usage"])),
+        paragraph("Subtopics to learn:"),
+        bullet_list(tuple(topic["subtopics"])),
+        paragraph("Done criteria:"),
+        bullet_list(tuple(topic["goal_criteria"])),
+    )
+
+
+def issue_payload(fields: Dict[str, Any]) -> bytes:
+    """Request body for the create / edit issue endpoints."""
+    return b'{"fields":' + encode(fields) + b"}"
+
+
+def bulk_payloads(
+    encoded_fields: Iterable[bytes], batch_size: int = BULK_CREATE_LIMIT
+) -> Iterator[bytes]:
+    """
+    Yield request bodies for ``POST /rest/api/3/issue/bulk`` from already-encoded
+    ``fields`` objects, ``batch_size`` issues per body.
+    """
+    iterator = iter(encoded_fields)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield (
+            b'{"issueUpdates":['
+            + b",".join(b'{"fields":' + fields + b"}" for fields in batch)
+            + b"]}"
+        )
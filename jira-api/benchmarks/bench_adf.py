@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark building and encoding issue descriptions for many topics.
+
+Compares the previous approach (nested dicts rebuilt per call, then json.dumps
+per request) with the cached fragments in adf.py, per issue and as bulk bodies.
+
+Usage:
+  python benchmarks/bench_adf.py [--topics 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import adf  # noqa: E402
+from create_learning_epic import (  # noqa: E402
+    DEFAULT_LABELS,
+    JIRA_TOPICS_FILE,
+    build_child_fields,
+)
+from mock_jira import repeat_topics  # noqa: E402
+from topics import load_topics  # noqa: E402
+
+
+def legacy_paragraph(text: str) -> Dict[str, Any]:
+    return {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+
+
+def legacy_bullet_list(items: List[str]) -> Dict[str, Any]:
+    return {
+        "type": "bulletList",
+        "content": [
+            {"type": "listItem", "content": [legacy_paragraph(item)]} for item in items
+        ],
+    }
+
+
+def legacy_topic_description(topic: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "version": 1,
+        "type": "doc",
+        "content": [
+            legacy_paragraph(f"Area: {topic['area']}"),
+            legacy_paragraph("Practical usage:"),
+            legacy_bullet_list(topic["practical_usage"]),
+            legacy_paragraph("Subtopics to learn:"),
+            legacy_bullet_list(topic["subtopics"]),
+            legacy_paragraph("Done criteria:"),
+            legacy_bullet_list(topic["goal_criteria"]),
+        ],
+    }
+
+
+def run_legacy(topics: List[Dict[str, Any]]) -> int:
+    size = 0
+    for topic in topics:
+        fields = {
+            "project": {"key": "BENCH"},
+            "summary": f"Learn: {topic['title']}",
+            "description": legacy_topic_description(topic),
+            "issuetype": {"name": "Task"},
+            "parent": {"key": "EPIC-1"},
+            "labels": DEFAULT_LABELS + [topic["area"].lower().replace(" ", "-")],
+        }
+        size += len(json.dumps({"fields": fields}).encode("utf-8"))
+    return size
+
+
+def run_fragments(topics: List[Dict[str, Any]]) -> int:
+    return sum(
+        len(adf.issue_payload(build_child_fields("EPIC-1", topic))) for topic in topics
+    )
+
+
+def run_bulk(topics: List[Dict[str, Any]]) -> int:
+    encoded = (adf.encode(build_child_fields("EPIC-1", topic)) for topic in topics)
+    return sum(len(body) for body in adf.bulk_payloads(encoded))
+
+
+def timed(label: str, func, topics) -> None:
+    start = time.perf_counter()
+    size = func(topics)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:8.1f} ms  {size / 1e6:7.2f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--topics", type=int, default=10000)
+    args = parser.parse_args()
+
+    topics = list(repeat_topics(list(load_topics(JIRA_TOPICS_FILE)), args.topics))
+    print(f"{args.topics} topics")
+    timed("legacy dicts + json.dumps", run_legacy, topics)
+    timed("fragments (cold cache)", run_fragments, topics)
+    timed("fragments (warm cache)", run_fragments, topics)
+    timed("fragments, bulk bodies", run_bulk, topics)
+
+
+if __name__ == "__main__":
+    main()
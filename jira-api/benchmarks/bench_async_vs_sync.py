@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Compare the sync and asyncio Jira clients against a local mock endpoint.
+
+Usage:
+  python benchmarks/bench_async_vs_sync.py [--topics 200] [--latency 0.1] [--concurrency 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mock_jira import MockJiraServer, repeat_topics  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--topics", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    with MockJiraServer(latency=args.latency) as server:
+        # The scripts read their configuration at import time.
+        os.environ.update(
+            {
+                "JIRA_BASE_URL": server.base_url,
+                "JIRA_EMAIL": "bench@example.com",
+                "JIRA_API_TOKEN": "token",
+                "JIRA_PROJECT_KEY": "BENCH",
+                "JIRA_CONCURRENCY": str(args.concurrency),
+            }
+        )
+        import create_learning_epic as sync_script
+        import create_learning_epic_async as async_script
+        from topics import load_topics
+
+        base_topics = list(load_topics(sync_script.JIRA_TOPICS_FILE))
+        topics = list(repeat_topics(base_topics, args.topics))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            epic_key = sync_script.create_epic("Benchmark")
+            for topic in topics:
+                sync_script.create_child_issue(epic_key, topic)
+            sync_elapsed = time.perf_counter() - start
+
+            async def run_async() -> None:
+                async with async_script.AsyncJiraClient() as client:
+                    await async_script.create_learning_epic(client, "Benchmark", topics)
+
+            start = time.perf_counter()
+            asyncio.run(run_async())
+            async_elapsed = time.perf_counter() - start
+
+    print(
+        f"{args.topics} child issues, {args.latency * 1000:.0f} ms latency, "
+        f"concurrency {args.concurrency}"
+    )
+    print(f"  sync : {sync_elapsed:7.2f} s  ({args.topics / sync_elapsed:8.1f} issues/s)")
+    print(f"  async: {async_elapsed:7.2f} s  ({args.topics / async_elapsed:8.1f} issues/s)")
+    print(f"  speedup: {sync_elapsed / async_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
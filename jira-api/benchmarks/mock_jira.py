@@ -0,0 +1,94 @@
+"""
+Local mock of the Jira issue endpoints with artificial latency.
+
+Only what the benchmarks need is implemented: every POST under /rest/api/3/issue
+answers with a fresh issue key and every PUT (edit issue) with 204, after
+sleeping for ``latency`` seconds.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+
+class MockJiraServer:
+    def __init__(self, latency: float = 0.1, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.request_count = 0
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def next_key(self) -> str:
+        with self._lock:
+            self.request_count += 1
+            return f"MOCK-{next(self._counter)}"
+
+    def __enter__(self) -> "MockJiraServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                time.sleep(mock.latency)
+
+                if self.path.endswith("/issue/bulk"):
+                    issues = [
+                        {"id": "0", "key": mock.next_key()}
+                        for _ in body.get("issueUpdates", [])
+                    ]
+                    self._send_json(201, {"issues": issues, "errors": []})
+                else:
+                    self._send_json(201, {"id": "0", "key": mock.next_key()})
+
+            def do_PUT(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                time.sleep(mock.latency)
+                with mock._lock:
+                    mock.request_count += 1
+                self.send_response(204)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def _send_json(self, status: int, payload: dict) -> None:
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+
+def repeat_topics(topics: list, count: int) -> Iterator[dict]:
+    """Yield ``count`` topics by cycling through ``topics`` with unique titles."""
+    for i, topic in zip(range(count), itertools.cycle(topics)):
+        yield {**topic, "title": f"{topic['title']} #{i}"}
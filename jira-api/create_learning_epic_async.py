@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Asyncio version of create_learning_epic.py.
+
+Creates the same epic and child issues, but sends the child issue requests
+concurrently (bounded by JIRA_CONCURRENCY) over a shared HTTP connection pool.
+
+Usage:
+  export JIRA_BASE_URL="https://your-domain.atlassian.net"
+  export JIRA_EMAIL="you@example.com"
+  export JIRA_API_TOKEN="your_api_token"
+  export JIRA_PROJECT_KEY="ENG"
+
+  python create_learning_epic_async.py
+
+Optional env vars (in addition to the ones supported by create_learning_epic.py):
+  export JIRA_CONCURRENCY="10"    # max in-flight requests
+  export JIRA_MAX_RETRIES="3"     # retries for 429 / 503 responses
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+import httpx
+
+import adf
+from create_learning_epic import (
+    EPIC_SUMMARY,
+    JIRA_API_TOKEN,
+    JIRA_BASE_URL,
+    JIRA_EMAIL,
+    JIRA_JOURNAL_PATH,
+    JIRA_PROJECT_KEY,
+    JIRA_TOPICS_FILE,
+    build_child_fields,
+    build_epic_fields,
+    journal_scope,
+    print_summary,
+    require_env,
+)
+from journal import (
+    CREATE,
+    SKIP,
+    SyncJournal,
+    editable_fields,
+    epic_item_id,
+    topic_item_id,
+)
+from topics import load_topics
+
+
+JIRA_CONCURRENCY = int(os.environ.get("JIRA_CONCURRENCY", "10"))
+JIRA_MAX_RETRIES = int(os.environ.get("JIRA_MAX_RETRIES", "3"))
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Status codes Jira uses for rate limiting / temporary overload.
+RETRYABLE_STATUS_CODES = {429, 503}
+
+
+class JiraAPIError(Exception):
+    """Raised when Jira answers with a non-retryable error status."""
+
+
+class AsyncJiraClient:
+    """
+    Small async Jira client with a shared connection pool and a semaphore
+    that bounds the number of in-flight requests.
+    """
+
+    def __init__(
+        self,
+        base_url: str = JIRA_BASE_URL,
+        email: str = JIRA_EMAIL,
+        api_token: str = JIRA_API_TOKEN,
+        concurrency: int = JIRA_CONCURRENCY,
+        max_retries: int = JIRA_MAX_RETRIES,
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._max_retries = max_retries
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            auth=(email, api_token),
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+            ),
+            timeout=30,
+        )
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def jira_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_body: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+        allowed_errors: Iterable[int] = (),
+    ) -> Dict[str, Any]:
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                response = await self._client.request(
+                    method, path, json=json_body, content=data, params=params
+                )
+
+            if (
+                response.status_code in RETRYABLE_STATUS_CODES
+                and attempt < self._max_retries
+            ):
+                attempt += 1
+                # Sleep outside the semaphore so other requests can proceed.
+                await asyncio.sleep(_retry_delay(response, attempt))
+                continue
+
+            if response.status_code >= 400 and response.status_code not in allowed_errors:
+                print(
+                    f"Jira API error: {response.status_code} {response.reason_phrase}",
+                    file=sys.stderr,
+                )
+                try:
+                    print(
+                        json.dumps(response.json(), indent=2, ensure_ascii=False),
+                        file=sys.stderr,
+                    )
+                except Exception:
+                    print(response.text, file=sys.stderr)
+                raise JiraAPIError(f"{method} {path} -> {response.status_code}")
+
+            if response.text.strip():
+                return response.json()
+            return {}
+
+    async def create_issue(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        payload = adf.issue_payload(fields)
+        return await self.jira_request("POST", "/rest/api/3/issue", data=payload)
+
+    async def create_issues_bulk(self, body: bytes) -> Dict[str, Any]:
+        """
+        Send one body built by adf.bulk_payloads(). Jira answers 201 when every
+        issue was created and 400 with per-element ``errors`` when some failed,
+        so the response is returned as-is instead of raising on 400.
+        """
+        return await self.jira_request(
+            "POST", "/rest/api/3/issue/bulk", data=body, allowed_errors=(400,)
+        )
+
+    async def update_issue(self, issue_key: str, fields: Dict[str, Any]) -> None:
+        payload = adf.issue_payload(editable_fields(fields))
+        await self.jira_request("PUT", f"/rest/api/3/issue/{issue_key}", data=payload)
+
+    async def create_epic(self, summary: str) -> str:
+        result = await self.create_issue(build_epic_fields(summary))
+        epic_key = result["key"]
+        print(f"Created epic: {epic_key}")
+        return epic_key
+
+    async def create_child_issue(self, epic_key: str, topic: Dict[str, Any]) -> str:
+        result = await self.create_issue(build_child_fields(epic_key, topic))
+        issue_key = result["key"]
+        print(f"Created child issue: {issue_key} - {topic['title']}")
+        return issue_key
+
+    async def sync_epic(self, journal: SyncJournal, summary: str) -> str:
+        decision = journal.decide(epic_item_id(summary), build_epic_fields(summary))
+        if decision.action == CREATE:
+            epic_key = await self.create_epic(summary)
+        elif decision.action == SKIP:
+            epic_key = decision.issue_key
+            print(f"Epic unchanged: {epic_key}")
+        else:
+            epic_key = decision.issue_key
+            await self.update_issue(epic_key, build_epic_fields(summary))
+            print(f"Updated epic: {epic_key}")
+        journal.record(decision.item_id, epic_key, decision.content_hash)
+        return epic_key
+
+    async def sync_child_issue(
+        self, journal: SyncJournal, epic_key: str, topic: Dict[str, Any]
+    ) -> str:
+        fields = build_child_fields(epic_key, topic)
+        decision = journal.decide(topic_item_id(topic), fields)
+        if decision.action == CREATE:
+            issue_key = await self.create_child_issue(epic_key, topic)
+        elif decision.action == SKIP:
+            return SKIP
+        else:
+            issue_key = decision.issue_key
+            await self.update_issue(issue_key, fields)
+            print(f"Updated child issue: {issue_key} - {topic['title']}")
+        # Recorded as soon as each request finishes, so completed work survives a crash.
+        journal.record(decision.item_id, issue_key, decision.content_hash)
+        return decision.action
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    retry_after = response.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return min(2.0 ** attempt, 30.0)
+
+
+async def bounded_as_completed(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int,
+) -> AsyncIterator[R]:
+    """
+    Run ``func`` over ``items`` with at most ``limit`` tasks alive at a time and
+    yield results as they complete. ``items`` is consumed lazily, so a streamed
+    topic file is never materialized.
+    """
+    pending: set[asyncio.Task] = set()
+    try:
+        for item in items:
+            pending.add(asyncio.ensure_future(func(item)))
+            if len(pending) >= limit:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def create_learning_epic(
+    client: AsyncJiraClient,
+    epic_summary: str,
+    topics: Iterable[Dict[str, Any]],
+) -> tuple[str, List[str]]:
+    # The epic must exist before its children can reference it as parent.
+    epic_key = await client.create_epic(epic_summary)
+    created = [
+        issue_key
+        async for issue_key in bounded_as_completed(
+            lambda topic: client.create_child_issue(epic_key, topic),
+            topics,
+            JIRA_CONCURRENCY * 2,
+        )
+    ]
+    return epic_key, created
+
+
+async def sync_learning_epic(
+    client: AsyncJiraClient,
+    journal: SyncJournal,
+    epic_summary: str,
+    topics: Iterable[Dict[str, Any]],
+) -> tuple[str, Dict[str, int]]:
+    epic_key = await client.sync_epic(journal, epic_summary)
+    actions = {"create": 0, "update": 0, "skip": 0}
+    async for action in bounded_as_completed(
+        lambda topic: client.sync_child_issue(journal, epic_key, topic),
+        topics,
+        JIRA_CONCURRENCY * 2,
+    ):
+        actions[action] += 1
+    return epic_key, actions
+
+
+async def async_main() -> None:
+    require_env("JIRA_BASE_URL", JIRA_BASE_URL)
+    require_env("JIRA_EMAIL", JIRA_EMAIL)
+    require_env("JIRA_API_TOKEN", JIRA_API_TOKEN)
+    require_env("JIRA_PROJECT_KEY", JIRA_PROJECT_KEY)
+
+    with SyncJournal(JIRA_JOURNAL_PATH, scope=journal_scope()) as journal:
+        async with AsyncJiraClient() as client:
+            epic_key, actions = await sync_learning_epic(
+                client, journal, EPIC_SUMMARY, load_topics(JIRA_TOPICS_FILE)
+            )
+
+    print_summary(epic_key, actions)
+
+
+def main() -> None:
+    try:
+        asyncio.run(async_main())
+    except JiraAPIError:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Replay a plan written by plan_learning_epic.py against Jira.
+
+The epic is created first; child issues are then sent through the bulk create
+endpoint (50 per request) with up to JIRA_CONCURRENCY requests in flight. The
+journal from create_learning_epic.py is honoured, so already-created issues are
+skipped and changed ones updated, and an interrupted replay can be re-run.
+
+Usage:
+  export JIRA_BASE_URL="https://your-domain.atlassian.net"
+  export JIRA_EMAIL="you@example.com"
+  export JIRA_API_TOKEN="your_api_token"
+
+  python execute_plan.py [learning_epic.plan.jsonl]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from typing import Any, Dict, Iterator, List, Tuple
+
+import adf
+from create_learning_epic import (
+    JIRA_API_TOKEN,
+    JIRA_BASE_URL,
+    JIRA_EMAIL,
+    JIRA_JOURNAL_PATH,
+    print_summary,
+    require_env,
+)
+from create_learning_epic_async import (
+    JIRA_CONCURRENCY,
+    AsyncJiraClient,
+    JiraAPIError,
+    bounded_as_completed,
+)
+from journal import CREATE, SKIP, UPDATE, SyncDecision, SyncJournal
+from plan_learning_epic import DEFAULT_PLAN_PATH, PLAN_EPIC_KEY
+
+# ("bulk", [(decision, fields), ...]) or ("update", [(decision, fields)]).
+WorkUnit = Tuple[str, List[Tuple[SyncDecision, Dict[str, Any]]]]
+
+
+def read_plan(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, "rb") as plan:
+        for line in plan:
+            if line.strip():
+                yield json.loads(line)
+
+
+def resolve_parent(fields: Dict[str, Any], epic_key: str) -> Dict[str, Any]:
+    if fields.get("parent") == {"key": PLAN_EPIC_KEY}:
+        return {**fields, "parent": {"key": epic_key}}
+    return fields
+
+
+async def replay_epic(
+    client: AsyncJiraClient, journal: SyncJournal, entry: Dict[str, Any]
+) -> str:
+    fields = entry["fields"]
+    decision = journal.decide(entry["item_id"], fields)
+    if decision.action == CREATE:
+        epic_key = (await client.create_issue(fields))["key"]
+        print(f"Created epic: {epic_key}")
+    elif decision.action == SKIP:
+        epic_key = decision.issue_key
+        print(f"Epic unchanged: {epic_key}")
+    else:
+        epic_key = decision.issue_key
+        await client.update_issue(epic_key, fields)
+        print(f"Updated epic: {epic_key}")
+    journal.record(decision.item_id, epic_key, decision.content_hash)
+    return epic_key
+
+
+def plan_work(
+    journal: SyncJournal,
+    children: Iterator[Dict[str, Any]],
+    epic_key: str,
+    actions: Dict[str, int],
+) -> Iterator[WorkUnit]:
+    """
+    Turn the child entries of a plan into bulk create batches and single
+    updates, counting skipped items in ``actions`` as they are seen.
+    """
+    batch: List[Tuple[SyncDecision, Dict[str, Any]]] = []
+    for entry in children:
+        fields = resolve_parent(entry["fields"], epic_key)
+        decision = journal.decide(entry["item_id"], fields)
+        if decision.action == SKIP:
+            actions[SKIP] += 1
+        elif decision.action == UPDATE:
+            yield "update", [(decision, fields)]
+        else:
+            batch.append((decision, fields))
+            if len(batch) == adf.BULK_CREATE_LIMIT:
+                yield "bulk", batch
+                batch = []
+    if batch:
+        yield "bulk", batch
+
+
+async def run_unit(
+    client: AsyncJiraClient, journal: SyncJournal, unit: WorkUnit
+) -> Dict[str, int]:
+    kind, items = unit
+    if kind == "update":
+        decision, fields = items[0]
+        await client.update_issue(decision.issue_key, fields)
+        journal.record(decision.item_id, decision.issue_key, decision.content_hash)
+        print(f"Updated child issue: {decision.issue_key} - {fields['summary']}")
+        return {UPDATE: 1}
+
+    body = next(adf.bulk_payloads(adf.encode(fields) for _, fields in items))
+    result = await client.create_issues_bulk(body)
+
+    # Created issues are listed in request order, skipping the failed elements.
+    errors = {
+        error.get("failedElementNumber"): error for error in result.get("errors", [])
+    }
+    created = iter(result.get("issues", []))
+    counts = {CREATE: 0, "failed": 0}
+    for index, (decision, fields) in enumerate(items):
+        issue = None if index in errors else next(created, None)
+        if issue is None:
+            counts["failed"] += 1
+            detail = errors.get(index, result.get("errorMessages", result))
+            print(
+                f"Failed to create: {fields['summary']}: "
+                f"{json.dumps(detail, ensure_ascii=False)}",
+                file=sys.stderr,
+            )
+            continue
+        journal.record(decision.item_id, issue["key"], decision.content_hash)
+        counts[CREATE] += 1
+        print(f"Created child issue: {issue['key']} - {fields['summary']}")
+    return counts
+
+
+async def execute_plan(
+    client: AsyncJiraClient, journal_path: str, path: str
+) -> Tuple[str, Dict[str, int]]:
+    entries = read_plan(path)
+    epic_entry = next(entries)
+    if epic_entry.get("kind") != "epic":
+        raise ValueError(f"{path}: plan must start with the epic entry")
+
+    project_key = epic_entry["fields"]["project"]["key"]
+    actions = {CREATE: 0, UPDATE: 0, SKIP: 0, "failed": 0}
+    with SyncJournal(journal_path, scope=f"{JIRA_BASE_URL}/{project_key}") as journal:
+        epic_key = await replay_epic(client, journal, epic_entry)
+        children = (entry for entry in entries if entry.get("kind") == "child")
+        async for counts in bounded_as_completed(
+            lambda unit: run_unit(client, journal, unit),
+            plan_work(journal, children, epic_key, actions),
+            JIRA_CONCURRENCY,
+        ):
+            for action, count in counts.items():
+                actions[action] += count
+    return epic_key, actions
+
+
+async def async_main(path: str) -> int:
+    async with AsyncJiraClient() as client:
+        epic_key, actions = await execute_plan(client, JIRA_JOURNAL_PATH, path)
+
+    print_summary(epic_key, actions)
+    if actions["failed"]:
+        print(f"Failed to create {actions['failed']} child issues.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main() -> None:
+    require_env("JIRA_BASE_URL", JIRA_BASE_URL)
+    require_env("JIRA_EMAIL", JIRA_EMAIL)
+    require_env("JIRA_API_TOKEN", JIRA_API_TOKEN)
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PLAN_PATH
+
+    try:
+        sys.exit(asyncio.run(async_main(path)))
+    except JiraAPIError:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
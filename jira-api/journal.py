@@ -0,0 +1,133 @@
+"""
+Local state journal for the Jira scripts.
+
+Every issue the scripts create is recorded in a small SQLite file together with
+a hash of the fields that were sent. Re-runs consult the journal and only talk
+to Jira for items that are new or whose content changed, so an interrupted run
+can simply be started again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import adf
+
+
+CREATE = "create"
+UPDATE = "update"
+SKIP = "skip"
+
+# Fields that can be sent to the edit issue endpoint. project and issuetype
+# are fixed once an issue exists.
+EDITABLE_FIELDS = ("summary", "description", "labels", "parent")
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    issue_key: str
+    content_hash: str
+
+
+@dataclass(frozen=True)
+class SyncDecision:
+    action: str
+    item_id: str
+    content_hash: str
+    issue_key: Optional[str] = None
+
+
+def content_hash(fields: Dict[str, Any]) -> str:
+    # adf.encode sorts keys, so the hash does not depend on field order.
+    return hashlib.sha256(adf.encode(fields)).hexdigest()
+
+
+def editable_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: fields[name] for name in EDITABLE_FIELDS if name in fields}
+
+
+def epic_item_id(summary: str) -> str:
+    return f"epic:{summary}"
+
+
+def topic_item_id(topic: Dict[str, Any]) -> str:
+    return f"topic:{topic['title']}"
+
+
+class SyncJournal:
+    """
+    Maps item ids (an epic summary or a topic title) to the Jira issue created
+    for them, scoped to one Jira site and project.
+    """
+
+    def __init__(self, path: str, scope: str) -> None:
+        self.scope = scope
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS issues (
+                scope TEXT NOT NULL,
+                item_id TEXT NOT NULL,
+                issue_key TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (scope, item_id)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "SyncJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def lookup(self, item_id: str) -> Optional[JournalEntry]:
+        row = self._conn.execute(
+            "SELECT issue_key, content_hash FROM issues WHERE scope = ? AND item_id = ?",
+            (self.scope, item_id),
+        ).fetchone()
+        if row is None:
+            return None
+        return JournalEntry(issue_key=row[0], content_hash=row[1])
+
+    def record(self, item_id: str, issue_key: str, digest: str) -> None:
+        # Commit per item so a crash never loses an issue that was already created.
+        self._conn.execute(
+            """
+            INSERT INTO issues (scope, item_id, issue_key, content_hash, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (scope, item_id) DO UPDATE SET
+                issue_key = excluded.issue_key,
+                content_hash = excluded.content_hash,
+                updated_at = excluded.updated_at
+            """,
+            (
+                self.scope,
+                item_id,
+                issue_key,
+                digest,
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        self._conn.commit()
+
+    def decide(self, item_id: str, fields: Dict[str, Any]) -> SyncDecision:
+        """
+        Compare ``fields`` with what was last sent for ``item_id``.
+        """
+        digest = content_hash(fields)
+        entry = self.lookup(item_id)
+        if entry is None:
+            return SyncDecision(CREATE, item_id, digest)
+        if entry.content_hash == digest:
+            return SyncDecision(SKIP, item_id, digest, entry.issue_key)
+        return SyncDecision(UPDATE, item_id, digest, entry.issue_key)
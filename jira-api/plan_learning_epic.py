@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Dry run: write everything create_learning_epic.py would send to a plan file,
+without touching the network.
+
+The plan is a JSON Lines file:
+  {"kind": "epic", "item_id": ..., "fields": {...}}
+  {"kind": "child", "item_id": ..., "fields": {...}}   # one per topic
+  {"kind": "summary", ...}                            # counts, sizes, estimates
+
+Child issues reference the epic through the PLAN_EPIC_KEY placeholder, which
+execute_plan.py replaces with the real key once the epic exists.
+
+Usage:
+  export JIRA_PROJECT_KEY="ENG"
+  python plan_learning_epic.py [learning_epic.plan.jsonl]
+
+Optional env vars: the ones supported by create_learning_epic.py, plus
+  export JIRA_CONCURRENCY="10"   # used for the round estimates
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+from typing import Any, Dict
+
+import adf
+from create_learning_epic import (
+    EPIC_SUMMARY,
+    JIRA_PROJECT_KEY,
+    JIRA_TOPICS_FILE,
+    build_child_fields,
+    build_epic_fields,
+    require_env,
+)
+from journal import epic_item_id, topic_item_id
+from topics import load_topics
+
+
+JIRA_CONCURRENCY = int(os.environ.get("JIRA_CONCURRENCY", "10"))
+DEFAULT_PLAN_PATH = "learning_epic.plan.jsonl"
+
+PLAN_EPIC_KEY = "${EPIC_KEY}"
+
+# Bytes adf.bulk_payloads() adds around each request body.
+_BULK_BODY_OVERHEAD = len(b'{"issueUpdates":[]}')
+
+
+def estimate_calls(children: int, concurrency: int) -> Dict[str, Any]:
+    """
+    API calls and sequential request rounds needed to create the epic plus
+    ``children`` issues, one by one or through the bulk endpoint.
+    """
+    bulk_requests = math.ceil(children / adf.BULK_CREATE_LIMIT)
+    return {
+        "concurrency": concurrency,
+        "single": {
+            "api_calls": 1 + children,
+            "rounds": 1 + math.ceil(children / concurrency),
+        },
+        "bulk": {
+            "api_calls": 1 + bulk_requests,
+            "rounds": 1 + math.ceil(bulk_requests / concurrency),
+        },
+    }
+
+
+def bulk_payload_bytes(child_bytes: int, children: int, bulk_requests: int) -> int:
+    # child_bytes counts full issue_payload() bodies, which already include the
+    # '{"fields":...}' wrapper; only the commas between items are extra.
+    commas = children - bulk_requests
+    return child_bytes + commas + bulk_requests * _BULK_BODY_OVERHEAD
+
+
+def write_plan(path: str) -> Dict[str, Any]:
+    children = 0
+    child_bytes = 0
+    largest_child = 0
+
+    with open(path, "wb") as plan:
+        epic_fields = build_epic_fields(EPIC_SUMMARY)
+        epic_bytes = len(adf.issue_payload(epic_fields))
+        plan.write(
+            adf.encode(
+                {
+                    "kind": "epic",
+                    "item_id": epic_item_id(EPIC_SUMMARY),
+                    "fields": epic_fields,
+                }
+            )
+            + b"\n"
+        )
+
+        for topic in load_topics(JIRA_TOPICS_FILE):
+            fields = build_child_fields(PLAN_EPIC_KEY, topic)
+            size = len(adf.issue_payload(fields))
+            children += 1
+            child_bytes += size
+            largest_child = max(largest_child, size)
+            plan.write(
+                adf.encode(
+                    {"kind": "child", "item_id": topic_item_id(topic), "fields": fields}
+                )
+                + b"\n"
+            )
+
+        bulk_requests = math.ceil(children / adf.BULK_CREATE_LIMIT)
+        summary = {
+            "kind": "summary",
+            "project": JIRA_PROJECT_KEY,
+            "topics_file": JIRA_TOPICS_FILE,
+            "epic": EPIC_SUMMARY,
+            "children": children,
+            "payload_bytes": {
+                "epic": epic_bytes,
+                "children_total": child_bytes,
+                "children_largest": largest_child,
+                "bulk_total": bulk_payload_bytes(child_bytes, children, bulk_requests),
+            },
+            "estimate": estimate_calls(children, JIRA_CONCURRENCY),
+        }
+        plan.write(adf.encode(summary) + b"\n")
+
+    return summary
+
+
+def main() -> None:
+    require_env("JIRA_PROJECT_KEY", JIRA_PROJECT_KEY)
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PLAN_PATH
+
+    summary = write_plan(path)
+
+    print(f"Wrote plan: {path}")
+    print(json.dumps({k: v for k, v in summary.items() if k != "kind"}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Lazy topic loading for the Jira scripts.
+
+Topics are read from YAML, JSON or CSV files and yielded one at a time, each
+validated against TOPIC_SCHEMA. Formats that can be parsed incrementally are
+streamed, so catalogs with tens of thousands of topics never need to fit in
+memory at once:
+
+  .yaml / .yml  one topic per YAML document (separated by ``---``); a single
+                document holding a list of topics is also accepted
+  .jsonl        one JSON object per line
+  .json         a JSON array of topics (parsed in one go)
+  .csv          one topic per row; list columns are separated by ``|``
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+
+# field name -> expected type; list fields must hold non-empty strings.
+TOPIC_SCHEMA: Dict[str, type] = {
+    "title": str,
+    "area": str,
+    "practical_usage": list,
+    "subtopics": list,
+    "goal_criteria": list,
+}
+
+CSV_LIST_SEPARATOR = "|"
+
+
+class TopicValidationError(ValueError):
+    """Raised when a topic does not match TOPIC_SCHEMA."""
+
+
+def validate_topic(topic: Any, location: str) -> Dict[str, Any]:
+    if not isinstance(topic, dict):
+        raise TopicValidationError(
+            f"{location}: expected a mapping, got {type(topic).__name__}"
+        )
+
+    missing = [name for name in TOPIC_SCHEMA if name not in topic]
+    if missing:
+        raise TopicValidationError(f"{location}: missing field(s) {', '.join(missing)}")
+
+    for name, expected in TOPIC_SCHEMA.items():
+        value = topic[name]
+        if not isinstance(value, expected):
+            raise TopicValidationError(
+                f"{location}: field '{name}' must be {expected.__name__}, "
+                f"got {type(value).__name__}"
+            )
+        if expected is str and not value.strip():
+            raise TopicValidationError(f"{location}: field '{name}' must not be empty")
+        if expected is list and not all(
+            isinstance(item, str) and item.strip() for item in value
+        ):
+            raise TopicValidationError(
+                f"{location}: field '{name}' must only contain non-empty strings"
+            )
+
+    return topic
+
+
+def load_topics(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield validated topics from ``path``. The file format is picked from the extension.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    readers = {
+        ".yaml": _read_yaml,
+        ".yml": _read_yaml,
+        ".jsonl": _read_jsonl,
+        ".json": _read_json,
+        ".csv": _read_csv,
+    }
+    if extension not in readers:
+        raise ValueError(f"Unsupported topics file format: {path}")
+
+    for location, topic in readers[extension](path):
+        yield validate_topic(topic, f"{path}:{location}")
+
+
+def _read_yaml(path: str) -> Iterable[Tuple[str, Any]]:
+    import yaml
+
+    with open(path, encoding="utf-8") as file:
+        for doc_index, document in enumerate(yaml.safe_load_all(file)):
+            if document is None:
+                continue
+            if isinstance(document, list):
+                for item_index, topic in enumerate(document):
+                    yield f"doc {doc_index} item {item_index}", topic
+            else:
+                yield f"doc {doc_index}", document
+
+
+def _read_jsonl(path: str) -> Iterable[Tuple[str, Any]]:
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if line.strip():
+                yield f"line {line_number}", json.loads(line)
+
+
+def _read_json(path: str) -> Iterable[Tuple[str, Any]]:
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+    if not isinstance(document, list):
+        raise TopicValidationError(f"{path}: expected a JSON array of topics")
+    for index, topic in enumerate(document):
+        yield f"item {index}", topic
+
+
+def _read_csv(path: str) -> Iterable[Tuple[str, Any]]:
+    with open(path, encoding="utf-8", newline="") as file:
+        reader = csv.DictReader(file)
+        for topic in reader:
+            for name, expected in TOPIC_SCHEMA.items():
+                if expected is list and isinstance(topic.get(name), str):
+                    topic[name] = [
+                        item.strip()
+                        for item in topic[name].split(CSV_LIST_SEPARATOR)
+                        if item.strip()
+                    ]
+            # line_num points at the last physical line read for this row.
+            yield f"line {reader.line_num}", topic
@@ -0,0 +1,94 @@
+"""
+Daily ingestion: rewriting each device file versus append_partitions + compact.
+
+    python benchmarks/bench_append.py [--devices 20] [--metrics 60000] [--days 5]
+
+Each "day" adds one new timestamp for every metric of every device. The
+notebook way reads each device file, appends the day and rewrites the file,
+so a day costs O(history); append_partitions writes one small delta per
+device. Reads of 3 devices x 10 metrics are timed with the deltas pending and
+after compact().
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import polars as pl  # noqa: E402
+
+from device_store.compaction import compact  # noqa: E402
+from device_store.generator import DatasetSpec, generate_polars, metric_name  # noqa: E402
+from device_store.loader import load_devices  # noqa: E402
+from device_store.writer import append_partitions, storage_frame, write_partitions  # noqa: E402
+
+
+def legacy_append_day(day_df, base_dir):
+    # Read, extend and rewrite every device file, as the notebook's layout requires.
+    for device in day_df.select("device").unique().to_series().to_list():
+        path = os.path.join(base_dir, f"{device}.parquet")
+        new_rows = storage_frame(day_df.filter(pl.col("device") == device))
+        pl.concat([pl.read_parquet(path), new_rows]).write_parquet(path)
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--metrics", type=int, default=60_000)
+    parser.add_argument("--days", type=int, default=5)
+    args = parser.parse_args()
+
+    spec = DatasetSpec(devices=args.devices, metrics=args.metrics)
+    history = generate_polars(spec)
+    days = [
+        generate_polars(
+            DatasetSpec(
+                devices=args.devices, metrics=args.metrics, timestamps=1,
+                start=spec.start + spec.interval * (spec.timestamps + day), seed=100 + day,
+            )
+        )
+        for day in range(args.days)
+    ]
+    devices = ["device_0", "device_1", "device_2"]
+    metrics = [metric_name(m) for m in range(0, args.metrics, args.metrics // 10)][:10]
+
+    work_dir = tempfile.mkdtemp(prefix="bench-append-")
+    try:
+        legacy_dir = os.path.join(work_dir, "legacy")
+        store_dir = os.path.join(work_dir, "store")
+        os.makedirs(legacy_dir)
+        for (device,), part in history.partition_by("device", as_dict=True).items():
+            storage_frame(part).write_parquet(os.path.join(legacy_dir, f"{device}.parquet"))
+        write_partitions(history, store_dir)
+        del history
+
+        legacy_days = [timed(legacy_append_day, day, legacy_dir)[0] for day in days]
+        append_days = [timed(append_partitions, day, store_dir)[0] for day in days]
+        pending_read, before = timed(load_devices, store_dir, devices, metrics=metrics)
+        compact_seconds, _ = timed(compact, store_dir)
+        compacted_read, after = timed(load_devices, store_dir, devices, metrics=metrics)
+        assert before.sort(after.columns).equals(after.sort(after.columns))
+    finally:
+        shutil.rmtree(work_dir)
+
+    rows = days[0].height
+    print(f"{args.devices} devices x {spec.rows_per_device:,} rows of history, {rows:,} new rows per day")
+    print(f"rewrite every file:   {sum(legacy_days) / len(days):.2f}s per day")
+    print(f"append_partitions:    {sum(append_days) / len(days):.2f}s per day")
+    print(f"read, {args.days} deltas pending: {pending_read:.3f}s")
+    print(f"compact:              {compact_seconds:.2f}s")
+    print(f"read, compacted:      {compacted_read:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
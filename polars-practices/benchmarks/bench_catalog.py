@@ -0,0 +1,96 @@
+"""
+Loader queries with and without the store's catalog.
+
+    python benchmarks/bench_catalog.py [--devices 500] [--metrics 6000] [--store DIR]
+
+Builds a store of --devices devices, appends one day as deltas, and runs
+across all devices: the new day only, a metric that does not exist, and 10
+metrics over the whole range (nothing to skip, so the catalog is pure
+overhead). Each query runs on a cold page cache, then warm. Also times
+writing 20 devices with and without keeping the catalog.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import polars as pl  # noqa: E402
+
+from device_store.generator import DatasetSpec, generate_polars, iter_device_batches, metric_name  # noqa: E402
+from device_store.loader import catalog_skips, load_devices, snapshots  # noqa: E402
+from device_store.writer import WriteOptions, append_partitions, write_frames, write_partitions  # noqa: E402
+
+
+def evict(store):
+    for root, _, names in os.walk(store):
+        for name in names:
+            fd = os.open(os.path.join(root, name), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
+
+def timed_query(store, use_catalog, filters):
+    evict(store)
+    started = time.perf_counter()
+    rows = load_devices(store, use_catalog=use_catalog, **filters).height
+    cold = time.perf_counter() - started
+    started = time.perf_counter()
+    load_devices(store, use_catalog=use_catalog, **filters)
+    return rows, cold, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--metrics", type=int, default=6_000)
+    parser.add_argument("--store", default=os.path.join(tempfile.gettempdir(), "bench_catalog_store"))
+    args = parser.parse_args()
+
+    spec = DatasetSpec(devices=args.devices, metrics=args.metrics)
+    new_day = datetime(2024, 1, 1)
+    if not os.path.isdir(args.store):
+        write_frames((pl.from_arrow(batch) for batch in iter_device_batches(spec)), args.store)
+        day = DatasetSpec(devices=args.devices, metrics=args.metrics, timestamps=1, start=new_day, seed=1)
+        for batch in iter_device_batches(day):
+            append_partitions(pl.from_arrow(batch), args.store)
+
+    metrics = [metric_name(m) for m in range(0, args.metrics, args.metrics // 10)][:10]
+    queries = {
+        "new day, 10 metrics": {"metrics": metrics, "start": new_day},
+        "unknown metric": {"metrics": ["metric_unknown"]},
+        "10 metrics, all days": {"metrics": metrics},
+    }
+    snaps = snapshots(args.store)
+    total_files = sum(len(snap.files) for snap in snaps)
+    print(f"{args.devices} devices, {total_files} files")
+    print(f"{'query':<22} {'catalog':>7} {'files':>6} {'rows':>8} {'cold s':>7} {'warm s':>7}")
+    for label, filters in queries.items():
+        for use_catalog in (False, True):
+            skipped = len(catalog_skips(args.store, snaps, **filters)) if use_catalog else 0
+            rows, cold, warm = timed_query(args.store, use_catalog, filters)
+            print(
+                f"{label:<22} {'yes' if use_catalog else 'no':>7} {total_files - skipped:>6} "
+                f"{rows:>8,} {cold:>7.3f} {warm:>7.3f}"
+            )
+
+    df = generate_polars(DatasetSpec(devices=20, metrics=args.metrics))
+    for catalog in (False, True):
+        work_dir = tempfile.mkdtemp(prefix="bench-catalog-")
+        try:
+            started = time.perf_counter()
+            write_partitions(df, work_dir, WriteOptions(catalog=catalog))
+            print(f"write 20 devices, catalog={catalog}: {time.perf_counter() - started:.2f}s")
+        finally:
+            shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
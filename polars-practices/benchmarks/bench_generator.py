@@ -0,0 +1,95 @@
+"""
+Notebook generate_data() versus device_store.generator.
+
+    python benchmarks/bench_generator.py [--devices 1] [--stream-devices 100]
+
+Each case runs in a fresh interpreter so its peak RSS is its own. The legacy
+loop is run on --devices devices only (it takes ~10 s and GBs per device at
+60k metrics); the vectorized one is timed on the same size, on the notebook's
+20 devices, and streamed over --stream-devices devices without materializing.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np  # noqa: E402
+import polars as pl  # noqa: E402
+
+from device_store.generator import DatasetSpec, generate_polars, iter_device_batches  # noqa: E402
+
+
+def legacy_generate_data(devices, metrics=60_000, timestamps=20):
+    # The notebook's implementation, parameterized.
+    records = []
+    start_date = datetime(2023, 10, 1)
+    for d in range(devices):
+        device = f"device_{d}"
+        for m in range(metrics):
+            metric = f"metric_{m}"
+            for i in range(timestamps):
+                timestamp = start_date + timedelta(days=i)
+                value = np.random.rand()
+                value2 = np.random.rand() if i < timestamps - 1 else None
+                records.append((device, metric, timestamp, value, value2))
+    return pl.DataFrame(
+        records, schema=["device", "metric", "timestamp", "value", "value2"], orient="row"
+    )
+
+
+def run_case(case, devices):
+    started = time.perf_counter()
+    if case == "legacy":
+        rows = legacy_generate_data(devices).height
+    elif case == "vectorized":
+        rows = generate_polars(DatasetSpec(devices=devices)).height
+    else:
+        rows = sum(batch.num_rows for batch in iter_device_batches(DatasetSpec(devices=devices)))
+    return {
+        "case": case,
+        "devices": devices,
+        "rows": rows,
+        "seconds": time.perf_counter() - started,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--stream-devices", type=int, default=100)
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.devices)))
+        return
+
+    cases = [
+        ("legacy", args.devices),
+        ("vectorized", args.devices),
+        ("vectorized", 20),
+        ("streamed", args.stream_devices),
+    ]
+    print(f"{'case':<11} {'devices':>7} {'rows':>12} {'seconds':>8} {'peak RSS MB':>12}")
+    for case, devices in cases:
+        output = subprocess.run(
+            [sys.executable, __file__, "--case", case, "--devices", str(devices)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output)
+        print(
+            f"{case:<11} {devices:>7} {result['rows']:>12,} {result['seconds']:>8.2f} "
+            f"{result['peak_rss_mb']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
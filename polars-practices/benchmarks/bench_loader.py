@@ -0,0 +1,125 @@
+"""
+Notebook load_devices_lazy() versus device_store.loader.scan_devices.
+
+    python benchmarks/bench_loader.py [--devices 500] [--metrics 60000] [--store DIR]
+
+Selects 3 devices and 10 metrics (plus, in the last case, a 2-day window).
+The store is generated into --store on the first run (500 devices x 60k
+metrics is ~9 GB and takes a few minutes) and reused afterwards. Before each
+case the store is dropped from the page cache, so "MB read" is what the case
+actually read from disk (/proc/self/io read_bytes, including readahead);
+"warm" is the same query run again.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import polars as pl  # noqa: E402
+
+from device_store.generator import DatasetSpec, iter_device_batches, metric_name  # noqa: E402
+from device_store.loader import scan_devices  # noqa: E402
+from device_store.writer import list_devices, partition_path, write_frames  # noqa: E402
+
+DEVICES = ["device_1", "device_250", "device_499"]
+COLUMNS = ["device", "metric", "timestamp", "value"]
+
+
+def legacy_load_devices_lazy(devices, base_dir):
+    # The notebook's implementation, reading the writer's layout.
+    lazy_dfs = []
+    for device in devices:
+        path = partition_path(base_dir, device)
+        if path is not None:
+            lazy_dfs.append(
+                pl.read_parquet(path, use_pyarrow=True).lazy().with_columns(pl.lit(device).alias("device"))
+            )
+    return pl.concat(lazy_dfs)
+
+
+def query(case, store, metrics):
+    if case == "notebook":
+        return (
+            legacy_load_devices_lazy(DEVICES, store)
+            .filter(pl.col("metric").cast(pl.String).is_in(metrics))
+            .select(COLUMNS)
+        )
+    if case == "devices":
+        return scan_devices(store, DEVICES)
+    if case == "devices+metrics":
+        return scan_devices(store, DEVICES, metrics=metrics, columns=COLUMNS)
+    return scan_devices(
+        store, DEVICES, metrics=metrics, start=datetime(2023, 10, 5), end=datetime(2023, 10, 7), columns=COLUMNS
+    )
+
+
+def evict(store):
+    for root, _, names in os.walk(store):
+        for name in names:
+            fd = os.open(os.path.join(root, name), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
+
+def read_bytes():
+    with open("/proc/self/io") as io:
+        return next(int(line.split()[1]) for line in io if line.startswith("read_bytes"))
+
+
+def run_case(case, store, metrics):
+    evict(store)
+    before = read_bytes()
+    started = time.perf_counter()
+    rows = query(case, store, metrics).collect().height
+    cold = time.perf_counter() - started
+    read = read_bytes() - before
+    started = time.perf_counter()
+    query(case, store, metrics).collect()
+    warm = time.perf_counter() - started
+    return {"case": case, "rows": rows, "cold": cold, "warm": warm, "mb_read": read / 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--metrics", type=int, default=60_000)
+    parser.add_argument("--store", default=os.path.join(tempfile.gettempdir(), "bench_device_store"))
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    # 10 metrics spread over the whole range.
+    metrics = [metric_name(m) for m in range(0, args.metrics, args.metrics // 10)][:10]
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.store, metrics)))
+        return
+
+    if len(list_devices(args.store)) < args.devices:
+        spec = DatasetSpec(devices=args.devices, metrics=args.metrics)
+        started = time.perf_counter()
+        write_frames((pl.from_arrow(batch) for batch in iter_device_batches(spec)), args.store)
+        print(f"wrote {spec.rows:,} rows to {args.store} in {time.perf_counter() - started:.0f}s")
+
+    print(f"{'case':<24} {'rows':>10} {'MB read':>9} {'cold s':>7} {'warm s':>7}")
+    for case in ["notebook", "devices", "devices+metrics", "devices+metrics+time"]:
+        output = subprocess.run(
+            [sys.executable, __file__, "--case", case, "--store", args.store, "--metrics", str(args.metrics)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output)
+        print(
+            f"{case:<24} {result['rows']:>10,} {result['mb_read']:>9.1f} "
+            f"{result['cold']:>7.3f} {result['warm']:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
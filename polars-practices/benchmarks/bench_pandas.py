@@ -0,0 +1,146 @@
+"""
+The notebook's pandas pipeline versus device_store.pandas_pipeline versus
+the polars pipeline, on the same store.
+
+    python benchmarks/bench_pandas.py [--devices 20] [--selected 3] [--store DIR]
+
+For --selected devices each case loads (all columns, or 10 metrics), doubles
+``value``, takes the mean per device and writes the devices to a scratch
+directory. The notebook case keeps ``device`` / ``metric`` as object strings,
+as pandas 2 read them (pandas 3 would read them as Arrow-backed ``str``).
+Each case runs in a fresh interpreter so its peak RSS is its own.
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pandas as pd  # noqa: E402
+import polars as pl  # noqa: E402
+
+from device_store.generator import DatasetSpec, device_name, iter_device_batches, metric_name  # noqa: E402
+from device_store.loader import load_devices  # noqa: E402
+from device_store.pandas_pipeline import (  # noqa: E402
+    double_values_pandas,
+    load_devices_pandas,
+    write_partitions_pandas,
+)
+from device_store.writer import list_devices, partition_path, write_frames, write_partitions  # noqa: E402
+
+CASES = ["notebook", "pandas_pipeline", "polars"]
+
+
+def legacy_load(devices, base_dir, metrics):
+    # The notebook's pandas load_devices, with object strings.
+    dfs = []
+    for device in devices:
+        path = partition_path(base_dir, device)
+        if path is not None:
+            df = pd.read_parquet(path).astype({"metric": object})
+            df["device"] = pd.Series([device] * len(df), dtype=object)
+            dfs.append(df)
+    df = pd.concat(dfs, ignore_index=True)
+    return df if metrics is None else df[df["metric"].isin(metrics)].reset_index(drop=True)
+
+
+def legacy_save(df, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    for device, group in df.groupby("device"):
+        group.to_parquet(os.path.join(out_dir, f"{device}.parquet"), index=False)
+
+
+def frame_mb(df):
+    if isinstance(df, pl.DataFrame):
+        return df.estimated_size() / 2**20
+    return df.memory_usage(deep=True).sum() / 2**20
+
+
+def run_case(case, selected, store, filtered):
+    devices = [device_name(d) for d in range(selected)]
+    metrics = [metric_name(m) for m in range(0, 60_000, 6_000)] if filtered else None
+    out_dir = tempfile.mkdtemp(prefix="bench-pandas-")
+    timings = {}
+    try:
+        started = time.perf_counter()
+        if case == "notebook":
+            df = legacy_load(devices, store, metrics)
+        elif case == "pandas_pipeline":
+            df = load_devices_pandas(store, devices, metrics=metrics)
+        else:
+            df = load_devices(store, devices, metrics=metrics)
+        timings["load"] = time.perf_counter() - started
+        size = frame_mb(df)
+
+        started = time.perf_counter()
+        if case == "polars":
+            df = df.with_columns(pl.col("value") * 2)
+            df.group_by("device").agg(pl.col("value").mean())
+        else:
+            df = double_values_pandas(df) if case == "pandas_pipeline" else df.assign(value=df["value"] * 2)
+            df.groupby("device", observed=True)["value"].mean()
+        timings["modify+groupby"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if case == "notebook":
+            legacy_save(df, out_dir)
+        elif case == "pandas_pipeline":
+            write_partitions_pandas(df, out_dir)
+        else:
+            write_partitions(df, out_dir)
+        timings["write"] = time.perf_counter() - started
+    finally:
+        shutil.rmtree(out_dir)
+    return {
+        **timings,
+        "rows": len(df),
+        "frame_mb": size,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--selected", type=int, default=3)
+    parser.add_argument("--store", default=os.path.join(tempfile.gettempdir(), "bench_pandas_store"))
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--filtered", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.selected, args.store, args.filtered)))
+        return
+
+    if len(list_devices(args.store)) < args.selected:
+        spec = DatasetSpec(devices=max(args.devices, args.selected))
+        write_frames((pl.from_arrow(batch) for batch in iter_device_batches(spec)), args.store)
+
+    print(f"{args.selected} devices")
+    print(
+        f"{'case':<16} {'query':<10} {'rows':>10} {'load s':>7} {'groupby s':>9} "
+        f"{'write s':>7} {'frame MB':>8} {'peak RSS MB':>11}"
+    )
+    for filtered in (False, True):
+        for case in CASES:
+            command = [sys.executable, __file__, "--case", case, "--selected", str(args.selected), "--store", args.store]
+            output = subprocess.run(
+                command + (["--filtered"] if filtered else []), check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{case:<16} {'10 metrics' if filtered else 'all':<10} {result['rows']:>10,} "
+                f"{result['load']:>7.2f} {result['modify+groupby']:>9.3f} {result['write']:>7.2f} "
+                f"{result['frame_mb']:>8.0f} {result['peak_rss_mb']:>11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+transform_devices versus parallel_transform_devices on a GIL-bound transform.
+
+    python benchmarks/bench_parallel.py [--devices 8] [--metrics 60000] [--workers 1 2 4]
+
+The transform scores every ``value`` with a Python function
+(``map_elements``), the kind of per-device work Polars cannot spread over
+its threads. Each case runs in a fresh interpreter, transforming every
+device into a scratch directory; worker peak RSS is the largest of the
+case's child processes.
+"""
+
+import argparse
+import json
+import math
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import polars as pl  # noqa: E402
+
+from device_store.executor import PoolOptions, parallel_transform_devices  # noqa: E402
+from device_store.generator import DatasetSpec, iter_device_batches  # noqa: E402
+from device_store.pipeline import transform_devices  # noqa: E402
+from device_store.writer import list_devices, write_frames  # noqa: E402
+
+
+def _score(value):
+    return math.log1p(value) * math.sqrt(value) + math.sin(value * math.pi)
+
+
+def score_values(lazy_df):
+    return lazy_df.with_columns(pl.col("value").map_elements(_score, return_dtype=pl.Float64))
+
+
+def run_case(workers, store):
+    out_dir = tempfile.mkdtemp(prefix="bench-parallel-")
+    started = time.perf_counter()
+    try:
+        if workers == 0:
+            report = transform_devices(store, score_values, out_dir=out_dir)
+        else:
+            report = parallel_transform_devices(store, score_values, out_dir=out_dir, pool=PoolOptions(workers=workers))
+            assert not report.failed, report.failed
+    finally:
+        shutil.rmtree(out_dir)
+    return {
+        "seconds": time.perf_counter() - started,
+        "devices": len(report.written),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "worker_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=8)
+    parser.add_argument("--metrics", type=int, default=60_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--store", default=os.path.join(tempfile.gettempdir(), "bench_parallel_store"))
+    parser.add_argument("--case", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case is not None:
+        print(json.dumps(run_case(args.case, args.store)))
+        return
+
+    if len(list_devices(args.store)) < args.devices:
+        spec = DatasetSpec(devices=args.devices, metrics=args.metrics)
+        write_frames((pl.from_arrow(batch) for batch in iter_device_batches(spec)), args.store)
+
+    print(f"{os.cpu_count()} CPUs, {args.devices} devices x {args.metrics * 20:,} rows")
+    print(f"{'case':<22} {'seconds':>8} {'speedup':>8} {'peak RSS MB':>12} {'worker RSS MB':>14}")
+    baseline = None
+    for workers in [0] + args.workers:
+        output = subprocess.run(
+            [sys.executable, __file__, "--case", str(workers), "--store", args.store],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output)
+        baseline = baseline or result["seconds"]
+        label = "transform_devices" if workers == 0 else f"parallel, {workers} workers"
+        print(
+            f"{label:<22} {result['seconds']:>8.2f} {baseline / result['seconds']:>7.2f}x "
+            f"{result['peak_rss_mb']:>12.0f} {result['worker_rss_mb']:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
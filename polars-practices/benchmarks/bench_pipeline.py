@@ -0,0 +1,93 @@
+"""
+Notebook load/modify/save_modified_devices_lazy() versus
+device_store.pipeline.transform_devices.
+
+    python benchmarks/bench_pipeline.py [--selected 3 10 20] [--store DIR]
+
+Reads the store bench_loader.py generates (500 devices x 60k metrics; it is
+created here with --devices devices if missing), doubles ``value`` for the
+first N devices and writes them to a scratch directory. Each case runs in a
+fresh interpreter so its peak RSS is its own.
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import polars as pl  # noqa: E402
+
+from device_store.generator import DatasetSpec, device_name, iter_device_batches  # noqa: E402
+from device_store.pipeline import transform_devices  # noqa: E402
+from device_store.writer import list_devices, partition_path, write_frames  # noqa: E402
+
+
+def legacy_pipeline(devices, base_dir, out_dir):
+    # The notebook's load_devices_lazy / modify_data_lazy / save_modified_devices_lazy.
+    lazy_dfs = []
+    for device in devices:
+        path = partition_path(base_dir, device)
+        if path is not None:
+            lazy_dfs.append(
+                pl.read_parquet(path, use_pyarrow=True).lazy().with_columns(pl.lit(device).alias("device"))
+            )
+    lazy_df = pl.concat(lazy_dfs).with_columns([(pl.col("value") * 2).alias("value")])
+    df = lazy_df.collect()
+    os.makedirs(out_dir, exist_ok=True)
+    for device in df.select("device").unique().to_series().to_list():
+        df.filter(pl.col("device") == device).write_parquet(os.path.join(out_dir, f"{device}.parquet"))
+
+
+def run_case(case, selected, store):
+    devices = [device_name(d) for d in range(selected)]
+    out_dir = tempfile.mkdtemp(prefix="bench-pipeline-")
+    started = time.perf_counter()
+    try:
+        if case == "notebook":
+            legacy_pipeline(devices, store, out_dir)
+        else:
+            transform_devices(store, devices=devices, out_dir=out_dir)
+    finally:
+        shutil.rmtree(out_dir)
+    return {
+        "seconds": time.perf_counter() - started,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--selected", type=int, nargs="+", default=[3, 10, 20])
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--store", default=os.path.join(tempfile.gettempdir(), "bench_device_store"))
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.selected[0], args.store)))
+        return
+
+    if len(list_devices(args.store)) < max(args.selected):
+        spec = DatasetSpec(devices=max(args.devices, *args.selected))
+        write_frames((pl.from_arrow(batch) for batch in iter_device_batches(spec)), args.store)
+
+    print(f"{'case':<18} {'devices':>7} {'seconds':>8} {'peak RSS MB':>12}")
+    for selected in args.selected:
+        for case in ["notebook", "transform_devices"]:
+            output = subprocess.run(
+                [sys.executable, __file__, "--case", case, "--selected", str(selected), "--store", args.store],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output)
+            print(f"{case:<18} {selected:>7} {result['seconds']:>8.2f} {result['peak_rss_mb']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+DataFrame.pivot versus device_store.pivot for a timestamps x metrics matrix.
+
+    python benchmarks/bench_pivot.py [--devices 20] [--metrics 60000] [--wide 3] [--store DIR]
+
+Pivots ``value`` for one device and for --wide devices with Polars'
+``DataFrame.pivot`` (one column per metric) and with ``iter_pivots`` (dense,
+and sparse ``value2``), then every device into an ``.npy`` file with
+``pivot_to_memmap``. Times include reading the rows. Each case runs in a
+fresh interpreter so its peak RSS is its own.
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import polars as pl  # noqa: E402
+
+from device_store.generator import DatasetSpec, iter_device_batches  # noqa: E402
+from device_store.loader import load_devices  # noqa: E402
+from device_store.pivot import MetricIndex, iter_pivots, pivot_to_memmap  # noqa: E402
+from device_store.writer import list_devices, write_frames  # noqa: E402
+
+CASES = [
+    ("DataFrame.pivot", "one"),
+    ("iter_pivots dense", "one"),
+    ("iter_pivots sparse", "one"),
+    ("DataFrame.pivot", "wide"),
+    ("iter_pivots dense", "wide"),
+    ("pivot_to_memmap", "all"),
+]
+
+
+def run_case(case, devices, store):
+    devices = list_devices(store)[:devices]
+    started = time.perf_counter()
+    if case == "DataFrame.pivot":
+        df = load_devices(store, devices, columns=["device", "metric", "timestamp", "value"])
+        wide = df.pivot(on="metric", index=["device", "timestamp"], values="value")
+        cells = wide.height * (wide.width - 2)
+    elif case == "pivot_to_memmap":
+        work_dir = tempfile.mkdtemp(prefix="bench-pivot-")
+        try:
+            cube = pivot_to_memmap(store, os.path.join(work_dir, "cube.npy"), devices)
+            cells = cube.matrix.size
+        finally:
+            shutil.rmtree(work_dir)
+    else:
+        sparse = case.endswith("sparse")
+        index = MetricIndex.from_store(store, devices[:1])
+        cells = 0
+        for pivot in iter_pivots(store, devices, value="value2" if sparse else "value", index=index, sparse=sparse):
+            cells += pivot.matrix.shape[0] * pivot.matrix.shape[1]
+    return {
+        "seconds": time.perf_counter() - started,
+        "cells": cells,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--metrics", type=int, default=60_000)
+    parser.add_argument("--wide", type=int, default=3, help="devices for the multi-device DataFrame.pivot")
+    parser.add_argument("--store", default=os.path.join(tempfile.gettempdir(), "bench_pivot_store"))
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--selected", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.selected, args.store)))
+        return
+
+    if len(list_devices(args.store)) < args.devices:
+        spec = DatasetSpec(devices=args.devices, metrics=args.metrics)
+        write_frames((pl.from_arrow(batch) for batch in iter_device_batches(spec)), args.store)
+
+    print(f"{'case':<20} {'devices':>7} {'cells':>12} {'seconds':>8} {'peak RSS MB':>12}")
+    for case, selection in CASES:
+        selected = {"one": 1, "wide": args.wide, "all": args.devices}[selection]
+        output = subprocess.run(
+            [sys.executable, __file__, "--case", case, "--selected", str(selected), "--store", args.store],
+            capture_output=True, text=True,
+        )
+        if output.returncode:
+            # DataFrame.pivot can run out of memory on large selections.
+            error = (output.stderr.strip().splitlines() or [f"exit code {output.returncode}"])[-1]
+            print(f"{case:<20} {selected:>7} failed: {error}")
+            continue
+        result = json.loads(output.stdout)
+        print(
+            f"{case:<20} {selected:>7} {result['cells']:>12,} {result['seconds']:>8.2f} "
+            f"{result['peak_rss_mb']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Aggregating raw device data versus reading rollups.
+
+    python benchmarks/bench_rollup.py [--devices 20] [--metrics 2000] [--hours 336]
+
+Builds a store of hourly samples (two weeks by default) with 6h / 1d / 1w
+rollups, then times query_metrics against aggregating the raw rows for the
+same windows, and the cost of keeping the rollups current when one more hour
+is appended: update_rollups versus rebuilding them.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import polars as pl  # noqa: E402
+
+from device_store.generator import DatasetSpec, device_name, generate_polars, iter_device_batches, metric_name  # noqa: E402
+from device_store.loader import scan_devices  # noqa: E402
+from device_store.rollup import (  # noqa: E402
+    aggregate,
+    append_with_rollups,
+    build_rollups,
+    pick_rollup,
+    query_metrics,
+    window_length,
+)
+from device_store.writer import append_partitions, write_frames  # noqa: E402
+
+START = datetime(2023, 10, 2)
+WINDOWS = ["6h", "1d", "1w"]
+
+
+def raw_query(store, every, devices=None, metrics=None, start=None, end=None):
+    lazy_df = aggregate(scan_devices(store, devices, metrics, start, end), window_length(every))
+    return lazy_df.sort("device", "metric", "timestamp").collect()
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--metrics", type=int, default=2_000)
+    parser.add_argument("--hours", type=int, default=24 * 14)
+    args = parser.parse_args()
+
+    spec = DatasetSpec(
+        devices=args.devices, metrics=args.metrics, timestamps=args.hours, start=START, interval=timedelta(hours=1)
+    )
+    metrics = [metric_name(m) for m in range(0, args.metrics, args.metrics // 10)][:10]
+    devices = [device_name(d) for d in range(3)]
+    queries = {
+        "daily, 10 metrics": dict(every="1d", metrics=metrics),
+        "weekly, 3 devices": dict(every="1w", devices=devices),
+        "12-hourly, 3 devices": dict(every="12h", devices=devices),
+        "daily, 1 day, all": dict(every="1d", start=START + timedelta(days=3), end=START + timedelta(days=4)),
+    }
+
+    store = tempfile.mkdtemp(prefix="bench-rollup-")
+    try:
+        write_frames((pl.from_arrow(batch) for batch in iter_device_batches(spec)), store)
+        build_seconds, _ = timed(build_rollups, store, WINDOWS)
+        print(f"{spec.rows:,} hourly rows, rollups {', '.join(WINDOWS)} built in {build_seconds:.2f}s")
+        print(f"{'query':<22} {'rollup':>6} {'rows':>8} {'raw s':>7} {'rollup s':>9}")
+        for label, query in queries.items():
+            raw_seconds, raw = timed(raw_query, store, **query)
+            rollup_seconds, rolled = timed(query_metrics, store, **query)
+            assert rolled.height == raw.height
+            window = pick_rollup(store, query["every"], query.get("start"), query.get("end"))
+            print(f"{label:<22} {window or 'raw':>6} {raw.height:>8,} {raw_seconds:>7.3f} {rollup_seconds:>9.3f}")
+
+        hour = DatasetSpec(
+            devices=args.devices, metrics=args.metrics, timestamps=1,
+            start=START + spec.interval * args.hours, interval=spec.interval, seed=1,
+        )
+        new_rows = generate_polars(hour)
+        update_seconds, _ = timed(append_with_rollups, new_rows, store)
+        append_seconds, _ = timed(append_partitions, new_rows.with_columns(pl.col("value") + 1), store)
+        rebuild_seconds, _ = timed(build_rollups, store, WINDOWS)
+        print(f"append 1 hour ({new_rows.height:,} rows):")
+        print(f"  append_with_rollups:      {update_seconds:.2f}s")
+        print(f"  append + build_rollups:   {append_seconds + rebuild_seconds:.2f}s")
+    finally:
+        shutil.rmtree(store)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Notebook save_partitioned() versus device_store.writer.write_partitions.
+
+    python benchmarks/bench_writer.py [--devices 20] [--metrics 10000] [--workers 4]
+
+Also times a second write after changing 3 devices: the notebook rewrites
+every file, the writer only the changed partitions.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import polars as pl  # noqa: E402
+
+from device_store.generator import DatasetSpec, generate_polars  # noqa: E402
+from device_store.writer import DEFAULT_ROW_GROUP_SIZE, WriteOptions, write_partitions  # noqa: E402
+
+
+def legacy_save_partitioned(df, base_dir):
+    # The notebook's implementation.
+    os.makedirs(base_dir, exist_ok=True)
+    devices = df.select("device").unique().to_series().to_list()
+    for device in devices:
+        device_df = df.filter(pl.col("device") == device)
+        path = os.path.join(base_dir, f"{device}.parquet")
+        device_df.write_parquet(path)
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--metrics", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE)
+    args = parser.parse_args()
+
+    df = generate_polars(DatasetSpec(devices=args.devices, metrics=args.metrics))
+    changed = ["device_1", "device_2", "device_3"]
+    modified = df.with_columns(
+        pl.when(pl.col("device").is_in(changed)).then(pl.col("value") * 2).otherwise(pl.col("value")).alias("value")
+    )
+    options = WriteOptions(workers=args.workers, row_group_size=args.row_group_size)
+    work_dir = tempfile.mkdtemp(prefix="bench-writer-")
+    try:
+        legacy_dir = os.path.join(work_dir, "legacy")
+        store_dir = os.path.join(work_dir, "store")
+        legacy_first, _ = timed(legacy_save_partitioned, df, legacy_dir)
+        legacy_second, _ = timed(legacy_save_partitioned, modified, legacy_dir)
+        store_first, _ = timed(write_partitions, df, store_dir, options)
+        store_second, report = timed(write_partitions, modified, store_dir, options)
+    finally:
+        shutil.rmtree(work_dir)
+
+    print(f"{df.height:,} rows, {args.devices} devices, {args.workers} writer threads")
+    print(f"{'':<28} {'first write':>12} {'3 changed':>12}")
+    print(f"{'notebook save_partitioned':<28} {legacy_first:>11.2f}s {legacy_second:>11.2f}s")
+    print(f"{'write_partitions':<28} {store_first:>11.2f}s {store_second:>11.2f}s")
+    print(f"second write: {len(report.written)} rewritten, {len(report.unchanged)} unchanged")
+
+
+if __name__ == "__main__":
+    main()
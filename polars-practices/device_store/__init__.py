@@ -0,0 +1,77 @@
+"""
+Reusable pieces of the multiple-parquets practice: a synthetic device-metrics
+dataset and the tools to store and query it.
+"""
+
+from device_store.catalog import Catalog
+from device_store.compaction import BackgroundCompactor, compact
+from device_store.executor import PoolOptions, PoolReport, parallel_transform_devices
+from device_store.generator import (
+    SCHEMA,
+    DatasetSpec,
+    device_batch,
+    generate_pandas,
+    generate_polars,
+    generate_table,
+    iter_device_batches,
+)
+from device_store.loader import load_devices, scan_devices
+from device_store.pandas_pipeline import double_values_pandas, load_devices_pandas, write_partitions_pandas
+from device_store.pipeline import double_values, transform_devices
+from device_store.pivot import MetricIndex, iter_pivots, pivot_to_memmap
+from device_store.rollup import (
+    append_with_rollups,
+    build_rollups,
+    compact_rollups,
+    query_metrics,
+    update_rollups,
+)
+from device_store.writer import (
+    WriteOptions,
+    append_partitions,
+    WriteReport,
+    list_devices,
+    partition_path,
+    rebuild_catalog,
+    write_frames,
+    write_partitions,
+)
+
+__all__ = [
+    "BackgroundCompactor",
+    "Catalog",
+    "compact",
+    "PoolOptions",
+    "PoolReport",
+    "parallel_transform_devices",
+    "SCHEMA",
+    "DatasetSpec",
+    "device_batch",
+    "generate_pandas",
+    "generate_polars",
+    "generate_table",
+    "iter_device_batches",
+    "load_devices",
+    "scan_devices",
+    "double_values_pandas",
+    "load_devices_pandas",
+    "write_partitions_pandas",
+    "append_with_rollups",
+    "build_rollups",
+    "compact_rollups",
+    "query_metrics",
+    "update_rollups",
+    "MetricIndex",
+    "iter_pivots",
+    "pivot_to_memmap",
+    "double_values",
+    "transform_devices",
+    "WriteOptions",
+    "WriteReport",
+    "append_partitions",
+    "list_devices",
+    "partition_path",
+    "rebuild_catalog",
+    "write_frames",
+    "write_partitions",
+]
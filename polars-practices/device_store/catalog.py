@@ -0,0 +1,272 @@
+"""
+SQLite manifest of the files in a device store.
+
+One row per base or delta file: row count, timestamp range, metric range and
+a bloom filter of its metrics, plus the storage schema version and the file's
+identity (inode, mtime, size). The writers record every file they create and
+forget the ones they delete; the loader asks it which files can hold rows
+for a metric / time filter and skips the rest without opening them.
+
+An entry is only trusted while its file identity and schema version match,
+so a missing or stale catalog costs pruning, never correctness.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import polars as pl
+import pyarrow.parquet as pq
+
+CATALOG_FILE = "_catalog.sqlite"
+# Bump when the stored columns change; older entries are then ignored.
+SCHEMA_VERSION = 1
+BLOOM_BITS_PER_ITEM = 10
+BLOOM_HASHES = 7
+
+_FNV_OFFSETS = (np.uint64(0xCBF29CE484222325), np.uint64(0x84222325CBF29CE4))
+_FNV_PRIME = np.uint64(0x100000001B3)
+
+
+def _hash_pair(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Two 64-bit FNV-1a hashes per string, vectorized over the bytes."""
+    raw = np.array([value.encode() for value in values], dtype=bytes)
+    matrix = raw.view(np.uint8).reshape(len(raw), raw.dtype.itemsize).astype(np.uint64)
+    hashes = []
+    with np.errstate(over="ignore"):
+        for offset in _FNV_OFFSETS:
+            h = np.full(len(raw), offset, dtype=np.uint64)
+            for column in matrix.T:
+                # Padding bytes are zero and skipped, so width does not matter.
+                h = np.where(column != 0, (h ^ column) * _FNV_PRIME, h)
+            hashes.append(h)
+    return hashes[0], hashes[1] | np.uint64(1)
+
+
+class MetricBloom:
+    """Bloom filter over metric names (about 1% false positives)."""
+
+    def __init__(self, packed: np.ndarray):
+        # Bits packed 8 per byte, as stored, so loading one costs no unpacking.
+        self.packed = packed
+
+    @property
+    def size(self) -> int:
+        return len(self.packed) * 8
+
+    @classmethod
+    def from_metrics(cls, metrics: Sequence[str]) -> "MetricBloom":
+        size = max(64, len(metrics) * BLOOM_BITS_PER_ITEM) // 8 * 8
+        bits = np.zeros(size, dtype=bool)
+        if len(metrics):
+            bits[cls._positions(metrics, size).ravel()] = True
+        return cls(np.packbits(bits))
+
+    @staticmethod
+    def _positions(metrics: Sequence[str], size: int) -> np.ndarray:
+        h1, h2 = _hash_pair(metrics)
+        rounds = np.arange(BLOOM_HASHES, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            return (h1[:, None] + rounds[None, :] * h2[:, None]) % np.uint64(size)
+
+    def might_contain_any(self, metrics: Sequence[str]) -> bool:
+        if not len(metrics):
+            return False
+        positions = self._positions(metrics, self.size)
+        bits = self.packed[positions >> np.uint64(3)] >> (np.uint64(7) - (positions & np.uint64(7))).astype(np.uint8)
+        return bool((bits & 1).all(axis=1).any())
+
+    def to_bytes(self) -> bytes:
+        return self.packed.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MetricBloom":
+        return cls(np.frombuffer(data, dtype=np.uint8))
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    device: str
+    name: str
+    file_id: Tuple[int, int, int]
+    rows: int
+    min_timestamp: Optional[datetime]
+    max_timestamp: Optional[datetime]
+    min_metric: Optional[str]
+    max_metric: Optional[str]
+    schema_version: int
+    bloom: Optional[MetricBloom] = None
+
+    def may_match(
+        self,
+        metrics: Optional[Sequence[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> bool:
+        """False only when the file certainly has no row for the filter."""
+        if self.rows == 0:
+            return False
+        if start is not None and self.max_timestamp is not None and self.max_timestamp < start:
+            return False
+        if end is not None and self.min_timestamp is not None and self.min_timestamp >= end:
+            return False
+        if metrics is not None:
+            if self.min_metric is not None and self.max_metric is not None:
+                metrics = [m for m in metrics if self.min_metric <= m <= self.max_metric]
+            if not metrics:
+                return False
+            if self.bloom is not None:
+                return self.bloom.might_contain_any(metrics)
+        return True
+
+
+def file_identity(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def describe_file(device: str, path: str) -> FileEntry:
+    """Build an entry from a parquet file: footer statistics plus its metric column."""
+    identity = file_identity(path)
+    if identity is None:
+        raise FileNotFoundError(path)
+    metadata = pq.read_metadata(path)
+    metrics = pl.read_parquet(path, columns=["metric"])["metric"].cast(pl.String).unique().drop_nulls()
+
+    timestamps = [None, None]
+    index = metadata.schema.names.index("timestamp")
+    for row_group in range(metadata.num_row_groups):
+        stats = metadata.row_group(row_group).column(index).statistics
+        if stats is None or not stats.has_min_max:
+            timestamps = [None, None]
+            break
+        timestamps[0] = stats.min if timestamps[0] is None else min(timestamps[0], stats.min)
+        timestamps[1] = stats.max if timestamps[1] is None else max(timestamps[1], stats.max)
+
+    return FileEntry(
+        device=device,
+        name=os.path.basename(path),
+        file_id=identity,
+        rows=metadata.num_rows,
+        min_timestamp=timestamps[0],
+        max_timestamp=timestamps[1],
+        min_metric=metrics.min() if len(metrics) else None,
+        max_metric=metrics.max() if len(metrics) else None,
+        schema_version=SCHEMA_VERSION,
+        bloom=MetricBloom.from_metrics(metrics.to_list()),
+    )
+
+
+def _to_us(value: Optional[datetime]) -> Optional[int]:
+    return None if value is None else int(np.datetime64(value, "us").astype(np.int64))
+
+
+def _from_us(value: Optional[int]) -> Optional[datetime]:
+    return None if value is None else np.datetime64(value, "us").astype(datetime)
+
+
+class Catalog:
+    """
+    The manifest of the store in ``base_dir``. Every call opens its own
+    connection, so one instance can be shared by threads and processes.
+    """
+
+    def __init__(self, base_dir: str):
+        self.path = os.path.join(base_dir, CATALOG_FILE)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                device TEXT NOT NULL,
+                name TEXT NOT NULL,
+                inode INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                rows INTEGER NOT NULL,
+                min_timestamp INTEGER,
+                max_timestamp INTEGER,
+                min_metric TEXT,
+                max_metric TEXT,
+                schema_version INTEGER NOT NULL,
+                metric_bloom BLOB,
+                PRIMARY KEY (device, name)
+            )
+            """
+        )
+        return connection
+
+    def record(self, device: str, path: str) -> FileEntry:
+        """Describe ``path`` and store (or replace) its entry."""
+        entry = describe_file(device, path)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.device,
+                    entry.name,
+                    *entry.file_id,
+                    entry.rows,
+                    _to_us(entry.min_timestamp),
+                    _to_us(entry.max_timestamp),
+                    entry.min_metric,
+                    entry.max_metric,
+                    entry.schema_version,
+                    entry.bloom.to_bytes() if entry.bloom else None,
+                ),
+            )
+        return entry
+
+    def forget(self, device: str, names: Iterable[str]) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "DELETE FROM files WHERE device = ? AND name = ?", [(device, name) for name in names]
+            )
+
+    def clear(self) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM files")
+
+    def entries(
+        self, devices: Optional[Iterable[str]] = None, with_bloom: bool = False
+    ) -> Dict[Tuple[str, str], FileEntry]:
+        """Entries of the current schema version, keyed by (device, file name)."""
+        if not self.exists():
+            return {}
+        columns = "device, name, inode, mtime_ns, size, rows, min_timestamp, max_timestamp, min_metric, max_metric"
+        query = f"SELECT {columns}, {'metric_bloom' if with_bloom else 'NULL'} FROM files WHERE schema_version = ?"
+        with closing(self._connect()) as connection:
+            rows = connection.execute(query, (SCHEMA_VERSION,))
+            wanted = None if devices is None else set(devices)
+            result = {}
+            for device, name, inode, mtime_ns, size, count, min_ts, max_ts, min_metric, max_metric, bloom in rows:
+                if wanted is not None and device not in wanted:
+                    continue
+                result[device, name] = FileEntry(
+                    device=device,
+                    name=name,
+                    file_id=(inode, mtime_ns, size),
+                    rows=count,
+                    min_timestamp=_from_us(min_ts),
+                    max_timestamp=_from_us(max_ts),
+                    min_metric=min_metric,
+                    max_metric=max_metric,
+                    schema_version=SCHEMA_VERSION,
+                    bloom=MetricBloom.from_bytes(bloom) if bloom is not None else None,
+                )
+        return result
@@ -0,0 +1,117 @@
+"""
+Folding append-only delta files back into each device's base file.
+
+``append_partitions`` makes daily ingestion cost O(new rows): it only writes
+a small ``delta-<seq>.parquet`` per device. Every pending delta adds a file
+to open and a dedup step to each read, so ``compact`` periodically merges
+base + deltas into a new base sorted by metric and timestamp, which also
+gives every row group a narrow metric range for the loader to skip on.
+``BackgroundCompactor`` runs it on a timer in a daemon thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Iterable, Optional
+
+from device_store.loader import scan_snapshots
+from device_store.writer import (
+    WriteOptions,
+    WriteReport,
+    list_devices,
+    partition_lock,
+    snapshot,
+    write_base,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def compact_device(
+    base_dir: str, device: str, min_deltas: int = 1, options: WriteOptions = WriteOptions()
+) -> bool:
+    """
+    Merge one device's pending deltas into its base file. Appends to the
+    device wait while it runs; readers do not.
+
+    :return: False when the device had fewer than ``min_deltas`` deltas.
+    """
+    current = snapshot(base_dir, device)
+    if current is None or len(current.deltas) < min_deltas:
+        return False
+    with partition_lock(base_dir, device):
+        current = snapshot(base_dir, device)
+        if current is None or len(current.deltas) < min_deltas:
+            return False
+        merged = scan_snapshots([current]).sort("metric", "timestamp").collect()
+        write_base(merged, base_dir, device, current.through, options)
+    return True
+
+
+def compact(
+    base_dir: str,
+    devices: Optional[Iterable[str]] = None,
+    min_deltas: int = 1,
+    options: WriteOptions = WriteOptions(),
+) -> WriteReport:
+    """
+    Compact every device (or ``devices``) with at least ``min_deltas`` deltas.
+
+    :return: Compacted devices as ``written``, the rest as ``unchanged``.
+    """
+    report = WriteReport()
+    for device in list_devices(base_dir) if devices is None else devices:
+        compacted = compact_device(base_dir, device, min_deltas, options)
+        (report.written if compacted else report.unchanged).append(device)
+    return report
+
+
+class BackgroundCompactor:
+    """
+    Runs ``compact`` every ``interval`` seconds until stopped.
+
+    Usable as a context manager; ``stop`` waits for a running pass to finish.
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        interval: float = 60.0,
+        min_deltas: int = 4,
+        options: WriteOptions = WriteOptions(),
+    ):
+        self.base_dir = base_dir
+        self.interval = interval
+        self.min_deltas = min_deltas
+        self.options = options
+        self.passes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "BackgroundCompactor":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="device-store-compactor", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                compact(self.base_dir, min_deltas=self.min_deltas, options=self.options)
+            except Exception:
+                # Keep compacting later; the deltas stay readable meanwhile.
+                logger.exception("Compacting %s failed", self.base_dir)
+            self.passes += 1
+
+    def __enter__(self) -> "BackgroundCompactor":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
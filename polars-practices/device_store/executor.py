@@ -0,0 +1,207 @@
+"""
+Partition-parallel transforms with a process pool.
+
+``transform_devices`` runs one device after another in one process. That
+suits cheap expressions, which Polars already spreads over its own threads,
+but not heavier per-device work that holds the GIL (``map_elements``,
+``map_batches`` with NumPy or Python code). Devices are independent, so
+``parallel_transform_devices`` maps the transform over them in a
+``ProcessPoolExecutor`` instead:
+
+- Workers are started with ``spawn``: forking a process that has already
+  used Polars can deadlock on its thread pool.
+- Each worker gets ``RLIMIT_AS`` set to ``memory_limit_mb`` and
+  ``POLARS_MAX_THREADS`` set so the workers share the cores instead of each
+  starting one thread per core.
+- A device whose transform raises is retried up to ``retries`` times. A
+  worker killed by the memory limit breaks the whole pool; the devices that
+  were in flight then run again one per pool, so the retry is charged to the
+  device that actually died. A pool is handed only as many devices as it
+  has workers, so the devices not started yet are known: they run again
+  together in one shared pool, uncharged. A Polars panic (which is how the
+  memory limit often shows up, e.g. "OS can't spawn worker thread") leaves
+  Polars unusable in that process, so the worker exits and breaks the pool
+  the same way.
+- Results are written by ``transform_device``: to a temp file renamed into
+  place, under the partition lock, exactly as in the serial pipeline.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import resource
+import sys
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from device_store.pipeline import Transform, double_values, transform_device
+from device_store.writer import WriteOptions, WriteReport, list_devices
+
+
+@dataclass(frozen=True)
+class PoolOptions:
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    # Address-space limit per worker; None leaves it unlimited. Polars and
+    # NumPy reserve a few hundred MB of address space before any work, so
+    # keep it well above that.
+    memory_limit_mb: Optional[int] = None
+    retries: int = 2
+    # Polars threads per worker; None divides the cores between the workers.
+    threads_per_worker: Optional[int] = None
+
+
+@dataclass
+class PoolReport(WriteReport):
+    # Device -> repr of the last error, for devices that ran out of retries.
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+def _limit_memory(limit_mb: Optional[int]) -> None:
+    if limit_mb is not None:
+        limit = limit_mb * 2**20
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+@contextmanager
+def _worker_threads(threads: int) -> Iterator[None]:
+    # Spawned workers import Polars before any initializer runs, so the
+    # thread count has to be in the environment they inherit.
+    previous = os.environ.get("POLARS_MAX_THREADS")
+    os.environ["POLARS_MAX_THREADS"] = str(threads)
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ["POLARS_MAX_THREADS"]
+        else:
+            os.environ["POLARS_MAX_THREADS"] = previous
+
+
+def _transform_in_worker(
+    base_dir: str, device: str, transform: Transform, out_dir: Optional[str], options: WriteOptions
+) -> bool:
+    try:
+        return transform_device(base_dir, device, transform, out_dir, options)
+    except (Exception, KeyboardInterrupt, SystemExit):
+        raise
+    except BaseException:
+        # A Polars panic (pyo3's PanicException) poisons Polars' global state,
+        # so every later device in this worker would fail too. Report it and
+        # end the worker; the parent sees a broken pool.
+        traceback.print_exc()
+        sys.stderr.flush()
+        os._exit(1)
+
+
+def _run_pool(
+    devices: List[str],
+    workers: int,
+    base_dir: str,
+    transform: Transform,
+    out_dir: Optional[str],
+    options: WriteOptions,
+    pool: PoolOptions,
+) -> Tuple[Dict[str, Optional[BaseException]], List[str]]:
+    """
+    Run ``devices`` in one pool, at most ``workers`` at a time.
+
+    :return: Device -> its error, or None, for the devices that ran (devices
+        without data are left out), and the devices never started because a
+        worker died first.
+    """
+    threads = pool.threads_per_worker or max(1, (os.cpu_count() or 1) // workers)
+    outcomes: Dict[str, Optional[BaseException]] = {}
+    queued = deque(devices)
+    # Only as many devices as workers are submitted, so a broken pool fails
+    # exactly the ones that were running.
+    running: Dict[Future, str] = {}
+    broken = False
+    with _worker_threads(threads), ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_limit_memory,
+        initargs=(pool.memory_limit_mb,),
+    ) as executor:
+        while queued or running:
+            while queued and len(running) < workers and not broken:
+                try:
+                    future = executor.submit(_transform_in_worker, base_dir, queued[0], transform, out_dir, options)
+                except BrokenProcessPool:
+                    broken = True
+                    break
+                running[future] = queued.popleft()
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                device = running.pop(future)
+                error = future.exception()
+                broken = broken or isinstance(error, BrokenProcessPool)
+                if error is not None or future.result():
+                    outcomes[device] = error
+    return outcomes, list(queued)
+
+
+def parallel_transform_devices(
+    base_dir: str,
+    transform: Transform = double_values,
+    devices: Optional[Iterable[str]] = None,
+    out_dir: Optional[str] = None,
+    options: WriteOptions = WriteOptions(),
+    pool: PoolOptions = PoolOptions(),
+) -> PoolReport:
+    """
+    ``transform_devices`` over a process pool.
+
+    :param transform: Applied to each device's LazyFrame; it is pickled to the
+        workers, so it must be a module-level function, not a lambda.
+    :return: Transformed devices as ``written``, the ones that still failed
+        after ``pool.retries`` retries in ``failed``. Devices without data are
+        left out, as in ``transform_devices``.
+    """
+    try:
+        pickle.dumps(transform)
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        raise TypeError(f"transform must be picklable, e.g. a module-level function: {error}") from error
+
+    report = PoolReport()
+    pending = list_devices(base_dir) if devices is None else list(devices)
+    attempts: Dict[str, int] = {}
+    # Devices in flight when a worker died; they run one per pool from then on.
+    alone = set()
+    while pending:
+        shared = [device for device in pending if device not in alone]
+        batches = ([shared] if shared else []) + [[device] for device in pending if device in alone]
+        outcomes: Dict[str, Optional[BaseException]] = {}
+        pending = []
+        for batch in batches:
+            workers = min(pool.workers, len(batch))
+            ran, not_started = _run_pool(batch, workers, base_dir, transform, out_dir, options, pool)
+            outcomes.update(ran)
+            # Never started, so not charged a retry; they share the next pool.
+            pending += not_started
+
+        for device, error in outcomes.items():
+            if error is None:
+                report.written.append(device)
+            elif isinstance(error, BrokenProcessPool) and min(pool.workers, len(shared)) > 1 and device not in alone:
+                # Maybe another worker died; find out in a pool of its own.
+                alone.add(device)
+                pending.append(device)
+            else:
+                attempts[device] = attempts.get(device, 0) + 1
+                if attempts[device] > pool.retries:
+                    report.failed[device] = repr(error)
+                else:
+                    pending.append(device)
+
+    report.written.sort()
+    report.failed = dict(sorted(report.failed.items()))
+    return report
@@ -0,0 +1,148 @@
+"""
+Vectorized synthetic device-metrics data.
+
+The dataset is a full grid of devices x metrics x timestamps with two random
+float columns; ``value2`` is null on the last timestamp of every metric. Rows
+are built per device with NumPy (one ``rng.random`` call per column,
+timestamps broadcast over metrics) straight into Arrow buffers, and ``device``
+/ ``metric`` are dictionary-encoded (Polars ``Categorical``, pandas
+``category``) with one metric dictionary shared by every device.
+
+``iter_device_batches`` yields one device (or a slice of its metrics) at a
+time, so memory stays constant however many devices are generated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+SCHEMA = pa.schema(
+    [
+        ("device", pa.dictionary(pa.int32(), pa.string())),
+        ("metric", pa.dictionary(pa.int32(), pa.string())),
+        ("timestamp", pa.timestamp("us")),
+        ("value", pa.float64()),
+        ("value2", pa.float64()),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Shape of a generated dataset; the notebook's original one is the default."""
+
+    devices: int = 20
+    metrics: int = 60_000
+    timestamps: int = 20
+    start: datetime = datetime(2023, 10, 1)
+    interval: timedelta = timedelta(days=1)
+    seed: Optional[int] = 0
+
+    @property
+    def rows_per_device(self) -> int:
+        return self.metrics * self.timestamps
+
+    @property
+    def rows(self) -> int:
+        return self.devices * self.rows_per_device
+
+
+def device_name(index: int) -> str:
+    return f"device_{index}"
+
+
+def metric_name(index: int) -> str:
+    return f"metric_{index}"
+
+
+@lru_cache(maxsize=8)
+def metric_dictionary(metrics: int) -> pa.Array:
+    """The ``metric_0 .. metric_{n-1}`` dictionary, built once per size."""
+    return pa.array([metric_name(m) for m in range(metrics)], pa.string())
+
+
+def timestamp_values(spec: DatasetSpec) -> np.ndarray:
+    """The ``spec.timestamps`` timestamps every metric is sampled at."""
+    start = np.datetime64(spec.start, "us")
+    step = np.timedelta64(spec.interval, "us")
+    return start + step * np.arange(spec.timestamps)
+
+
+def device_rng(spec: DatasetSpec, device: int) -> np.random.Generator:
+    # One independent stream per device, so any device can be regenerated on
+    # its own (or in another process) and comes out identical.
+    seed = None if spec.seed is None else [spec.seed, device]
+    return np.random.default_rng(seed)
+
+
+def device_batch(
+    spec: DatasetSpec,
+    device: int,
+    metric_start: int = 0,
+    metric_stop: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> pa.RecordBatch:
+    """
+    Rows for one device and metrics ``[metric_start, metric_stop)``, ordered by
+    metric then timestamp like the original nested loops.
+    """
+    metric_stop = spec.metrics if metric_stop is None else metric_stop
+    metrics = metric_stop - metric_start
+    rows = metrics * spec.timestamps
+    rng = rng or device_rng(spec, device)
+
+    metric_codes = np.repeat(np.arange(metric_start, metric_stop, dtype=np.int32), spec.timestamps)
+    # (1, timestamps) broadcast against (metrics, 1) -> the full grid.
+    timestamps = np.broadcast_to(timestamp_values(spec)[None, :], (metrics, spec.timestamps)).ravel()
+    last = np.zeros(spec.timestamps, dtype=bool)
+    last[-1] = True
+    value2_null = np.broadcast_to(last[None, :], (metrics, spec.timestamps)).ravel()
+
+    device_dictionary = pa.array([device_name(device)], pa.string())
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.DictionaryArray.from_arrays(pa.array(np.zeros(rows, dtype=np.int32)), device_dictionary),
+            pa.DictionaryArray.from_arrays(pa.array(metric_codes), metric_dictionary(spec.metrics)),
+            pa.array(timestamps, pa.timestamp("us")),
+            pa.array(rng.random(rows)),
+            pa.array(rng.random(rows), mask=value2_null),
+        ],
+        schema=SCHEMA,
+    )
+
+
+def iter_device_batches(
+    spec: DatasetSpec, metrics_per_batch: Optional[int] = None
+) -> Iterator[pa.RecordBatch]:
+    """
+    Yield the dataset device by device; with ``metrics_per_batch`` each device
+    is further split so no batch holds more than that many metrics.
+    """
+    step = metrics_per_batch or spec.metrics
+    for device in range(spec.devices):
+        rng = device_rng(spec, device)
+        for start in range(0, spec.metrics, step):
+            yield device_batch(spec, device, start, min(start + step, spec.metrics), rng)
+
+
+def generate_table(spec: DatasetSpec) -> pa.Table:
+    """The whole dataset as one Arrow table (sized for datasets that fit in memory)."""
+    return pa.Table.from_batches(iter_device_batches(spec), schema=SCHEMA)
+
+
+def generate_polars(spec: DatasetSpec) -> pl.DataFrame:
+    """``device`` and ``metric`` come out as ``pl.Categorical``."""
+    return pl.from_arrow(generate_table(spec))
+
+
+def generate_pandas(spec: DatasetSpec) -> pd.DataFrame:
+    """``device`` and ``metric`` come out as ``category``."""
+    return generate_table(spec).to_pandas()
@@ -0,0 +1,182 @@
+"""
+Lazy, pushed-down reads of the hive-partitioned device dataset.
+
+``scan_devices`` reads the store with ``pl.scan_parquet``, so every filter
+and column selection reaches the parquet reader: a device filter picks the
+partition directories to open, metric and timestamp filters skip row groups
+by their min/max statistics, and unselected columns are never read. The
+notebook's ``load_devices_lazy`` read each file eagerly and only then called
+``.lazy()``, so none of that applied.
+
+Partitions with pending delta files are read as base + deltas, keeping the
+last row for each (device, metric, timestamp). Stored files never change, so
+a read returns one consistent snapshot per device or fails because a
+compaction deleted a file it listed; ``load_devices`` then retries.
+
+With metric or time filters, files the store's catalog rules out are not
+opened at all (see device_store.catalog).
+
+``metric`` comes back as ``String``, the way the writer stores it.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from typing import AbstractSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+import polars as pl
+
+from device_store.catalog import Catalog, file_identity
+from device_store.writer import PARTITION_COLUMN, PartitionSnapshot, list_devices, snapshot
+
+KEY_COLUMNS = [PARTITION_COLUMN, "metric", "timestamp"]
+# Column order of a scan, for queries the catalog rules out entirely.
+SCAN_SCHEMA = {
+    "metric": pl.String,
+    "timestamp": pl.Datetime("us"),
+    "value": pl.Float64,
+    "value2": pl.Float64,
+    PARTITION_COLUMN: pl.String,
+}
+
+
+def snapshots(base_dir: str, devices: Optional[Iterable[str]] = None) -> List[PartitionSnapshot]:
+    """Current files of ``devices`` (all if None); missing devices are skipped."""
+    devices = list_devices(base_dir) if devices is None else dict.fromkeys(devices)
+    return [snap for snap in (snapshot(base_dir, device) for device in devices) if snap is not None]
+
+
+def scan_snapshots(snaps: Sequence[PartitionSnapshot], skip: AbstractSet[str] = frozenset()) -> pl.LazyFrame:
+    """
+    Merged view of the given partitions: base files, then deltas in order,
+    with later rows replacing earlier ones for the same key.
+
+    :param skip: Files known to hold no row the query will keep.
+    """
+    bases = [snap.base for snap in snaps if snap.base and snap.base not in skip]
+    deltas = [path for snap in snaps for path in snap.deltas if path not in skip]
+    if not bases and not deltas:
+        return pl.LazyFrame(schema=SCAN_SCHEMA)
+    frames = [
+        pl.scan_parquet(paths, hive_partitioning=True, hive_schema={PARTITION_COLUMN: pl.String})
+        for paths in (bases, deltas)
+        if paths
+    ]
+    lazy_df = pl.concat(frames, how="diagonal_relaxed")
+    if deltas:
+        lazy_df = lazy_df.unique(subset=KEY_COLUMNS, keep="last", maintain_order=True)
+    return lazy_df
+
+
+def catalog_skips(
+    base_dir: str,
+    snaps: Sequence[PartitionSnapshot],
+    metrics: Optional[Sequence[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Set[str]:
+    """
+    Files of ``snaps`` whose catalog entry rules out any row for the filter.
+    Files without an entry, or changed since it was recorded, are kept.
+    """
+    catalog = Catalog(base_dir)
+    if (metrics is None and start is None and end is None) or not catalog.exists():
+        return set()
+    entries = catalog.entries([snap.device for snap in snaps], with_bloom=metrics is not None)
+    skip = set()
+    for snap in snaps:
+        for path in snap.files:
+            entry = entries.get((snap.device, os.path.basename(path)))
+            if entry is None:
+                continue
+            if entry.file_id == file_identity(path) and not entry.may_match(metrics, start, end):
+                skip.add(path)
+    return skip
+
+
+def device_filter(
+    metrics: Optional[Iterable[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Optional[pl.Expr]:
+    """
+    Predicate for ``metrics`` and the ``[start, end)`` time range, or None.
+
+    Plain column comparisons only, which the parquet reader can evaluate
+    against row-group statistics.
+    """
+    predicates = []
+    if metrics is not None:
+        predicates.append(pl.col("metric").is_in(list(metrics)))
+    if start is not None:
+        predicates.append(pl.col("timestamp") >= start)
+    if end is not None:
+        predicates.append(pl.col("timestamp") < end)
+    return pl.all_horizontal(predicates) if predicates else None
+
+
+def _scan(
+    base_dir: str,
+    devices: Optional[Iterable[str]],
+    metrics: Optional[Iterable[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    columns: Optional[Sequence[str]] = None,
+    use_catalog: bool = True,
+) -> Tuple[pl.LazyFrame, List[PartitionSnapshot]]:
+    devices = None if devices is None else list(devices)
+    metrics = None if metrics is None else list(metrics)
+    snaps = snapshots(base_dir, devices)
+    if not snaps:
+        raise FileNotFoundError(f"No partitions for {devices} under {base_dir}")
+    skip = catalog_skips(base_dir, snaps, metrics, start, end) if use_catalog else set()
+    lazy_df = scan_snapshots(snaps, skip)
+    predicate = device_filter(metrics, start, end)
+    if predicate is not None:
+        lazy_df = lazy_df.filter(predicate)
+    if columns is not None:
+        lazy_df = lazy_df.select(columns)
+    return lazy_df, snaps
+
+
+def scan_devices(
+    base_dir: str,
+    devices: Optional[Iterable[str]] = None,
+    metrics: Optional[Iterable[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    columns: Optional[Sequence[str]] = None,
+    use_catalog: bool = True,
+) -> pl.LazyFrame:
+    """
+    Replaces the notebook's ``load_devices_lazy``. The files are picked now;
+    a compaction before the frame is collected can make collecting fail.
+
+    :param devices: Devices to read; missing ones are skipped. None reads all.
+    :param metrics: Only these metrics.
+    :param start: First timestamp included.
+    :param end: First timestamp excluded.
+    :param columns: Columns to return; filters may use columns not listed.
+    :param use_catalog: Skip files the catalog rules out for the filters.
+    """
+    return _scan(base_dir, devices, metrics, start, end, columns, use_catalog)[0]
+
+
+def load_devices(
+    base_dir: str, devices: Optional[Iterable[str]] = None, retries: int = 3, **filters
+) -> pl.DataFrame:
+    """
+    ``scan_devices(...).collect()``, retried up to ``retries`` times when a
+    compaction deleted files during the read. Takes the same keyword filters.
+    """
+    devices = None if devices is None else list(devices)
+    for attempt in range(retries + 1):
+        lazy_df, snaps = _scan(base_dir, devices, **filters)
+        try:
+            return lazy_df.collect()
+        except (FileNotFoundError, pl.exceptions.ComputeError):
+            # A file deleted after it was listed; anything else is a real error.
+            if attempt == retries or all(snap.is_intact() for snap in snaps):
+                raise
+    raise AssertionError("unreachable")
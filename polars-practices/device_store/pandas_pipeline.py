@@ -0,0 +1,219 @@
+"""
+The notebook's pandas pipeline on the device store.
+
+The pandas version of the practice read whole files into object-string
+columns, so every row carried two Python ``str`` objects and
+``groupby("device")`` hashed them one by one; it then wrote each group back
+with default settings. Here reads go through ``pyarrow.parquet`` with
+``filters=`` and ``columns=``: row groups are skipped by their statistics and
+unselected columns are never decoded. ``device`` and ``metric`` come back as
+``category`` (int32 codes plus one dictionary), the other columns as
+``pd.ArrowDtype``, which keeps nulls in ``value2`` without falling back to
+object or float NaN. Writes use the store's layout and ``WriteOptions``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from device_store.loader import KEY_COLUMNS, catalog_skips, snapshots
+from device_store.writer import (
+    COMPACTED_KEY,
+    PARTITION_COLUMN,
+    PartitionSnapshot,
+    WriteOptions,
+    WriteReport,
+    atomic_path,
+    next_base_path,
+    partition_lock,
+    replaced_base,
+    snapshot,
+)
+
+ArrowFilter = List[Tuple[str, str, object]]
+# Columns of a read, for queries the catalog rules out entirely.
+READ_SCHEMA = pa.schema(
+    [
+        ("metric", pa.string()),
+        ("timestamp", pa.timestamp("us")),
+        ("value", pa.float64()),
+        ("value2", pa.float64()),
+        (PARTITION_COLUMN, pa.dictionary(pa.int32(), pa.string())),
+    ]
+)
+
+
+def arrow_filters(
+    metrics: Optional[Iterable[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Optional[ArrowFilter]:
+    """``filters=`` for ``metrics`` and the ``[start, end)`` time range, or None."""
+    filters: ArrowFilter = []
+    if metrics is not None:
+        filters.append(("metric", "in", list(metrics)))
+    if start is not None:
+        filters.append(("timestamp", ">=", start))
+    if end is not None:
+        filters.append(("timestamp", "<", end))
+    return filters or None
+
+
+def _pandas_type(arrow_type: pa.DataType) -> Optional[pd.api.extensions.ExtensionDtype]:
+    # Dictionaries fall through to pandas' own ``category``.
+    return None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
+
+
+def arrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    ``df`` with ``device`` / ``metric`` as ``category`` and every other
+    column as ``pd.ArrowDtype``, e.g. for a frame built from Python objects.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for name in (PARTITION_COLUMN, "metric"):
+        if name in table.column_names:
+            index = table.column_names.index(name)
+            table = table.set_column(index, name, table[name].dictionary_encode())
+    return table.to_pandas(types_mapper=_pandas_type)
+
+
+def _read_snapshot(
+    snap: PartitionSnapshot,
+    device_code: int,
+    devices: pa.Array,
+    columns: Optional[List[str]],
+    filters: Optional[ArrowFilter],
+    read_dictionary: Optional[List[str]],
+    skip: Iterable[str],
+) -> List[pa.Table]:
+    tables = []
+    for path in snap.files:
+        if path in skip:
+            continue
+        table = pq.read_table(path, columns=columns, filters=filters, read_dictionary=read_dictionary)
+        codes = pa.array(np.full(table.num_rows, device_code, dtype=np.int32))
+        tables.append(table.append_column(PARTITION_COLUMN, pa.DictionaryArray.from_arrays(codes, devices)))
+    return tables
+
+
+def load_devices_pandas(
+    base_dir: str,
+    devices: Optional[Iterable[str]] = None,
+    metrics: Optional[Iterable[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    columns: Optional[Sequence[str]] = None,
+    use_catalog: bool = True,
+    retries: int = 3,
+) -> pd.DataFrame:
+    """
+    Replaces the notebook's pandas ``load_devices``; takes the same
+    arguments as ``device_store.loader.load_devices``.
+
+    Pending deltas are merged the same way: the last row for each
+    (device, metric, timestamp) wins.
+    """
+    devices = None if devices is None else list(devices)
+    metrics = None if metrics is None else list(metrics)
+    filters = arrow_filters(metrics, start, end)
+    # Reading ``metric`` as a dictionary decodes each file's whole dictionary:
+    # cheaper than encoding afterwards for full reads, much dearer for a
+    # metric filter that keeps a few rows.
+    read_dictionary = ["metric"] if metrics is None else None
+    for attempt in range(retries + 1):
+        snaps = snapshots(base_dir, devices)
+        if not snaps:
+            raise FileNotFoundError(f"No partitions for {devices} under {base_dir}")
+        skip = catalog_skips(base_dir, snaps, metrics, start, end) if use_catalog else set()
+        has_deltas = any(snap.deltas for snap in snaps)
+        read_columns = None
+        if columns is not None:
+            # Deduplicating needs the key columns even when they are not returned.
+            wanted = list(columns) + (KEY_COLUMNS if has_deltas else [])
+            read_columns = [name for name in dict.fromkeys(wanted) if name != PARTITION_COLUMN]
+        names = pa.array([snap.device for snap in snaps])
+        try:
+            tables = [
+                table
+                for code, snap in enumerate(snaps)
+                for table in _read_snapshot(snap, code, names, read_columns, filters, read_dictionary, skip)
+            ]
+        except FileNotFoundError:
+            # A file deleted by a compaction after it was listed.
+            if attempt == retries or all(snap.is_intact() for snap in snaps):
+                raise
+            continue
+        break
+    if not tables:
+        # The catalog ruled out every file.
+        empty = READ_SCHEMA.empty_table()
+        tables = [empty if read_columns is None else empty.select(read_columns + [PARTITION_COLUMN])]
+    table = pa.concat_tables(tables, promote_options="permissive")
+    del tables
+    if "metric" in table.column_names and not pa.types.is_dictionary(table.schema.field("metric").type):
+        index = table.column_names.index("metric")
+        table = table.set_column(index, "metric", table["metric"].dictionary_encode())
+    # Hands the Arrow buffers over column by column instead of holding both copies.
+    df = table.to_pandas(types_mapper=_pandas_type, split_blocks=True, self_destruct=True)
+    del table
+    if has_deltas:
+        df = df.drop_duplicates(subset=KEY_COLUMNS, keep="last", ignore_index=True)
+    return df if columns is None else df[list(columns)]
+
+
+def double_values_pandas(df: pd.DataFrame) -> pd.DataFrame:
+    """The notebook's pandas ``modify``, without changing ``df`` in place."""
+    return df.assign(value=df["value"] * 2)
+
+
+def _storage_table(part: pd.DataFrame) -> pa.Table:
+    """A device's rows as the store keeps them: strings, microsecond timestamps."""
+    table = pa.Table.from_pandas(part, preserve_index=False).replace_schema_metadata(None)
+    for index, arrow_field in enumerate(table.schema):
+        arrow_type = arrow_field.type
+        if pa.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+        if pa.types.is_large_string(arrow_type) or pa.types.is_string_view(arrow_type):
+            arrow_type = pa.string()
+        if pa.types.is_timestamp(arrow_type):
+            arrow_type = pa.timestamp("us", arrow_type.tz)
+        if arrow_type != arrow_field.type:
+            table = table.set_column(index, arrow_field.name, table[arrow_field.name].cast(arrow_type))
+    return table
+
+
+def write_partitions_pandas(
+    df: pd.DataFrame, base_dir: str, options: WriteOptions = WriteOptions()
+) -> WriteReport:
+    """
+    Replaces the notebook's pandas ``save_partitioned_by_device`` /
+    ``save_modified_devices``: each device in ``df`` gets a new base file,
+    others are not touched. No fingerprint is stored, so every device is
+    written.
+    """
+    report = WriteReport()
+    for device, part in df.groupby(PARTITION_COLUMN, observed=True, sort=False):
+        device = str(device)
+        table = _storage_table(part.drop(columns=PARTITION_COLUMN))
+        with partition_lock(base_dir, device):
+            current = snapshot(base_dir, device)
+            through = current.through if current else 0
+            with atomic_path(next_base_path(base_dir, device)) as temp_path:
+                pq.write_table(
+                    table.replace_schema_metadata({COMPACTED_KEY: str(through)}),
+                    temp_path,
+                    compression=options.compression,
+                    compression_level=options.compression_level,
+                    row_group_size=options.row_group_size,
+                    write_statistics=options.statistics,
+                )
+            replaced_base(base_dir, device, through, options)
+        report.written.append(device)
+    report.written.sort()
+    return report
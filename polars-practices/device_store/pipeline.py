@@ -0,0 +1,115 @@
+"""
+Streaming modify-and-save for the device dataset.
+
+The notebook's ``save_modified_devices_lazy`` collected the whole selection
+before writing, so peak memory grew with the number of selected devices.
+``transform_devices`` runs one lazy query per device instead, scan ->
+transform -> ``sink_parquet``, on Polars' streaming engine: rows are read,
+transformed and written in morsels, so peak memory is bounded by a single
+device's pipeline however many devices are selected.
+
+Pending deltas are part of what a device's transform reads, and are dropped
+once the result replaces the base file. Sunk files carry no fingerprint
+(computing it needs the rows in memory), so the next ``write_partitions``
+over them rewrites them once.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional
+
+import polars as pl
+
+from device_store.loader import scan_snapshots
+from device_store.writer import (
+    COMPACTED_KEY,
+    PARTITION_COLUMN,
+    WriteOptions,
+    WriteReport,
+    atomic_path,
+    list_devices,
+    next_base_path,
+    partition_lock,
+    replaced_base,
+    snapshot,
+)
+
+Transform = Callable[[pl.LazyFrame], pl.LazyFrame]
+
+
+def double_values(lazy_df: pl.LazyFrame) -> pl.LazyFrame:
+    """The notebook's ``modify_data_lazy``."""
+    return lazy_df.with_columns(pl.col("value") * 2)
+
+
+def sink_partition(
+    lazy_df: pl.LazyFrame,
+    base_dir: str,
+    device: str,
+    through: int = 0,
+    options: WriteOptions = WriteOptions(),
+) -> None:
+    """
+    Stream one device's rows into a new base file and delete the files it
+    supersedes, including the deltas up to ``through``. The caller holds
+    the partition lock.
+    """
+    lazy_df = lazy_df.select(pl.exclude(PARTITION_COLUMN)).with_columns(
+        pl.col(pl.Categorical).cast(pl.String)
+    )
+    with atomic_path(next_base_path(base_dir, device)) as temp_path:
+        lazy_df.sink_parquet(
+            temp_path,
+            compression=options.compression,
+            compression_level=options.compression_level,
+            row_group_size=options.row_group_size,
+            statistics=options.statistics,
+            metadata={COMPACTED_KEY: str(through)},
+        )
+    replaced_base(base_dir, device, through, options)
+
+
+def transform_device(
+    base_dir: str,
+    device: str,
+    transform: Transform = double_values,
+    out_dir: Optional[str] = None,
+    options: WriteOptions = WriteOptions(),
+) -> bool:
+    """
+    Transform one device of ``base_dir`` into ``out_dir`` (default: in place).
+
+    :return: False when the device has no data.
+    """
+    out_dir = out_dir or base_dir
+    if snapshot(base_dir, device) is None:
+        return False
+    # Appends to the device wait until its new base file is in place.
+    with partition_lock(out_dir, device):
+        source = snapshot(base_dir, device)
+        target = source if out_dir == base_dir else snapshot(out_dir, device)
+        # The source files are read to the end before they are deleted.
+        lazy_df = transform(scan_snapshots([source]))
+        sink_partition(lazy_df, out_dir, device, target.through if target else 0, options)
+    return True
+
+
+def transform_devices(
+    base_dir: str,
+    transform: Transform = double_values,
+    devices: Optional[Iterable[str]] = None,
+    out_dir: Optional[str] = None,
+    options: WriteOptions = WriteOptions(),
+) -> WriteReport:
+    """
+    Replaces ``modify_data_lazy`` + ``save_modified_devices_lazy``.
+
+    :param transform: Applied to each device's LazyFrame (``device`` included).
+    :param devices: Devices to transform; missing ones are skipped. None means all.
+    :param out_dir: Store to write to; defaults to rewriting ``base_dir`` in place.
+    """
+    report = WriteReport()
+    for device in list_devices(base_dir) if devices is None else devices:
+        if transform_device(base_dir, device, transform, out_dir, options):
+            report.written.append(device)
+    return report
@@ -0,0 +1,172 @@
+"""
+Long device rows -> timestamps x metrics matrices.
+
+``DataFrame.pivot(on="metric", ...)`` turns 60,000 metrics into 60,000
+columns: one Series with its own name, validity buffer and chunk metadata
+per metric, all built through a hash of every metric name. Here metrics get
+integer ids instead (a ``pl.Enum`` cast, whose physical codes *are* the
+ids), timestamps get row ids from a sorted search, and the values are
+scattered straight into one NumPy array, or into a SciPy CSR matrix when
+most cells are empty.
+
+``iter_pivots`` reads and pivots one device at a time, and
+``pivot_to_memmap`` writes devices x timestamps x metrics into an ``.npy``
+file on disk device by device, so neither needs more memory than one
+device's rows plus one device's matrix.
+
+Sparse output needs SciPy (``pip install scipy``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import polars as pl
+
+from device_store.loader import load_devices, scan_devices
+from device_store.writer import list_devices
+
+
+@dataclass(frozen=True)
+class MetricIndex:
+    """Metric name <-> integer id (the position in ``names``)."""
+
+    names: Sequence[str]
+
+    @classmethod
+    def from_store(cls, base_dir: str, devices: Optional[Iterable[str]] = None) -> "MetricIndex":
+        """Every metric in the store (or in ``devices``), sorted by name."""
+        metrics = scan_devices(base_dir, devices, columns=["metric"]).unique().collect(engine="streaming")
+        return cls(metrics["metric"].sort().to_list())
+
+    @property
+    def dtype(self) -> pl.Enum:
+        return pl.Enum(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def ids(self, metrics: pl.Series) -> np.ndarray:
+        """Ids of ``metrics``; a metric not in the index raises."""
+        return metrics.cast(pl.String).cast(self.dtype).to_physical().to_numpy().astype(np.int64)
+
+
+@dataclass(frozen=True)
+class DevicePivot:
+    device: str
+    # Sorted; row i of ``matrix`` is timestamps[i].
+    timestamps: np.ndarray
+    index: MetricIndex
+    # Dense: NaN where a (timestamp, metric) has no value. Sparse: no entry.
+    matrix: Any
+
+
+def pivot_frame(
+    df: pl.DataFrame,
+    index: MetricIndex,
+    value: str = "value",
+    timestamps: Optional[np.ndarray] = None,
+    sparse: bool = False,
+    dtype: np.dtype = np.float64,
+    out: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, Any]:
+    """
+    Pivot one device's ``metric`` / ``timestamp`` / ``value`` rows.
+
+    :param timestamps: Row axis, sorted; defaults to the timestamps of ``df``.
+    :param out: Dense array to fill instead of allocating one.
+    :return: ``(timestamps, matrix)``.
+    """
+    if timestamps is None:
+        timestamps = np.unique(df["timestamp"].to_numpy())
+    df = df.filter(pl.col(value).is_not_null()) if sparse else df
+    rows = np.searchsorted(timestamps, df["timestamp"].to_numpy())
+    columns = index.ids(df["metric"])
+    values = df[value].to_numpy().astype(dtype, copy=False)
+    shape = (len(timestamps), len(index))
+    if sparse:
+        try:
+            from scipy import sparse as scipy_sparse
+        except ImportError as error:
+            raise ImportError("sparse=True needs SciPy: pip install scipy") from error
+        return timestamps, scipy_sparse.csr_matrix((values, (rows, columns)), shape=shape)
+    matrix = np.empty(shape, dtype=dtype) if out is None else out
+    matrix.fill(np.nan)
+    matrix[rows, columns] = values
+    return timestamps, matrix
+
+
+def iter_pivots(
+    base_dir: str,
+    devices: Optional[Iterable[str]] = None,
+    value: str = "value",
+    metrics: Optional[Iterable[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    index: Optional[MetricIndex] = None,
+    sparse: bool = False,
+    dtype: np.dtype = np.float64,
+) -> Iterator[DevicePivot]:
+    """
+    One ``DevicePivot`` per device, read and pivoted one at a time.
+
+    :param metrics: Only these metrics; they become the columns, in this order.
+    :param index: Column ids shared across devices; defaults to ``metrics``,
+        or every metric in the store.
+    """
+    devices = list_devices(base_dir) if devices is None else list(devices)
+    metrics = None if metrics is None else list(metrics)
+    if index is None:
+        index = MetricIndex(metrics) if metrics is not None else MetricIndex.from_store(base_dir, devices)
+    columns = ["metric", "timestamp", value]
+    for device in devices:
+        df = load_devices(base_dir, [device], metrics=metrics, start=start, end=end, columns=columns)
+        timestamps, matrix = pivot_frame(df, index, value, sparse=sparse, dtype=dtype)
+        yield DevicePivot(device, timestamps, index, matrix)
+
+
+@dataclass(frozen=True)
+class PivotCube:
+    """``matrix[d, t, m]``: device ``devices[d]`` at ``timestamps[t]``, metric id ``m``."""
+
+    devices: List[str]
+    timestamps: np.ndarray
+    index: MetricIndex
+    matrix: np.ndarray
+
+
+def pivot_to_memmap(
+    base_dir: str,
+    path: str,
+    devices: Optional[Iterable[str]] = None,
+    value: str = "value",
+    metrics: Optional[Iterable[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    dtype: np.dtype = np.float32,
+) -> PivotCube:
+    """
+    Pivot every device (or ``devices``) into one devices x timestamps x
+    metrics ``.npy`` file at ``path``, one device at a time. NaN marks
+    missing cells. Reopen it later with ``np.load(path, mmap_mode="r")``.
+    """
+    devices = list_devices(base_dir) if devices is None else list(devices)
+    metrics = None if metrics is None else list(metrics)
+    index = MetricIndex(metrics) if metrics is not None else MetricIndex.from_store(base_dir, devices)
+    timestamps = np.sort(
+        scan_devices(base_dir, devices, metrics, start, end, columns=["timestamp"])
+        .unique()
+        .collect(engine="streaming")["timestamp"]
+        .to_numpy()
+    )
+    shape = (len(devices), len(timestamps), len(index))
+    cube = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+    columns = ["metric", "timestamp", value]
+    for position, device in enumerate(devices):
+        df = load_devices(base_dir, [device], metrics=metrics, start=start, end=end, columns=columns)
+        pivot_frame(df, index, value, timestamps=timestamps, dtype=dtype, out=cube[position])
+    cube.flush()
+    return PivotCube(devices, timestamps, index, cube)
@@ -0,0 +1,425 @@
+"""
+Hive-partitioned writer for the device dataset.
+
+Layout: ``<base_dir>/device=<name>/data-<generation>.parquet``. The
+``device`` column lives in the directory name only, which is what
+``pl.scan_parquet(..., hive_partitioning=True)`` and pyarrow datasets expect.
+Files are never modified once written: rewriting a partition writes the next
+generation and deletes the previous one. Polars caches parquet footers by
+path, so a file replaced in place under a running scan can make it fail or
+even panic; with immutable files a reader can only see a file vanish.
+
+A frame is split into devices in one pass (``partition_by``) and the
+partitions are written in parallel by a thread pool; Polars releases the GIL
+while encoding parquet. Every file carries a content fingerprint in its
+key-value metadata, so writing the same data again skips the partition after
+reading only its footer.
+
+Categorical columns are stored as plain strings (parquet dictionary-encodes
+them anyway): Polars skips row groups by min/max statistics for String
+columns but not for Categorical ones, and the loader relies on that.
+
+A partition may also hold append-only delta files next to its base file,
+``delta-<seq>.parquet``, written by ``append_partitions``. The base file's
+footer records the highest ``seq`` it already includes; newer deltas are
+merged over it by the loader (a later row for the same metric and timestamp
+wins) until compaction folds them into the base. Every writer of a partition
+holds its lock (``flock`` on ``<partition>/.lock``); readers take no lock.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from device_store.catalog import Catalog
+
+PARTITION_COLUMN = "device"
+BASE_PREFIX = "data-"
+FINGERPRINT_KEY = "device_store.fingerprint"
+COMPACTED_KEY = "device_store.compacted_through"
+DELTA_PREFIX = "delta-"
+LOCK_FILE = ".lock"
+# 1,000 metrics x 20 timestamps: a metric filter reads a few row groups of a
+# file instead of most of it, for ~15% more time on full scans.
+DEFAULT_ROW_GROUP_SIZE = 20_000
+
+
+@dataclass(frozen=True)
+class WriteOptions:
+    compression: str = "zstd"
+    compression_level: Optional[int] = None
+    # Rows per row group; None keeps the Polars default.
+    row_group_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE
+    statistics: bool = True
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    # Skip partitions whose fingerprint matches the file already on disk.
+    skip_unchanged: bool = True
+    # Keep the store's catalog (device_store.catalog) up to date.
+    catalog: bool = True
+
+
+@dataclass
+class WriteReport:
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+
+def partition_dir(base_dir: str, device: str) -> str:
+    return os.path.join(base_dir, f"{PARTITION_COLUMN}={device}")
+
+
+def _numbered_files(directory: str, names: Iterable[str], prefix: str) -> List[str]:
+    """Paths of the ``<prefix><number>.parquet`` files among ``names``, in number order."""
+    return [
+        os.path.join(directory, name)
+        for name in sorted(names)
+        if name.startswith(prefix) and name.endswith(".parquet")
+    ]
+
+
+def file_seq(path: str) -> int:
+    """The number in a base (generation) or delta (seq) file name."""
+    return int(os.path.basename(path).split("-", 1)[1][:-len(".parquet")])
+
+
+def partition_path(base_dir: str, device: str) -> Optional[str]:
+    """The device's current base file, or None if it has none."""
+    directory = partition_dir(base_dir, device)
+    try:
+        bases = _numbered_files(directory, os.listdir(directory), BASE_PREFIX)
+    except FileNotFoundError:
+        return None
+    return bases[-1] if bases else None
+
+
+def next_base_path(base_dir: str, device: str) -> str:
+    """Path for the next generation of the base file. The caller holds the lock."""
+    current = partition_path(base_dir, device)
+    generation = file_seq(current) + 1 if current else 1
+    return os.path.join(partition_dir(base_dir, device), f"{BASE_PREFIX}{generation:012d}.parquet")
+
+
+def list_devices(base_dir: str) -> List[str]:
+    """Devices that have a partition directory under ``base_dir``."""
+    prefix = f"{PARTITION_COLUMN}="
+    if not os.path.isdir(base_dir):
+        return []
+    return sorted(
+        name[len(prefix):] for name in os.listdir(base_dir) if name.startswith(prefix)
+    )
+
+
+def fingerprint(frame: pl.DataFrame) -> str:
+    """
+    Hash of a partition's schema and rows (order-sensitive).
+
+    Categoricals are hashed as strings, since their physical codes depend on
+    the process, and so that a partition read back as String hashes the same.
+    Row hashes are only stable within one Polars version; a different version
+    just causes one extra rewrite.
+    """
+    hashed = frame.with_columns(pl.col(pl.Categorical).cast(pl.String))
+    digest = hashlib.sha256(str(hashed.schema).encode())
+    digest.update(hashed.hash_rows(seed=0).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def read_footer(path: str) -> Dict[str, str]:
+    """Key-value metadata of a parquet file; empty if it does not exist."""
+    try:
+        metadata = pq.read_metadata(path).metadata or {}
+    except (FileNotFoundError, OSError):
+        return {}
+    return {key.decode(): value.decode() for key, value in metadata.items()}
+
+
+def stored_fingerprint(path: str) -> Optional[str]:
+    """Fingerprint recorded in an existing file's footer, if any."""
+    return read_footer(path).get(FINGERPRINT_KEY)
+
+
+def delta_path(base_dir: str, device: str, seq: int) -> str:
+    return os.path.join(partition_dir(base_dir, device), f"{DELTA_PREFIX}{seq:012d}.parquet")
+
+
+@dataclass(frozen=True)
+class PartitionSnapshot:
+    """
+    The files that make up one device's data at one point in time. Files are
+    never modified, so reading them returns exactly this data, or fails once
+    a newer base file has made some of them obsolete and they are deleted.
+    """
+
+    device: str
+    # None when the partition has no base file yet, only deltas.
+    base: Optional[str]
+    # Deltas newer than the base, oldest first.
+    deltas: Tuple[str, ...]
+    # Highest delta seq this snapshot includes; 0 when it has no deltas.
+    through: int
+
+    @property
+    def files(self) -> List[str]:
+        return ([self.base] if self.base else []) + list(self.deltas)
+
+    def is_intact(self) -> bool:
+        """False once any of the files has been deleted."""
+        return all(os.path.exists(path) for path in self.files)
+
+
+def snapshot(base_dir: str, device: str) -> Optional[PartitionSnapshot]:
+    """
+    List a partition's base file and pending deltas; None if it has neither.
+
+    The base footer is only read when the directory holds delta files.
+    """
+    directory = partition_dir(base_dir, device)
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return None
+    bases = _numbered_files(directory, names, BASE_PREFIX)
+    base = bases[-1] if bases else None
+    delta_paths = _numbered_files(directory, names, DELTA_PREFIX)
+    through = int(read_footer(base).get(COMPACTED_KEY, 0)) if delta_paths and base else 0
+    deltas = tuple(path for path in delta_paths if file_seq(path) > through)
+    if base is None and not deltas:
+        return None
+    return PartitionSnapshot(
+        device=device,
+        base=base,
+        deltas=deltas,
+        through=file_seq(deltas[-1]) if deltas else through,
+    )
+
+
+def next_delta_seq(base_dir: str, device: str) -> int:
+    """
+    Seq for a new delta: above every existing delta and above the base's
+    marker, even when no deltas are left. The caller holds the lock.
+    """
+    current = snapshot(base_dir, device)
+    if current is None:
+        return 1
+    marker = int(read_footer(current.base).get(COMPACTED_KEY, 0)) if current.base else 0
+    return max(marker, current.through) + 1
+
+
+@contextmanager
+def partition_lock(base_dir: str, device: str) -> Iterator[None]:
+    """
+    Exclusive lock on one partition, across threads and processes. Not
+    reentrant: a holder must not take it again.
+    """
+    directory = partition_dir(base_dir, device)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, LOCK_FILE), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def drop_superseded(base_dir: str, device: str, through: int) -> List[str]:
+    """
+    Delete the older base files and the deltas the current base includes
+    (``seq <= through``).
+
+    :return: Names of the deleted files.
+    """
+    directory = partition_dir(base_dir, device)
+    names = os.listdir(directory)
+    obsolete = _numbered_files(directory, names, BASE_PREFIX)[:-1] + [
+        path for path in _numbered_files(directory, names, DELTA_PREFIX) if file_seq(path) <= through
+    ]
+    dropped = []
+    for path in obsolete:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            continue
+        dropped.append(os.path.basename(path))
+    return dropped
+
+
+def replaced_base(base_dir: str, device: str, through: int, options: WriteOptions = WriteOptions()) -> None:
+    """
+    Finish writing a new base file that includes every delta up to
+    ``through``: delete the files it supersedes and update the catalog. The
+    caller holds the lock.
+    """
+    dropped = drop_superseded(base_dir, device, through)
+    if options.catalog:
+        catalog = Catalog(base_dir)
+        catalog.record(device, partition_path(base_dir, device))
+        catalog.forget(device, dropped)
+
+
+def rebuild_catalog(base_dir: str) -> int:
+    """
+    Re-create the catalog from the files on disk, e.g. after writing with
+    ``catalog=False``.
+
+    :return: Number of files recorded.
+    """
+    catalog = Catalog(base_dir)
+    catalog.clear()
+    recorded = 0
+    for device in list_devices(base_dir):
+        current = snapshot(base_dir, device)
+        for path in current.files if current else []:
+            catalog.record(device, path)
+            recorded += 1
+    return recorded
+
+
+@contextmanager
+def atomic_path(path: str) -> Iterator[str]:
+    """
+    Yield a temp path next to ``path`` and rename it over ``path`` on success,
+    so readers never see a half-written file.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def storage_frame(frame: pl.DataFrame) -> pl.DataFrame:
+    """``frame`` as it is stored: no ``device`` column, categoricals as strings."""
+    return frame.select(pl.exclude(PARTITION_COLUMN)).with_columns(pl.col(pl.Categorical).cast(pl.String))
+
+
+def write_base(
+    frame: pl.DataFrame, base_dir: str, device: str, through: int, options: WriteOptions = WriteOptions()
+) -> None:
+    """
+    Replace a partition's base file with ``frame``, which includes every delta
+    up to ``through``, and delete those deltas. The caller holds the lock.
+    """
+    frame = storage_frame(frame)
+    with atomic_path(next_base_path(base_dir, device)) as temp_path:
+        frame.write_parquet(
+            temp_path,
+            compression=options.compression,
+            compression_level=options.compression_level,
+            row_group_size=options.row_group_size,
+            statistics=options.statistics,
+            metadata={FINGERPRINT_KEY: fingerprint(frame), COMPACTED_KEY: str(through)},
+        )
+    replaced_base(base_dir, device, through, options)
+
+
+def write_partition(
+    frame: pl.DataFrame, base_dir: str, device: str, options: WriteOptions = WriteOptions()
+) -> bool:
+    """
+    Write one device's rows as a new base file. ``frame`` replaces all of the device's
+    data, so pending deltas are dropped.
+
+    :return: False when the partition was unchanged and left alone.
+    """
+    with partition_lock(base_dir, device):
+        current = snapshot(base_dir, device)
+        through = current.through if current else 0
+        if (
+            options.skip_unchanged
+            and current is not None
+            and current.base is not None
+            and not current.deltas
+            and stored_fingerprint(current.base) == fingerprint(storage_frame(frame))
+        ):
+            return False
+        write_base(frame, base_dir, device, through, options)
+    return True
+
+
+def write_frames(
+    frames: Iterable[pl.DataFrame], base_dir: str, options: WriteOptions = WriteOptions()
+) -> WriteReport:
+    """
+    Write a stream of frames (e.g. one per generated device) as partitions.
+
+    Each frame is split by device in one pass; at most ``2 * workers``
+    partitions are queued at a time, so memory stays bounded for long streams.
+    A device should not appear in more than one frame, or the later one wins.
+    """
+    report = WriteReport()
+    pending: Set[Future] = set()
+
+    def write(device: str, part: pl.DataFrame):
+        return device, write_partition(part, base_dir, device, options)
+
+    def collect(done: Iterable[Future]) -> None:
+        for future in done:
+            device, written = future.result()
+            (report.written if written else report.unchanged).append(device)
+
+    with ThreadPoolExecutor(max_workers=options.workers, thread_name_prefix="parquet-writer") as pool:
+        for frame in frames:
+            parts = frame.partition_by(PARTITION_COLUMN, as_dict=True, include_key=False)
+            for (device,), part in parts.items():
+                if len(pending) >= 2 * options.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(pool.submit(write, str(device), part))
+        collect(wait(pending).done)
+
+    report.written.sort()
+    report.unchanged.sort()
+    return report
+
+
+def write_partitions(
+    df: pl.DataFrame, base_dir: str, options: WriteOptions = WriteOptions()
+) -> WriteReport:
+    """
+    Replaces the notebook's ``save_partitioned`` / ``save_modified_devices``:
+    devices present in ``df`` are (re)written, others are not touched.
+    """
+    return write_frames([df], base_dir, options)
+
+
+def append_partitions(
+    df: pl.DataFrame, base_dir: str, options: WriteOptions = WriteOptions()
+) -> List[str]:
+    """
+    Add ``df``'s rows as one new delta file per device, without touching the
+    existing files. Rows for a metric and timestamp that already exist
+    replace them in the merged view.
+
+    :return: Paths of the delta files written.
+    """
+    paths = []
+    for (device,), part in df.partition_by(PARTITION_COLUMN, as_dict=True, include_key=False).items():
+        device = str(device)
+        part = storage_frame(part)
+        with partition_lock(base_dir, device):
+            path = delta_path(base_dir, device, next_delta_seq(base_dir, device))
+            with atomic_path(path) as temp_path:
+                part.write_parquet(
+                    temp_path,
+                    compression=options.compression,
+                    compression_level=options.compression_level,
+                    statistics=options.statistics,
+                )
+            if options.catalog:
+                Catalog(base_dir).record(device, path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,43 @@
+"""Small in-memory device frames and the merged view the store should return."""
+
+from datetime import datetime, timedelta
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from device_store.loader import KEY_COLUMNS
+
+START = datetime(2024, 1, 1)
+COLUMNS = ["device", "metric", "timestamp", "value", "value2"]
+
+
+def device_frame(device, metrics, hours, offset=0.0):
+    """One row per metric and hour, ``value`` = hour + offset."""
+    rows = [
+        (device, metric, START + timedelta(hours=hour), hour + offset, float(index))
+        for hour in hours
+        for index, metric in enumerate(metrics)
+    ]
+    return pl.DataFrame(
+        rows,
+        schema={
+            "device": pl.String,
+            "metric": pl.String,
+            "timestamp": pl.Datetime("us"),
+            "value": pl.Float64,
+            "value2": pl.Float64,
+        },
+        orient="row",
+    )
+
+
+def merged(*frames):
+    """What the store holds after writing ``frames`` in order: the last row per key wins."""
+    return pl.concat(frames).unique(subset=KEY_COLUMNS, keep="last", maintain_order=True)
+
+
+def assert_same_rows(actual, expected):
+    def normalized(frame):
+        return frame.select(COLUMNS).with_columns(pl.col("device", "metric").cast(pl.String)).sort(KEY_COLUMNS)
+
+    assert_frame_equal(normalized(actual), normalized(expected))
@@ -0,0 +1,112 @@
+import os
+import sqlite3
+from datetime import timedelta
+
+import polars as pl
+import pytest
+
+from device_store.catalog import CATALOG_FILE, Catalog, MetricBloom
+from device_store.loader import catalog_skips, scan_devices, snapshots
+from device_store.writer import append_partitions, rebuild_catalog, snapshot, write_partition, write_partitions
+from tests.frames import START, assert_same_rows, device_frame
+
+# device_a holds metric_a*, device_b metric_m*, in different time ranges, and
+# device_b has a delta; device_empty's only file has no rows.
+A_METRICS = [f"metric_a{i}" for i in range(20)]
+B_METRICS = [f"metric_m{i}" for i in range(0, 40, 2)]
+
+QUERIES = {
+    "no filter": {},
+    "metric in one device": {"metrics": ["metric_a3"]},
+    "metrics in both devices": {"metrics": ["metric_a3", "metric_m4"]},
+    "below every metric range": {"metrics": ["aaa"]},
+    "above every metric range": {"metrics": ["zzz"]},
+    "inside the range, not stored": {"metrics": ["metric_m3", "metric_m5"]},
+    "before all rows": {"end": START},
+    "after all rows": {"start": START + timedelta(days=30)},
+    "device_b's hours only": {"start": START + timedelta(hours=48)},
+    "metric and time": {"metrics": ["metric_m4"], "start": START + timedelta(hours=60)},
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    base_dir = str(tmp_path / "store")
+    write_partitions(
+        pl.concat([device_frame("device_a", A_METRICS, range(24)), device_frame("device_b", B_METRICS, range(48, 72))]),
+        base_dir,
+    )
+    append_partitions(device_frame("device_b", B_METRICS[:3], [71, 72], offset=10), base_dir)
+    write_partition(device_frame("device_empty", A_METRICS, []), base_dir, "device_empty")
+    return base_dir
+
+
+def _scan(store, use_catalog, **query):
+    return scan_devices(store, use_catalog=use_catalog, **query).collect()
+
+
+def _skips(store, **query):
+    snaps = snapshots(store)
+    return {os.path.basename(os.path.dirname(path)) for path in catalog_skips(store, snaps, **query)}
+
+
+@pytest.mark.parametrize("query", QUERIES.values(), ids=QUERIES.keys())
+def test_pruned_scan_matches_full_scan(store, query):
+    assert_same_rows(_scan(store, True, **query), _scan(store, False, **query))
+
+
+def test_pruning_skips_files_outside_the_filter(store):
+    assert _skips(store, metrics=["metric_a3"]) == {"device=device_b", "device=device_empty"}
+    assert _skips(store, metrics=["zzz"]) == {"device=device_a", "device=device_b", "device=device_empty"}
+    # Inside device_b's [min_metric, max_metric] but not stored: the bloom filter rules it out.
+    assert "device=device_b" in _skips(store, metrics=["metric_m3"])
+    assert _skips(store, start=START + timedelta(hours=48)) == {"device=device_a", "device=device_empty"}
+    assert _skips(store) == set()
+
+
+def test_empty_file_is_skipped_and_returns_nothing(store):
+    [entry] = Catalog(store).entries(["device_empty"]).values()
+    assert entry.rows == 0 and not entry.may_match()
+    assert _scan(store, True, devices=["device_empty"], metrics=["metric_a1"]).is_empty()
+
+
+def test_missing_catalog_scans_everything(store):
+    os.remove(os.path.join(store, CATALOG_FILE))
+
+    assert _skips(store, metrics=["zzz"]) == set()
+    for query in QUERIES.values():
+        assert_same_rows(_scan(store, True, **query), _scan(store, False, **query))
+
+    assert rebuild_catalog(store) == 4
+    assert _skips(store, metrics=["zzz"]) == {"device=device_a", "device=device_b", "device=device_empty"}
+
+
+def test_entries_of_another_schema_version_are_ignored(store):
+    with sqlite3.connect(os.path.join(store, CATALOG_FILE)) as connection:
+        connection.execute("UPDATE files SET schema_version = schema_version + 1")
+
+    assert Catalog(store).entries() == {}
+    assert _skips(store, metrics=["zzz"]) == set()
+    assert_same_rows(_scan(store, True, metrics=["metric_a3"]), _scan(store, False, metrics=["metric_a3"]))
+
+
+def test_file_changed_behind_the_catalog_is_read(store):
+    # Replace device_a's base with other metrics without telling the catalog:
+    # its entry still says metric_a*, but the file identity no longer matches.
+    path = snapshot(store, "device_a").base
+    device_frame("device_a", ["metric_z1"], range(3)).drop("device").write_parquet(path)
+
+    assert "device=device_a" not in _skips(store, metrics=["metric_z1"])
+    assert_same_rows(
+        _scan(store, True, metrics=["metric_z1"]), device_frame("device_a", ["metric_z1"], range(3))
+    )
+
+
+def test_metric_bloom_has_no_false_negatives():
+    metrics = [f"metric_{i}" for i in range(5000)]
+    bloom = MetricBloom.from_bytes(MetricBloom.from_metrics(metrics).to_bytes())
+
+    assert all(bloom.might_contain_any([metric]) for metric in metrics)
+    false_positives = sum(bloom.might_contain_any([f"other_{i}"]) for i in range(5000))
+    assert false_positives < 5000 * 0.05
+    assert not bloom.might_contain_any([])
@@ -0,0 +1,45 @@
+import os
+
+import polars as pl
+
+from device_store import executor
+from device_store.executor import PoolOptions, parallel_transform_devices
+from device_store.generator import DatasetSpec, generate_polars
+from device_store.pipeline import double_values
+from device_store.writer import write_partitions
+
+CRASHING_DEVICE = "device_3"
+
+
+def crash_on_device_3(lazy_df):
+    # Module level so spawned workers can unpickle it.
+    device = lazy_df.select(pl.col("device").first()).collect().item()
+    if device == CRASHING_DEVICE:
+        os._exit(1)
+    return double_values(lazy_df)
+
+
+def test_crash_isolates_only_the_devices_in_flight(tmp_path, monkeypatch):
+    store = str(tmp_path / "store")
+    write_partitions(generate_polars(DatasetSpec(devices=12, metrics=10, timestamps=2)), store)
+    batches = []
+    run_pool = executor._run_pool
+
+    def recording_run_pool(devices, *args):
+        batches.append(list(devices))
+        return run_pool(devices, *args)
+
+    monkeypatch.setattr(executor, "_run_pool", recording_run_pool)
+    report = parallel_transform_devices(
+        store, crash_on_device_3, out_dir=str(tmp_path / "out"), pool=PoolOptions(workers=2, retries=1)
+    )
+
+    assert report.failed.keys() == {CRASHING_DEVICE}
+    assert len(report.written) == 11
+    alone = {batch[0] for batch in batches if len(batch) == 1}
+    # device_3 and at most the one device running next to it.
+    assert CRASHING_DEVICE in alone and len(alone) <= 2
+    # The devices that never started ran together in one shared pool.
+    shared = [batch for batch in batches[1:] if len(batch) > 1]
+    assert len(shared) == 1
+    assert not set(shared[0]) & alone
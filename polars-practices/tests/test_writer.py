@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+
+import polars as pl
+import pytest
+
+from device_store.compaction import BackgroundCompactor, compact
+from device_store.loader import load_devices
+from device_store.writer import (
+    COMPACTED_KEY,
+    append_partitions,
+    file_seq,
+    partition_dir,
+    read_footer,
+    snapshot,
+    write_partitions,
+)
+from tests.frames import assert_same_rows, device_frame, merged
+
+METRICS = [f"metric_{i}" for i in range(5)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return str(tmp_path / "store")
+
+
+def _append_hours(store, device, first_hour, appends):
+    for hour in range(first_hour, first_hour + appends):
+        append_partitions(device_frame(device, METRICS, [hour]), store)
+
+
+def test_write_and_load_round_trip(store):
+    df = pl.concat([device_frame("device_0", METRICS, range(24)), device_frame("device_1", METRICS[:2], range(3))])
+    report = write_partitions(df, store)
+
+    assert report.written == ["device_0", "device_1"]
+    assert_same_rows(load_devices(store), df)
+    assert_same_rows(load_devices(store, ["device_1"]), df.filter(pl.col("device") == "device_1"))
+
+
+def test_rewrite_with_same_rows_is_skipped(store):
+    df = device_frame("device_0", METRICS, range(3))
+    write_partitions(df, store)
+
+    assert write_partitions(df, store).unchanged == ["device_0"]
+    assert write_partitions(df.with_columns(pl.col("value") + 1), store).written == ["device_0"]
+
+
+def test_append_then_compact_matches_in_memory_merge(store):
+    base = device_frame("device_0", METRICS, range(10))
+    # Overwrites hours 8-9 and adds 10-11, then a second delta on top of it.
+    first = device_frame("device_0", METRICS, range(8, 12), offset=100)
+    second = device_frame("device_0", METRICS[:2], [11, 12], offset=200)
+    new_device = device_frame("device_1", METRICS, [0])
+    expected = merged(base, first, second, new_device)
+
+    write_partitions(base, store)
+    append_partitions(first, store)
+    append_partitions(pl.concat([second, new_device]), store)
+    assert len(snapshot(store, "device_0").deltas) == 2
+    assert_same_rows(load_devices(store), expected)
+
+    report = compact(store)
+    assert report.written == ["device_0", "device_1"]
+    current = snapshot(store, "device_0")
+    assert current.deltas == ()
+    assert read_footer(current.base)[COMPACTED_KEY] == "2"
+    assert sorted(os.listdir(partition_dir(store, "device_0"))) == [".lock", os.path.basename(current.base)]
+    assert_same_rows(load_devices(store), expected)
+
+
+def test_delta_seqs_keep_growing_after_compaction(store):
+    write_partitions(device_frame("device_0", METRICS, [0]), store)
+    append_partitions(device_frame("device_0", METRICS, [1]), store)
+    compact(store)
+
+    [path] = append_partitions(device_frame("device_0", METRICS, [2]), store)
+
+    # Seq 1 is already folded into the base; reusing it would hide the new rows.
+    assert file_seq(path) == 2
+    assert_same_rows(load_devices(store), device_frame("device_0", METRICS, range(3)))
+
+
+def test_compaction_creates_a_new_base_generation(store):
+    write_partitions(device_frame("device_0", METRICS, [0]), store)
+    first_base = snapshot(store, "device_0").base
+    append_partitions(device_frame("device_0", METRICS, [1]), store)
+    compact(store)
+
+    new_base = snapshot(store, "device_0").base
+    assert file_seq(new_base) > file_seq(first_base)
+    assert not os.path.exists(first_base)
+
+
+def test_compact_respects_min_deltas(store):
+    write_partitions(device_frame("device_0", METRICS, [0]), store)
+    append_partitions(device_frame("device_0", METRICS, [1]), store)
+
+    assert compact(store, min_deltas=2).unchanged == ["device_0"]
+    assert len(snapshot(store, "device_0").deltas) == 1
+
+
+def test_concurrent_appends_from_processes(store):
+    write_partitions(device_frame("device_0", METRICS, [0]), store)
+    # Spawned, not forked: forking a process that has used Polars can deadlock.
+    ctx = multiprocessing.get_context("spawn")
+    processes = [ctx.Process(target=_append_hours, args=(store, "device_0", 1 + 5 * i, 5)) for i in range(3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=120)
+    assert [process.exitcode for process in processes] == [0, 0, 0]
+
+    current = snapshot(store, "device_0")
+    assert [file_seq(path) for path in current.deltas] == list(range(1, 16))
+    assert_same_rows(load_devices(store), device_frame("device_0", METRICS, range(16)))
+
+
+def test_appends_while_compacting(store):
+    write_partitions(device_frame("device_0", METRICS, [0]), store)
+    ctx = multiprocessing.get_context("spawn")
+    appender = ctx.Process(target=_append_hours, args=(store, "device_0", 1, 20))
+    with BackgroundCompactor(store, interval=0.01, min_deltas=1):
+        appender.start()
+        appender.join(timeout=120)
+    assert appender.exitcode == 0
+
+    compact(store)
+    assert_same_rows(load_devices(store), device_frame("device_0", METRICS, range(21)))